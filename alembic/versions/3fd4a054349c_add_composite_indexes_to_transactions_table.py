@@ -0,0 +1,62 @@
+"""add composite indexes to transactions table
+
+Revision ID: 3fd4a054349c
+Revises: c20b275ca3bc
+Create Date: 2026-10-19 10:02:47.135904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3fd4a054349c"
+down_revision: Union[str, Sequence[str], None] = "c20b275ca3bc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Composite indexes matched to the transaction query shapes: (name, columns, covering columns)
+COMPOSITE_INDEXES = [
+    ("idx_transaction_user_category_type_date", ["user_id", "category_id", "type", "transaction_date"], ["amount"]),
+    ("idx_transaction_user_type_date", ["user_id", "type", "transaction_date"], ["amount", "category_id"]),
+    ("idx_transaction_user_date", ["user_id", "transaction_date"], []),
+    ("idx_transaction_user_created", ["user_id", "created_at"], []),
+]
+
+# Single-column indexes made redundant by the composites (or by the primary key)
+REDUNDANT_INDEXES = [
+    ("ix_transactions_id", ["id"]),
+    ("ix_transactions_user_id", ["user_id"]),
+    ("ix_transactions_type", ["type"]),
+    ("ix_transactions_transaction_date", ["transaction_date"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build indexes without blocking writes on PostgreSQL; CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns, include in COMPOSITE_INDEXES:
+            op.create_index(
+                name,
+                "transactions",
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+            )
+
+    for name, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name="transactions", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in REDUNDANT_INDEXES:
+        op.create_index(name, "transactions", columns, unique=False, if_not_exists=True)
+
+    for name, _, _ in reversed(COMPOSITE_INDEXES):
+        op.drop_index(name, table_name="transactions", if_exists=True)
@@ -0,0 +1,33 @@
+"""add transaction amount index
+
+Revision ID: 4e8a2c6b1f37
+Revises: 7c1d8e4f2a95
+Create Date: 2026-10-19 19:52:31.508264
+
+Backs transaction listings sorted or filtered by amount. transactions is partitioned on PostgreSQL,
+where indexes cannot be built CONCURRENTLY on the parent table, so the build blocks writes while it
+runs on every partition.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8a2c6b1f37"
+down_revision: Union[str, Sequence[str], None] = "7c1d8e4f2a95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_transaction_user_amount", "transactions", ["user_id", "amount"], unique=False, if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_transaction_user_amount", table_name="transactions", if_exists=True)
@@ -0,0 +1,31 @@
+"""add data version to users table
+
+Revision ID: 5d92ab47c1e0
+Revises: e83f5c1a06d2
+Create Date: 2026-10-19 17:10:26.118734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d92ab47c1e0"
+down_revision: Union[str, Sequence[str], None] = "e83f5c1a06d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("data_version", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("users", sa.Column("data_updated_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "data_updated_at")
+    op.drop_column("users", "data_version")
@@ -0,0 +1,60 @@
+"""create transactions archive table
+
+Revision ID: 6b1e93d07a5f
+Revises: df148db40063
+Create Date: 2026-10-19 14:05:47.902113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1e93d07a5f"
+down_revision: Union[str, Sequence[str], None] = "df148db40063"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The enum types already exist for the transactions table
+    transaction_type = postgresql.ENUM("INCOME", "EXPENSE", name="transactiontype", create_type=False)
+    payment_method = postgresql.ENUM(
+        "CASH", "CREDIT_CARD", "BANK_TRANSFER", "DIGITAL_WALLET", name="paymentmethod", create_type=False
+    )
+
+    op.create_table(
+        "transactions_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.Column("amount", sa.Integer(), nullable=True),
+        sa.Column("transaction_date", sa.Date(), nullable=False),
+        sa.Column("type", transaction_type, nullable=False),
+        sa.Column("payment_method", payment_method, nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_transactions_archive_category_id"), "transactions_archive", ["category_id"], unique=False
+    )
+    op.create_index(
+        "idx_transaction_archive_user_date", "transactions_archive", ["user_id", "transaction_date"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_transaction_archive_user_date", table_name="transactions_archive")
+    op.drop_index(op.f("ix_transactions_archive_category_id"), table_name="transactions_archive")
+    op.drop_table("transactions_archive")
@@ -0,0 +1,67 @@
+"""add transaction search
+
+Revision ID: 7c1d8e4f2a95
+Revises: 9b3e6f20d4a7
+Create Date: 2026-10-19 18:41:09.274518
+
+Full-text search over transaction descriptions. PostgreSQL gets a generated tsvector column with a
+GIN index and a pg_trgm index on description; adding the stored column rewrites the table (and every
+partition), so run it in a maintenance window on large databases. SQLite gets an external-content
+FTS5 table, kept in sync by triggers and filled from the existing rows.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1d8e4f2a95"
+down_revision: Union[str, Sequence[str], None] = "9b3e6f20d4a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "ALTER TABLE transactions ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(description, ''))) STORED"
+        )
+        op.execute("CREATE INDEX idx_transaction_search_vector ON transactions USING gin (search_vector)")
+        op.execute("CREATE INDEX idx_transaction_description_trgm ON transactions USING gin (description gin_trgm_ops)")
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+            "description, content='transactions', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+            "INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+            "INSERT INTO transactions_fts (transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER transactions_fts_update AFTER UPDATE OF description ON transactions BEGIN "
+            "INSERT INTO transactions_fts (transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+            "INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description); END"
+        )
+        op.execute("INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_transaction_description_trgm")
+        op.execute("DROP INDEX IF EXISTS idx_transaction_search_vector")
+        op.execute("ALTER TABLE transactions DROP COLUMN search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("transactions_fts_update", "transactions_fts_delete", "transactions_fts_insert"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
@@ -0,0 +1,56 @@
+"""create jobs table
+
+Revision ID: a4c7d2e91b38
+Revises: 6b1e93d07a5f
+Create Date: 2026-10-19 15:21:08.334571
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c7d2e91b38"
+down_revision: Union[str, Sequence[str], None] = "6b1e93d07a5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("QUEUED", "RUNNING", "SUCCEEDED", "FAILED", name="jobstatus"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_by", sa.String(), nullable=True),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_jobs_id"), "jobs", ["id"], unique=False)
+    op.create_index("idx_job_status_run_at", "jobs", ["status", "run_at"], unique=False)
+    op.create_index("idx_job_name_status", "jobs", ["name", "status"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_job_name_status", table_name="jobs")
+    op.drop_index("idx_job_status_run_at", table_name="jobs")
+    op.drop_index(op.f("ix_jobs_id"), table_name="jobs")
+    op.drop_table("jobs")
+    sa.Enum(name="jobstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,84 @@
+"""add recurring rules
+
+Revision ID: b5f1d93a7e20
+Revises: 4e8a2c6b1f37
+Create Date: 2026-10-19 20:37:12.884019
+
+Recurring transaction rules, and the link from the transactions they create. The unique index on
+(recurring_rule_id, transaction_date) makes materializing an occurrence idempotent; it contains the
+partition key, so PostgreSQL accepts it on the partitioned transactions table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5f1d93a7e20"
+down_revision: Union[str, Sequence[str], None] = "4e8a2c6b1f37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The enum types already exist for the transactions table
+    transaction_type = postgresql.ENUM("INCOME", "EXPENSE", name="transactiontype", create_type=False)
+    payment_method = postgresql.ENUM(
+        "CASH", "CREDIT_CARD", "BANK_TRANSFER", "DIGITAL_WALLET", name="paymentmethod", create_type=False
+    )
+
+    op.create_table(
+        "recurring_rules",
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("type", transaction_type, nullable=False),
+        sa.Column("payment_method", payment_method, nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("frequency", sa.Enum("DAILY", "WEEKLY", "MONTHLY", name="recurrencefrequency"), nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False),
+        sa.Column("day_of_month", sa.Integer(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("next_run_date", sa.Date(), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_recurring_rules_id"), "recurring_rules", ["id"], unique=False)
+    op.create_index(op.f("ix_recurring_rules_user_id"), "recurring_rules", ["user_id"], unique=False)
+    op.create_index("idx_recurring_rule_due", "recurring_rules", ["active", "next_run_date", "id"], unique=False)
+
+    op.add_column("transactions", sa.Column("recurring_rule_id", sa.Integer(), nullable=True))
+    op.create_index(
+        "uq_transaction_recurring_occurrence", "transactions", ["recurring_rule_id", "transaction_date"], unique=True
+    )
+    # SQLite cannot add constraints in place; RecurringRuleRepository.delete detaches transactions there
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_foreign_key(
+            "transactions_recurring_rule_id_fkey", "transactions", "recurring_rules",
+            ["recurring_rule_id"], ["id"], ondelete="SET NULL",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint("transactions_recurring_rule_id_fkey", "transactions", type_="foreignkey")
+    op.drop_index("uq_transaction_recurring_occurrence", table_name="transactions")
+    op.drop_column("transactions", "recurring_rule_id")
+
+    op.drop_index("idx_recurring_rule_due", table_name="recurring_rules")
+    op.drop_index(op.f("ix_recurring_rules_user_id"), table_name="recurring_rules")
+    op.drop_index(op.f("ix_recurring_rules_id"), table_name="recurring_rules")
+    op.drop_table("recurring_rules")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS recurrencefrequency")
@@ -0,0 +1,31 @@
+"""add budget rollover to users table
+
+Revision ID: c3a7e5f9d2b6
+Revises: b5f1d93a7e20
+Create Date: 2026-10-19 21:24:50.361947
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a7e5f9d2b6"
+down_revision: Union[str, Sequence[str], None] = "b5f1d93a7e20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("budget_rollover_enabled", sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column("users", sa.Column("budget_rollover_carry_over", sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "budget_rollover_carry_over")
+    op.drop_column("users", "budget_rollover_enabled")
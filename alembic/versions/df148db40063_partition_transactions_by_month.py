@@ -0,0 +1,120 @@
+"""partition transactions by month
+
+Revision ID: df148db40063
+Revises: 3fd4a054349c
+Create Date: 2026-10-19 11:26:05.552871
+
+Converts transactions into a table partitioned by RANGE (transaction_date) with one partition per
+month plus a default partition. PostgreSQL only; other databases keep the plain table. The primary
+key becomes (id, transaction_date) because a partitioned table's keys must contain the partition key.
+Future partitions are created by `python -m app.maintenance.partitions create`.
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "df148db40063"
+down_revision: Union[str, Sequence[str], None] = "3fd4a054349c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of today at migration time
+MONTHS_AHEAD = 3
+
+INDEXES = [
+    ("idx_transaction_user_category_type_date", "(user_id, category_id, type, transaction_date) INCLUDE (amount)"),
+    ("idx_transaction_user_type_date", "(user_id, type, transaction_date) INCLUDE (amount, category_id)"),
+    ("idx_transaction_user_date", "(user_id, transaction_date)"),
+    ("idx_transaction_user_created", "(user_id, created_at)"),
+    ("ix_transactions_category_id", "(category_id)"),
+]
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_indexes(table: str) -> None:
+    for name, definition in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} {definition}")
+
+
+def _drop_indexes() -> None:
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _add_foreign_keys(table: str) -> None:
+    op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY (user_id) REFERENCES users (id)")
+    op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY (category_id) REFERENCES categories (id)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Keep the id sequence alive when the old table is dropped
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE transactions_partitioned (
+            LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY (id, transaction_date)
+        ) PARTITION BY RANGE (transaction_date)
+        """
+    )
+
+    first_month = bind.execute(sa.text("SELECT MIN(transaction_date) FROM transactions")).scalar()
+    current_month = date.today().replace(day=1)
+    month = min(first_month.replace(day=1), current_month) if first_month else current_month
+    last_month = _add_months(current_month, MONTHS_AHEAD)
+    while month <= last_month:
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE transactions_y{month.year:04d}m{month.month:02d} PARTITION OF transactions_partitioned "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions_partitioned DEFAULT")
+
+    op.execute("INSERT INTO transactions_partitioned SELECT * FROM transactions")
+    op.execute("DROP TABLE transactions")
+    op.execute("ALTER TABLE transactions_partitioned RENAME TO transactions")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+
+    _add_foreign_keys("transactions")
+    _create_indexes("transactions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE transactions_unpartitioned (
+            LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO transactions_unpartitioned SELECT * FROM transactions")
+    # Dropping the partitioned parent drops every attached partition with it
+    op.execute("DROP TABLE transactions")
+    op.execute("ALTER TABLE transactions_unpartitioned RENAME TO transactions")
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+
+    _add_foreign_keys("transactions")
+    _drop_indexes()
+    _create_indexes("transactions")
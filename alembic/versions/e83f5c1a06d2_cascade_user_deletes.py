@@ -0,0 +1,48 @@
+"""cascade user deletes
+
+Revision ID: e83f5c1a06d2
+Revises: a4c7d2e91b38
+Create Date: 2026-10-19 16:02:44.517390
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e83f5c1a06d2"
+down_revision: Union[str, Sequence[str], None] = "a4c7d2e91b38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose user_id foreign key cascades deletes from users
+USER_OWNED_TABLES = ("transactions", "transactions_archive", "budgets", "categories")
+
+
+def _replace_user_foreign_keys(on_delete: str) -> None:
+    for table in USER_OWNED_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_user_id_fkey")
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey "
+            f"FOREIGN KEY (user_id) REFERENCES users (id) {on_delete}"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+
+    # SQLite cannot alter constraints in place; the application deletes child rows explicitly there
+    if op.get_bind().dialect.name == "postgresql":
+        _replace_user_foreign_keys("ON DELETE CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        _replace_user_foreign_keys("")
+
+    op.drop_column("users", "deleted_at")
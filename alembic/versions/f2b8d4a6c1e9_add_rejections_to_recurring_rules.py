@@ -0,0 +1,31 @@
+"""add rejections to recurring rules
+
+Revision ID: f2b8d4a6c1e9
+Revises: c3a7e5f9d2b6
+Create Date: 2026-10-19 23:05:12.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d4a6c1e9"
+down_revision: Union[str, Sequence[str], None] = "c3a7e5f9d2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("recurring_rules", sa.Column("rejected_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("recurring_rules", sa.Column("last_rejected_date", sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("recurring_rules", "last_rejected_date")
+    op.drop_column("recurring_rules", "rejected_count")
@@ -0,0 +1,38 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, status, Query
+from datetime import date
+
+from app.core.conditional import conditional_get
+from app.core.dependencies import AnalyticsServiceDep, CurrentUserDep
+from app.core.responses import SuccessResponse
+from app.constants.messages import AnalyticsMessages
+from app.models.transaction import TransactionType
+
+router = APIRouter()
+
+
+@router.get("/timeseries", status_code=status.HTTP_200_OK, dependencies=[Depends(conditional_get)])
+async def get_timeseries(
+    current_user: CurrentUserDep,
+    analytics_service: AnalyticsServiceDep,
+    start_date: Optional[date] = Query(None, description="First day in YYYY-MM-DD format (default: 12 months ago)"),
+    end_date: Optional[date] = Query(None, description="Last day in YYYY-MM-DD format (default: today)"),
+    interval: str = Query("month", pattern="^(day|week|month)$", description="Bucket size: day, week or month"),
+    group_by_category: bool = Query(False, description="One series per category and type instead of per type"),
+    type: Optional[TransactionType] = Query(None, description="Only income or only expense series"),
+    window: int = Query(3, ge=1, le=90, description="Number of buckets in the moving average")
+) -> SuccessResponse:
+    timeseries = analytics_service.get_timeseries(
+        user_id=current_user["user_id"],
+        start_date=start_date,
+        end_date=end_date,
+        interval=interval,
+        by_category=group_by_category,
+        transaction_type=type,
+        window=window
+    )
+
+    return SuccessResponse(
+        message=AnalyticsMessages.RETRIEVED_SUCCESS.value,
+        data=timeseries.model_dump()
+    )
@@ -1,8 +1,9 @@
+from typing import Optional
 from fastapi import APIRouter, status
 
-from app.core.dependencies import AuthServiceDep
+from app.core.dependencies import AuthServiceDep, CurrentUserDep
 from app.core.responses import SuccessResponse
-from app.schemas.auth import LoginRequest
+from app.schemas.auth import LoginRequest, LogoutRequest, RefreshRequest
 from app.schemas.user import UserCreate, UserResponse
 from app.constants.messages import AuthMessages
 
@@ -26,3 +27,22 @@ async def login(
 ) -> SuccessResponse:
     token = auth_service.authenticate_user(login_data)
     return SuccessResponse(message=AuthMessages.LOGIN_SUCCESS.value, data=token)
+
+
+@router.post("/refresh", status_code=status.HTTP_200_OK)
+async def refresh(
+    auth_service: AuthServiceDep,
+    refresh_data: RefreshRequest
+) -> SuccessResponse:
+    token = auth_service.refresh_tokens(refresh_data.refresh_token)
+    return SuccessResponse(message=AuthMessages.TOKEN_REFRESHED.value, data=token)
+
+
+@router.post("/logout", status_code=status.HTTP_200_OK)
+async def logout(
+    auth_service: AuthServiceDep,
+    current_user: CurrentUserDep,
+    logout_data: Optional[LogoutRequest] = None
+) -> SuccessResponse:
+    auth_service.logout(current_user, logout_data.refresh_token if logout_data else None)
+    return SuccessResponse(message=AuthMessages.LOGOUT_SUCCESS.value)
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Depends, status, Query
 
 from app.constants.messages import BudgetMessages
+from app.core.conditional import conditional_get
 from app.core.dependencies import BudgetServiceDep, CurrentUserDep
+from app.core.idempotency import IdempotentRoute, idempotent
 from app.core.responses import SuccessResponse, PaginatedResponse
-from app.schemas.budget import BudgetCreate, BudgetResponse, BudgetUpdate, TotalActiveBudgetResponse
+from app.schemas.budget import (
+    BudgetCreate, BudgetResponse, BudgetRollover, BudgetRolloverResponse, BudgetUpdate, TotalActiveBudgetResponse
+)
 
-router = APIRouter()
+router = APIRouter(route_class=IdempotentRoute)
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(conditional_get)])
 async def get_budgets(
         budget_service: BudgetServiceDep,
         current_user: CurrentUserDep,
@@ -51,7 +55,7 @@ async def get_total_active_budgets(
     )
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, dependencies=[Depends(idempotent)])
 async def create_budget(
         budget_data: BudgetCreate,
         budget_service: BudgetServiceDep,
@@ -65,6 +69,22 @@ async def create_budget(
     )
 
 
+@router.post("/rollover", status_code=status.HTTP_201_CREATED)
+async def rollover_budgets(
+        rollover: BudgetRollover,
+        budget_service: BudgetServiceDep,
+        current_user: CurrentUserDep
+) -> SuccessResponse:
+    budgets, skipped = budget_service.rollover_budgets(current_user["user_id"], rollover.as_of, rollover.carry_over)
+    return SuccessResponse(
+        message=BudgetMessages.ROLLED_OVER_SUCCESS.value,
+        data=BudgetRolloverResponse(
+            created=[BudgetResponse.model_validate(budget) for budget in budgets],
+            skipped=skipped
+        )
+    )
+
+
 @router.put("/{budget_id}", status_code=status.HTTP_200_OK)
 async def update_budget(
         budget_id: int,
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+from app.core.conditional import conditional_get
 from app.core.dependencies import CategoryServiceDep, CurrentUserDep
 from app.core.responses import SuccessResponse
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
@@ -16,7 +17,7 @@ def _convert_to_category_response(raw_category):
     )
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(conditional_get)])
 async def get_categories(
     category_service: CategoryServiceDep,
     current_user: CurrentUserDep
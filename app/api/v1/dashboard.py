@@ -1,7 +1,8 @@
 from typing import Optional
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Depends, status, Query
 from datetime import date
 
+from app.core.conditional import conditional_get
 from app.core.dependencies import CurrentUserDep, DashboardServiceDep
 from app.core.responses import SuccessResponse
 from app.constants.messages import DashboardMessages
@@ -9,7 +10,7 @@ from app.constants.messages import DashboardMessages
 router = APIRouter()
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, dependencies=[Depends(conditional_get)])
 async def get_dashboard(
     current_user: CurrentUserDep,
     dashboard_service: DashboardServiceDep,
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, status
+
+from app.constants.messages import RecurringRuleMessages
+from app.core.dependencies import CurrentUserDep, RecurringRuleServiceDep
+from app.core.idempotency import IdempotentRoute, idempotent
+from app.core.responses import SuccessResponse
+from app.schemas.recurring_rule import RecurringRuleCreate, RecurringRuleResponse
+
+router = APIRouter(route_class=IdempotentRoute)
+
+
+@router.get("/", status_code=status.HTTP_200_OK)
+async def get_recurring_rules(
+        recurring_rule_service: RecurringRuleServiceDep,
+        current_user: CurrentUserDep
+) -> SuccessResponse:
+    rules = recurring_rule_service.get_user_rules(current_user["user_id"])
+    return SuccessResponse(
+        message=RecurringRuleMessages.RETRIEVED_SUCCESS.value,
+        data=[RecurringRuleResponse.model_validate(rule) for rule in rules]
+    )
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, dependencies=[Depends(idempotent)])
+async def create_recurring_rule(
+        rule_data: RecurringRuleCreate,
+        recurring_rule_service: RecurringRuleServiceDep,
+        current_user: CurrentUserDep
+) -> SuccessResponse:
+    rule = recurring_rule_service.create_rule(current_user["user_id"], rule_data)
+    return SuccessResponse(
+        message=RecurringRuleMessages.CREATED_SUCCESS.value,
+        data=RecurringRuleResponse.model_validate(rule)
+    )
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurring_rule(
+        rule_id: int,
+        recurring_rule_service: RecurringRuleServiceDep,
+        current_user: CurrentUserDep
+):
+    recurring_rule_service.delete_rule(rule_id, current_user["user_id"])
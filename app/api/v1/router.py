@@ -1,11 +1,13 @@
 from fastapi import APIRouter
-from . import auth, budgets, categories, dashboard, transactions, user
+from . import analytics, auth, budgets, categories, dashboard, recurring, transactions, user
 
 api_router = APIRouter(prefix="/api/v1")
 
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(budgets.router, prefix="/budgets", tags=["budgets"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(recurring.router, prefix="/recurring-rules", tags=["recurring rules"])
 api_router.include_router(transactions.router, prefix="/transactions", tags=["transactions"])
 api_router.include_router(user.router, prefix="/users", tags=["users"])
@@ -1,41 +1,79 @@
-from fastapi import APIRouter, status, Query
+from datetime import date
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, status, Query
 from app.core.dependencies import TransactionServiceDep, CurrentUserDep
-from app.core.responses import SuccessResponse, PaginatedResponse
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse
+from app.core.idempotency import IdempotentRoute, idempotent
+from app.core.responses import SuccessResponse, PaginatedResponse, CursorPaginatedResponse
+from app.schemas.transaction import TransactionCreate, TransactionListParams, TransactionUpdate, TransactionResponse
 from app.constants.messages import TransactionMessages
+from app.models.transaction import TransactionType
 
-router = APIRouter()
+router = APIRouter(route_class=IdempotentRoute)
 
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def get_transactions(
     transaction_service: TransactionServiceDep,
     current_user: CurrentUserDep,
-    page: int = Query(1, ge=1),
-    per_page: int = Query(20, ge=1, le=100),
-    sort_by: str = Query("date", description="Field to sort by"),
-    sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order: asc or desc")
+    params: Annotated[TransactionListParams, Query()]
 ) -> PaginatedResponse:
-    skip = (page - 1) * per_page
+    skip = (params.page - 1) * params.per_page
 
     transactions, total = transaction_service.get_user_transactions_with_category(
         current_user["user_id"],
         skip,
-        per_page,
-        sort_by,
-        sort_order
+        params.per_page,
+        params.sort_by,
+        params.sort_order,
+        params
     )
     transaction_responses = [TransactionResponse.model_validate(transaction) for transaction in transactions]
     return PaginatedResponse(
         message=TransactionMessages.RETRIEVED_SUCCESS.value,
         data=transaction_responses,
         total=total,
-        page=page,
-        per_page=per_page
+        page=params.page,
+        per_page=params.per_page
+    )
+
+
+@router.get("/search", status_code=status.HTTP_200_OK)
+async def search_transactions(
+    transaction_service: TransactionServiceDep,
+    current_user: CurrentUserDep,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in descriptions (prefixes match)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    start_date: Optional[date] = Query(None, description="Earliest transaction date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Latest transaction date (YYYY-MM-DD)"),
+    category_id: Optional[int] = Query(None),
+    type: Optional[TransactionType] = Query(None),
+    min_amount: Optional[int] = Query(None, ge=0),
+    max_amount: Optional[int] = Query(None, ge=0)
+) -> CursorPaginatedResponse:
+    transactions, next_cursor = transaction_service.search_transactions(
+        current_user["user_id"],
+        q,
+        limit,
+        cursor,
+        start_date=start_date,
+        end_date=end_date,
+        category_id=category_id,
+        transaction_type=type,
+        min_amount=min_amount,
+        max_amount=max_amount
+    )
+    transaction_responses = [TransactionResponse.model_validate(transaction) for transaction in transactions]
+    return CursorPaginatedResponse(
+        message=TransactionMessages.RETRIEVED_SUCCESS.value,
+        data=transaction_responses,
+        limit=limit,
+        next_cursor=next_cursor
     )
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, dependencies=[Depends(idempotent)])
 async def create_transaction(
     transaction_service: TransactionServiceDep,
     current_user: CurrentUserDep,
@@ -1,15 +1,232 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from .settings import settings
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from .settings import Settings, settings
+from .sharding import ShardMap, parse_shard_urls
+
+# Requests with these methods only read, so their queries may be served by a replica
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReplicaSet:
+    """Round-robin over replica engines, skipping replicas that failed their last health check.
+
+    Each replica is checked with `SELECT 1` at most once per `check_interval` seconds, when it is next
+    picked; an unhealthy replica is retried after the same interval.
+    """
+
+    def __init__(self, engines: List[Engine], check_interval: float):
+        self.engines = list(engines)
+        self.check_interval = check_interval
+        self._position = 0
+        self._checked_at: Dict[int, float] = {}
+        self._healthy: Dict[int, bool] = {}
+        self._lock = threading.Lock()
+
+    def choose(self) -> Optional[Engine]:
+        """Next healthy replica, or None when there are none"""
+        for _ in range(len(self.engines)):
+            with self._lock:
+                index = self._position
+                self._position = (index + 1) % len(self.engines)
+            if self._is_healthy(index):
+                return self.engines[index]
+        return None
+
+    def _is_healthy(self, index: int) -> bool:
+        now = time.monotonic()
+        checked_at = self._checked_at.get(index)
+        if checked_at is not None and now - checked_at < self.check_interval:
+            return self._healthy[index]
+
+        try:
+            with self.engines[index].connect() as connection:
+                connection.execute(text("SELECT 1"))
+            healthy = True
+        except Exception:
+            healthy = False
+        self._checked_at[index] = now
+        self._healthy[index] = healthy
+        return healthy
+
+
+class RecentWrites:
+    """Users who wrote in the last `window` seconds; their reads stay on the primary (read-your-writes)"""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._written_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: int) -> None:
+        if self.window <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._written_at[user_id] = now
+            # Forget users whose window has passed so the map stays small
+            if len(self._written_at) > 1024:
+                self._written_at = {
+                    key: written_at for key, written_at in self._written_at.items() if now - written_at < self.window
+                }
+
+    def is_recent(self, user_id: Optional[int]) -> bool:
+        written_at = self._written_at.get(user_id)
+        return written_at is not None and time.monotonic() - written_at < self.window
+
+
+class DatabaseRouter:
+    """Chooses engines for a session.
+
+    User-scoped models go to the user's shard when shards are configured. Everything else goes to the
+    primary, or for read-only sessions to a healthy replica unless the user wrote recently.
+    """
+
+    def __init__(self, primary: Engine, replicas: ReplicaSet, recent_writes: RecentWrites, shards: Optional[Dict[str, Engine]] = None):
+        self.primary = primary
+        self.replicas = replicas
+        self.recent_writes = recent_writes
+        self.shards = shards or {}
+        self.shard_map = ShardMap(self.shards) if self.shards else None
+
+    def shard_engine(self, shard: Optional[str] = None, user_id: Optional[int] = None) -> Optional[Engine]:
+        """Engine of a named shard or of the user's shard; None when unsharded or nothing identifies one"""
+        if not self.shards:
+            return None
+        if shard is None:
+            if user_id is None:
+                return None
+            shard = self.shard_map.shard_for(user_id)
+        return self.shards[shard]
+
+    def engine_for_reads(self, user_id: Optional[int]) -> Engine:
+        if not self.replicas.engines or self.recent_writes.is_recent(user_id):
+            return self.primary
+        return self.replicas.choose() or self.primary
+
+
+class RoutingSession(Session):
+    """Session that sends user-scoped queries to the user's shard and read-only requests to a replica.
+
+    `info["read_only"]` is set by get_db for safe HTTP methods and `info["user_id"]` by get_current_user
+    (see `bind_user`); maintenance code may set `info["shard"]` to work on one shard. Statements without
+    a mapper (raw SQL) follow the shard too, as only user-scoped queries are written that way.
+    Flushes of global models always go to the primary, and a session keeps the replica it first chose.
+    """
+
+    def __init__(self, *args, router: Optional[DatabaseRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self._read_engine: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.router is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+        model = getattr(mapper, "class_", mapper)
+        if model is None or getattr(model, "__shard_by_user__", False):
+            shard = self.router.shard_engine(self.info.get("shard"), self.info.get("user_id"))
+            if shard is not None:
+                return shard
+
+        if not self.info.get("read_only") or self._flushing:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self._read_engine is None:
+            self._read_engine = self.router.engine_for_reads(self.info.get("user_id"))
+        return self._read_engine
+
+
+def _split_urls(urls: str) -> List[str]:
+    return [url.strip() for url in urls.split(",") if url.strip()]
+
+
+class Database:
+    """Engines and session factory for one configuration.
+
+    Created on first use (or by the app's lifespan handler) instead of at import, so importing the
+    application opens no pools: a preloading server can import it once and fork, and every worker then
+    builds its own engines.
+    """
+
+    def __init__(self, app_settings: Settings):
+        self.engine = create_engine(app_settings.database_url)
+        self.router = DatabaseRouter(
+            self.engine,
+            ReplicaSet(
+                [create_engine(url, pool_pre_ping=True) for url in _split_urls(app_settings.database_replica_urls)],
+                app_settings.replica_health_check_interval_seconds,
+            ),
+            RecentWrites(app_settings.read_your_writes_seconds),
+            {name: create_engine(url) for name, url in parse_shard_urls(app_settings.database_shard_urls).items()},
+        )
+        self.SessionLocal = sessionmaker(
+            class_=RoutingSession, autocommit=False, autoflush=False, bind=self.engine, router=self.router
+        )
+
+    def engines(self) -> List[Engine]:
+        return [self.engine, *self.router.replicas.engines, *self.router.shards.values()]
+
+    def dispose(self, close: bool = True) -> None:
+        for database_engine in self.engines():
+            database_engine.dispose(close=close)
+
+
+_database: Optional[Database] = None
+_database_lock = threading.Lock()
+
+
+def init_database(app_settings: Optional[Settings] = None) -> Database:
+    """Create the process's engines from `app_settings` (default: the environment) unless they exist"""
+    global _database
+    with _database_lock:
+        if _database is None:
+            _database = Database(app_settings or settings)
+        return _database
+
+
+def get_database() -> Database:
+    return _database or init_database()
+
+
+def close_database(close: bool = True) -> None:
+    """Dispose of the engines; the next use creates new ones.
+
+    A forked child passes `close=False`: it must drop the pooled connections it inherited without closing
+    them, since the parent process still uses those sockets.
+    """
+    global _database
+    with _database_lock:
+        if _database is not None:
+            _database.dispose(close=close)
+            _database = None
+
+
+def __getattr__(name: str):
+    # `engine`, `router` and `SessionLocal` stay importable from here, created on first access
+    if name in ("engine", "router", "SessionLocal"):
+        return getattr(get_database(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+def bind_user(db: Session, user_id: int) -> None:
+    """Attach the authenticated user to the session; a write request starts their read-your-writes window"""
+    db.info["user_id"] = user_id
+    router = getattr(db, "router", None)
+    if router is not None and not db.info.get("read_only"):
+        router.recent_writes.mark(user_id)
+
+
+def get_db(request: Request):
+    db = get_database().SessionLocal()
+    db.info["read_only"] = request.method in SAFE_METHODS
     try:
         yield db
     finally:
@@ -4,11 +4,81 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     # Database
     database_url: str
+    # Comma-separated replica URLs serving read-only (GET) requests; empty sends everything to the primary
+    database_replica_urls: str = ""
+    replica_health_check_interval_seconds: float = 10
+    # After a write request, the user's reads stay on the primary for this long
+    read_your_writes_seconds: float = 5
+    # Optional user shards as "name=url,name=url"; user-scoped tables then live on the user's shard
+    database_shard_urls: str = ""
 
     # Security
     secret_key: str
     algorithm: str
-    access_token_expire_minutes: int = (60 * 24) * 7
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_minutes: int = (60 * 24) * 7
+    revocation_sync_interval_seconds: int = 30
+    jwt_backend: str = "jose"  # "jose" or "pyjwt"
+    token_cache_size: int = 1024
+
+    # Partitioning (PostgreSQL): months of transaction partitions kept ahead of today
+    partition_months_ahead: int = 3
+
+    # Archival: transactions older than this many months move to transactions_archive
+    archive_horizon_months: int = 24
+    archive_batch_size: int = 5000
+
+    # Background jobs (python -m app.jobs.worker)
+    job_poll_interval_seconds: float = 5
+    job_max_attempts: int = 5
+    # Retry n waits job_retry_backoff_seconds * 2 ** (n - 1)
+    job_retry_backoff_seconds: int = 30
+    # Running jobs locked longer than this are assumed orphaned by a dead worker and run again (or failed,
+    # once out of attempts), so it must exceed the longest run of any job
+    job_lock_timeout_seconds: int = 15 * 60
+    job_retention_days: int = 7
+
+    # Account deletion: accounts with more transactions than this are deleted by a background job
+    user_delete_inline_limit: int = 10000
+    user_delete_batch_size: int = 5000
+
+    # Nightly budget rollover: budgets that ended within this many days are rolled over (catches up missed runs)
+    budget_rollover_lookback_days: int = 7
+
+    # Recurring transactions: rules materialized per batch (one commit each)
+    recurring_batch_size: int = 500
+
+    # Idempotency-Key header: outcomes of keyed POSTs are replayed for this long
+    idempotency_key_ttl_hours: int = 24
+
+    # Rate limiting: "memory" (per worker) or "sqlite:///path" (shared by the workers of a host)
+    rate_limit_backend: str = "memory"
+    # Token bucket rates as "count/second|minute|hour|day"; empty disables a policy
+    rate_limit_login: str = "10/minute"  # per IP
+    rate_limit_register: str = "5/minute"  # per IP
+    rate_limit_dashboard: str = "60/minute"  # per user
+    rate_limit_default: str = "600/minute"  # per user, every other API route
+
+    # Response compression, in preference order; br and zstd need `pip install brotli zstandard`
+    compression_encodings: str = "zstd,br,gzip"  # empty disables compression
+    compression_minimum_size: int = 1024
+    compression_content_types: str = "application/json,text/"  # content type prefixes
+    compression_gzip_level: int = 6
+    compression_brotli_level: int = 4
+    compression_zstd_level: int = 3
+
+    # Server (python -m app.server): gunicorn with uvicorn workers
+    server_bind: str = "0.0.0.0:8000"
+    server_workers: int = 0  # 0: one per available CPU core
+    server_preload: bool = True  # import the app once in the master, shared copy-on-write by the workers
+    server_loop: str = "auto"  # auto, asyncio or uvloop
+    server_http: str = "auto"  # auto, h11 or httptools
+    server_timeout: int = 60  # silent workers are killed and replaced after this many seconds
+    server_graceful_timeout: int = 30  # on shutdown, in-flight requests get this long to finish
+    server_keepalive: int = 5
+    # Workers restart after this many requests (plus up to the jitter); 0 never restarts them
+    server_max_requests: int = 10000
+    server_max_requests_jitter: int = 1000
 
     # Application
     app_name: str = "Expense Tracker API"
@@ -0,0 +1,75 @@
+import bisect
+import hashlib
+from typing import Dict, Iterable, List
+
+from sqlalchemy import ForeignKeyConstraint, MetaData
+from sqlalchemy.engine import Engine
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+
+class ShardMap:
+    """Consistent-hash ring placing user ids on named shards.
+
+    Each shard owns `vnodes` points on the ring, so adding or removing a shard only moves the users
+    between it and its neighbours (about 1/N of them) instead of reshuffling everyone.
+    """
+
+    def __init__(self, names: Iterable[str], vnodes: int = 64):
+        self.names = sorted(set(names))
+        if not self.names:
+            raise ValueError("ShardMap needs at least one shard")
+        ring = sorted((_hash(f"{name}#{point}"), name) for name in self.names for point in range(vnodes))
+        self._points = [point for point, _ in ring]
+        self._owners = [name for _, name in ring]
+
+    def shard_for(self, user_id: int) -> str:
+        index = bisect.bisect(self._points, _hash(str(user_id))) % len(self._points)
+        return self._owners[index]
+
+
+def parse_shard_urls(value: str) -> Dict[str, str]:
+    """Parse "name=url,name=url" into {name: url}"""
+    shards = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, separator, url = item.partition("=")
+        if not separator or not name.strip() or not url.strip():
+            raise ValueError(f"Invalid shard definition {item!r}, expected name=url")
+        shards[name.strip()] = url.strip()
+    return shards
+
+
+def sharded_models() -> List[type]:
+    """Models whose rows live on their user's shard (marked with `__shard_by_user__ = True`)"""
+    from app.models import Base
+
+    return [mapper.class_ for mapper in Base.registry.mappers if getattr(mapper.class_, "__shard_by_user__", False)]
+
+
+def shard_metadata() -> MetaData:
+    """Schema of a shard database: the sharded tables, without foreign keys to the global users table"""
+    from app.models.transaction import Transaction, add_search_ddl
+
+    metadata = MetaData()
+    for model in sharded_models():
+        table = model.__table__.to_metadata(metadata)
+        if model is Transaction:
+            # DDL event listeners are not copied along with the table
+            add_search_ddl(table)
+        for constraint in list(table.constraints):
+            if isinstance(constraint, ForeignKeyConstraint) and any(
+                element.target_fullname.startswith("users.") for element in constraint.elements
+            ):
+                table.constraints.discard(constraint)
+                for element in constraint.elements:
+                    element.parent.foreign_keys.discard(element)
+                    table.foreign_keys.discard(element)
+    return metadata
+
+
+def create_shard_schema(engine: Engine) -> None:
+    shard_metadata().create_all(bind=engine)
@@ -9,6 +9,15 @@ class TransactionMessages(Enum):
     NOT_FOUND = "Transaction not found"
     INVALID_BUDGET_NOT_FOUND = "You must create a budget for this category that covers the transaction date before creating an expense transaction"
     EXCEEDED_LIMIT = "This transaction exceeds your remaining budget for this category in the current budget period. Please adjust your budget or reduce the amount."
+    INVALID_SEARCH_QUERY = "Search query must contain at least one letter or digit"
+    INVALID_CURSOR = "Invalid cursor. Use the next_cursor value of the previous page"
+    INVALID_SORT_FIELD = "sort_by must be one of: date, transaction_date, created_at, amount, id"
+
+
+class RecurringRuleMessages(Enum):
+    CREATED_SUCCESS = "Recurring rule created successfully"
+    RETRIEVED_SUCCESS = "Recurring rules retrieved successfully"
+    NOT_FOUND = "Recurring rule not found"
 
 
 class BudgetMessages(Enum):
@@ -17,6 +26,7 @@ class BudgetMessages(Enum):
     DELETED_SUCCESS = "Budget deleted successfully"
     RETRIEVED_SUCCESS = "Budgets fetched successfully"
     NOT_FOUND = "Budget not found"
+    ROLLED_OVER_SUCCESS = "Budgets rolled over to their next period successfully"
     ALREADY_EXISTS = "Budget period overlaps with an existing budget for this category. Please choose a different date range."
     REQUIRED_FOR_EXPENSE = "You must create a budget for this category that covers the transaction date before creating an expense transaction"
     EXCEEDED_LIMIT = "This transaction exceeds your remaining budget for this category in the current budget period. Please adjust your budget or reduce the amount."
@@ -40,6 +50,9 @@ class AuthMessages(Enum):
     ALREADY_EXISTS = "User already exists"
     TOKEN_EXPIRED = "Token has expired"
     UNAUTHORIZED = "Unauthorized access"
+    TOKEN_REFRESHED = "Token refreshed successfully"
+    INVALID_REFRESH_TOKEN = "Invalid or expired refresh token"
+    LOGOUT_SUCCESS = "Logout successful"
 
 
 class UserMessages(Enum):
@@ -57,6 +70,7 @@ class CategoryMessages(Enum):
     NOT_FOUND = "Category not found"
     ALREADY_EXISTS = "Category already exists"
     CANNOT_DELETE_HAS_TRANSACTIONS = "Cannot delete category: it has existing transactions. Please delete or reassign transactions first"
+    CANNOT_DELETE_HAS_RECURRING_RULES = "Cannot delete category: recurring rules use it. Please delete those rules first"
 
 
 class ErrorMessages(Enum):
@@ -64,8 +78,21 @@ class ErrorMessages(Enum):
     NOT_FOUND = "Resource not found"
     FORBIDDEN = "Access forbidden"
     BAD_REQUEST = "Bad request"
+    TOO_MANY_REQUESTS = "Too many requests. Please retry later"
 
 
 class DashboardMessages(Enum):
     RETRIEVED_SUCCESS = "Dashboard data retrieved successfully"
     INVALID_MONTH_FORMAT = "Invalid month format. Use YYYY-MM"
+
+
+class IdempotencyMessages(Enum):
+    INVALID_KEY = "Idempotency-Key must be between 1 and 255 characters"
+    IN_PROGRESS = "A request with this Idempotency-Key is still being processed. Retry shortly"
+    KEY_REUSED = "This Idempotency-Key was already used for a different request"
+
+
+class AnalyticsMessages(Enum):
+    RETRIEVED_SUCCESS = "Analytics retrieved successfully"
+    INVALID_DATE_RANGE = "Invalid date range. End date must not be before start date"
+    TOO_MANY_BUCKETS = "Date range is too long for this interval. Use a wider interval or a shorter range"
@@ -0,0 +1,213 @@
+import gzip
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        # wbits 16 + MAX_WBITS writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> Dict[str, Tuple[Callable[[bytes, int], bytes], Callable[[int], object]]]:
+    """Content codings this process can produce: name -> (one-shot compress, streaming compressor)"""
+    encodings = {"gzip": (lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), _GzipStream)}
+    if brotli is not None:
+        encodings["br"] = (lambda data, level: brotli.compress(data, quality=level), _BrotliStream)
+    if zstandard is not None:
+        encodings["zstd"] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), _ZstdStream)
+    return encodings
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    accepted = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def etag_for_encoding(etag: str, encoding: str) -> str:
+    """Strong ETags must differ per content coding: "abc" becomes "abc-gzip" (weak ETags are kept)"""
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    """Inverse of etag_for_encoding, for comparing If-None-Match against the uncompressed ETag"""
+    for encoding in ("gzip", "br", "zstd"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+class CompressionMiddleware:
+    """Compress responses with the best content coding the client accepts.
+
+    Only responses whose content type matches `content_types` (prefixes) and whose body reaches
+    `minimum_size` bytes are compressed. Streaming bodies are buffered up to `minimum_size` and then
+    compressed chunk by chunk, flushing after every chunk so clients keep receiving data as it is produced.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            encodings: List[str],
+            levels: Dict[str, int],
+            minimum_size: int = 1024,
+            content_types: Optional[List[str]] = None,
+    ):
+        self.app = app
+        supported = available_encodings()
+        # Server preference order, limited to codings this process can produce
+        self.encodings = [name for name in encodings if name in supported]
+        self.compressors = {name: supported[name] for name in self.encodings}
+        self.levels = levels
+        self.minimum_size = minimum_size
+        self.content_types = content_types or ["application/json", "text/"]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponder(self, encoding, send).run(self.app, scope, receive)
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = _parse_accept_encoding(accept_encoding)
+        best, best_quality = None, 0.0
+        for name in self.encodings:
+            quality = accepted.get(name, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def is_compressible(self, headers: Headers) -> bool:
+        content_type = headers.get("content-type", "")
+        return "content-encoding" not in headers and any(content_type.startswith(prefix) for prefix in self.content_types)
+
+
+class _CompressedResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.buffer = b""
+        self.stream = None
+        self.passthrough = False
+
+    async def run(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if not self.middleware.is_compressible(headers) or message["status"] < 200 or message["status"] in (204, 304):
+                self.passthrough = True
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            chunk = self.stream.compress(body) if body else b""
+            if not more_body:
+                chunk += self.stream.finish()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        self.buffer += body
+        if len(self.buffer) < self.middleware.minimum_size:
+            if more_body:
+                return
+            # Too small to be worth compressing: send it as the application produced it
+            MutableHeaders(raw=self.start_message["headers"]).add_vary_header("Accept-Encoding")
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": self.buffer, "more_body": False})
+            return
+
+        compress, stream_factory = self.middleware.compressors[self.encoding]
+        level = self.middleware.levels.get(self.encoding)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["etag"] = etag_for_encoding(headers["etag"], self.encoding)
+
+        if not more_body:
+            compressed = compress(self.buffer, level)
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": False})
+            return
+
+        # Streaming response: the final length is unknown, so drop Content-Length and compress as it flows
+        del headers["Content-Length"]
+        self.stream = stream_factory(level)
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": self.stream.compress(self.buffer), "more_body": True})
+        self.buffer = b""
@@ -0,0 +1,86 @@
+import hashlib
+from datetime import date, datetime, time, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.core.compression import strip_encoding_suffix
+from app.core.exceptions import NotModifiedError
+from app.core.security import get_current_user
+from app.repositories.user_repository import UserRepository
+
+
+def _etag(request: Request, user_id: int, version: int) -> str:
+    """Strong validator for one user's view of an endpoint.
+
+    Read endpoints also depend on today's date (current month, budget predictions), so the date is
+    part of the tag along with the path and the normalised query string.
+    """
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    key = f"{user_id}:{version}:{date.today().isoformat()}:{request.url.path}?{query}"
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+
+def _last_modified(updated_at: Optional[datetime]) -> datetime:
+    """Last data change, but never before today's (local) midnight when date-dependent values change"""
+    midnight = datetime.combine(date.today(), time.min).astimezone(timezone.utc)
+    if updated_at is None:
+        return midnight
+    return max(updated_at.replace(tzinfo=timezone.utc, microsecond=0), midnight)
+
+
+def _matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """The If-None-Match entry that matches `etag`, if any"""
+    if if_none_match.strip() == "*":
+        return etag
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored; so are the content-coding
+    # suffixes CompressionMiddleware adds to ETags of compressed responses
+    for candidate in (candidate.strip() for candidate in if_none_match.split(",")):
+        if strip_encoding_suffix(candidate.removeprefix("W/")) == etag:
+            return candidate
+    return None
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified <= since
+
+
+def conditional_get(
+        request: Request,
+        response: Response,
+        current_user: dict = Depends(get_current_user),
+        db: Session = Depends(get_db),
+) -> None:
+    """Answer a repeated GET with 304 Not Modified before the endpoint runs its queries.
+
+    Add it with `dependencies=[Depends(conditional_get)]` to read endpoints whose payload only depends
+    on the user's own data; services bump the user's data version on every write.
+    """
+    version, updated_at = UserRepository(db).get_data_version(current_user["user_id"])
+    headers = {
+        "ETag": _etag(request, current_user["user_id"], version),
+        "Last-Modified": format_datetime(_last_modified(updated_at), usegmt=True),
+        # Per-user data: browsers may cache but must revalidate, shared caches must not store it
+        "Cache-Control": "private, no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        matched = _matching_etag(if_none_match, headers["ETag"])
+        if matched is not None:
+            # Echo the client's tag so it keeps matching the (possibly compressed) copy it holds
+            raise NotModifiedError({**headers, "ETag": matched})
+    elif request.headers.get("if-modified-since"):
+        if _not_modified_since(request.headers["if-modified-since"], _last_modified(updated_at)):
+            raise NotModifiedError(headers)
+
+    response.headers.update(headers)
@@ -3,10 +3,12 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
+from app.services.analytics_service import AnalyticsService
 from app.services.auth_service import AuthService
 from app.services.budget_service import BudgetService
 from app.services.category_service import CategoryService
 from app.services.dashboard_service import DashboardService
+from app.services.recurring_service import RecurringRuleService
 from app.services.transaction_service import TransactionService
 from app.services.user_service import UserService
 from app.core.security import get_current_user
@@ -45,6 +47,14 @@ def get_dashboard_service(db: DatabaseDep) -> DashboardService:
     return DashboardService(db)
 
 
+def get_analytics_service(db: DatabaseDep) -> AnalyticsService:
+    return AnalyticsService(db)
+
+
+def get_recurring_rule_service(db: DatabaseDep) -> RecurringRuleService:
+    return RecurringRuleService(db)
+
+
 # Typed service dependencies
 BudgetServiceDep = Annotated[BudgetService, Depends(get_budget_service)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
@@ -52,3 +62,5 @@ TransactionServiceDep = Annotated[TransactionService, Depends(get_transaction_se
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
 CategoryServiceDep = Annotated[CategoryService, Depends(get_category_service)]
 DashboardServiceDep = Annotated[DashboardService, Depends(get_dashboard_service)]
+AnalyticsServiceDep = Annotated[AnalyticsService, Depends(get_analytics_service)]
+RecurringRuleServiceDep = Annotated[RecurringRuleService, Depends(get_recurring_rule_service)]
@@ -25,3 +25,9 @@ class ValidationError(BaseError):
 class UnauthorizedError(BaseError):
     def __init__(self, message: str = "Unauthorized"):
         super().__init__(message, status.HTTP_401_UNAUTHORIZED)
+
+
+class NotModifiedError(HTTPException):
+    """The client's cached copy is current; answered with an empty 304 carrying the validators"""
+    def __init__(self, headers: dict):
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
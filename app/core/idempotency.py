@@ -0,0 +1,114 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Callable
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db
+from app.config.settings import settings
+from app.constants.messages import IdempotencyMessages
+from app.core.exceptions import ConflictError, ValidationError
+from app.core.security import get_current_user
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class _Replay(Exception):
+    """Raised by `idempotent` to short-circuit the endpoint with the stored response"""
+
+    def __init__(self, record: IdempotencyKey):
+        self.response = Response(
+            content=record.response_body,
+            status_code=record.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+
+class _Claim:
+    def __init__(self, repository: IdempotencyRepository, record: IdempotencyKey):
+        self.repository = repository
+        self.record = record
+
+    def complete(self, response: Response) -> None:
+        if response.status_code >= 500:
+            self.release()
+        else:
+            self.repository.complete(self.record, response.status_code, bytes(response.body))
+
+    def release(self) -> None:
+        # The endpoint may have failed mid-transaction
+        self.repository.db.rollback()
+        self.repository.release(self.record.id)
+
+
+def _request_hash(request: Request, body: bytes) -> str:
+    return hashlib.sha256(f"{request.method} {request.url.path}\n".encode() + body).hexdigest()
+
+
+async def idempotent(
+        request: Request,
+        current_user: dict = Depends(get_current_user),
+        db: Session = Depends(get_db),
+) -> None:
+    """Run a keyed write request at most once and replay its response to retries.
+
+    Add it with `dependencies=[Depends(idempotent)]` to POST endpoints of a router created with
+    `route_class=IdempotentRoute`, which stores the response. Requests without the header are unaffected.
+    Failed requests are not remembered, so a retry with the same key runs again.
+    """
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if key is None:
+        return
+    if not 0 < len(key) <= 255:
+        raise ValidationError(IdempotencyMessages.INVALID_KEY.value)
+
+    now = datetime.now()
+    request_hash = _request_hash(request, await request.body())
+    repository = IdempotencyRepository(db)
+    record, claimed = repository.claim(
+        current_user["user_id"],
+        key,
+        request_hash,
+        expires_at=now + timedelta(hours=settings.idempotency_key_ttl_hours),
+        now=now,
+    )
+    if claimed:
+        request.state.idempotency = _Claim(repository, record)
+        return
+
+    if record.request_hash != request_hash:
+        raise ValidationError(IdempotencyMessages.KEY_REUSED.value)
+    if record.status_code is None:
+        raise ConflictError(IdempotencyMessages.IN_PROGRESS.value)
+    raise _Replay(record)
+
+
+class IdempotentRoute(APIRoute):
+    """Route class that stores responses of requests claimed by `idempotent` and serves replays"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def idempotent_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except _Replay as replay:
+                return replay.response
+            except Exception:
+                claim = getattr(request.state, "idempotency", None)
+                if claim is not None:
+                    claim.release()
+                raise
+
+            claim = getattr(request.state, "idempotency", None)
+            if claim is not None:
+                claim.complete(response)
+            return response
+
+        return idempotent_handler
@@ -0,0 +1,238 @@
+import json
+import math
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import settings
+from app.constants.messages import ErrorMessages
+from app.core.security import verify_token
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(rate: str) -> Optional[Tuple[int, float]]:
+    """"10/minute" -> (capacity 10, refill 10/60 tokens per second); an empty rate means unlimited"""
+    if not rate:
+        return None
+    count, _, period = rate.partition("/")
+    if period not in PERIODS:
+        raise ValueError(f"Invalid rate {rate!r}, expected e.g. '10/minute'")
+    return int(count), int(count) / PERIODS[period]
+
+
+def _refill(tokens: float, updated_at: float, capacity: int, refill_rate: float, now: float) -> float:
+    return min(capacity, tokens + (now - updated_at) * refill_rate)
+
+
+class MemoryBucketStore:
+    """Token buckets held by this process; each gunicorn worker then enforces its own share of the limit"""
+
+    # Buckets are only pruned once the store holds more than this many
+    max_buckets = 10000
+    blocking = False
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        # key -> (tokens, updated_at, time at which the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._prune_at = self.max_buckets
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Take a token from the bucket; returns 0 when allowed, otherwise the seconds until a token is available"""
+        with self._lock:
+            now = self.clock()
+            bucket = self._buckets.get(key)
+            tokens = capacity if bucket is None else _refill(bucket[0], bucket[1], capacity, refill_rate, now)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / refill_rate
+            if wait == 0:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / refill_rate)
+            if len(self._buckets) > self._prune_at:
+                self._prune(now)
+            return wait
+
+    def _prune(self, now: float) -> None:
+        # Full buckets behave exactly like missing ones, so they can go. The next prune waits until the
+        # store has doubled from what is left, which keeps pruning amortized O(1) per take.
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+        self._prune_at = max(self.max_buckets, 2 * len(self._buckets))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._prune_at = self.max_buckets
+
+
+class SQLiteBucketStore:
+    """Token buckets in a local SQLite file, shared by every worker process on the host.
+
+    Each take is one short `BEGIN IMMEDIATE` transaction, which serialises concurrent workers and may wait
+    for the lock, so the middleware calls it from the thread pool. Buckets use wall-clock time because
+    monotonic clocks are not comparable between processes.
+    """
+
+    # Seconds between deletes of full buckets by each connection
+    prune_interval = 60.0
+    blocking = True
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.clock = clock
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=1, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Losing the last few buckets on power loss is harmless
+            connection.execute("PRAGMA synchronous=OFF")
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(rate_limit_buckets)")}
+            if columns and "full_at" not in columns:
+                # Buckets written before full_at was tracked could never be pruned; they are disposable
+                connection.execute("DROP TABLE IF EXISTS rate_limit_buckets")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, full_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS ix_rate_limit_buckets_full_at ON rate_limit_buckets (full_at)")
+            self._local.connection = connection
+            self._local.prune_at = self.clock() + self.prune_interval
+        return connection
+
+    def take(self, key: str, capacity: int, refill_rate: float) -> float:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            now = self.clock()
+            row = connection.execute("SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?", (key,)).fetchone()
+            tokens = capacity if row is None else _refill(row[0], row[1], capacity, refill_rate, now)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / refill_rate
+            if wait == 0:
+                tokens -= 1
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at, full_at) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, now + (capacity - tokens) / refill_rate),
+            )
+            if now >= self._local.prune_at:
+                # As in MemoryBucketStore, full buckets behave exactly like missing ones; the index on
+                # full_at keeps this delete proportional to the rows it removes
+                connection.execute("DELETE FROM rate_limit_buckets WHERE full_at <= ?", (now,))
+                self._local.prune_at = now + self.prune_interval
+            connection.execute("COMMIT")
+            return wait
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM rate_limit_buckets")
+
+
+def bucket_store(backend: str):
+    """Store for RATE_LIMIT_BACKEND: "memory", or "sqlite:///path" to share buckets between workers"""
+    if backend == "memory":
+        return MemoryBucketStore()
+    if backend.startswith("sqlite:///"):
+        return SQLiteBucketStore(backend[len("sqlite:///"):])
+    raise ValueError(f"Unknown rate limit backend {backend!r}")
+
+
+# Buckets of this process (or of the host, with a SQLite backend)
+rate_limit_store = bucket_store(settings.rate_limit_backend)
+
+
+class RateLimitPolicy:
+    """Limit for requests whose path starts with `path` (and whose method is in `methods`, if given).
+
+    Buckets are per client IP, or per authenticated user when `per` is "user" (falling back to the IP
+    for requests without a valid access token).
+    """
+
+    def __init__(self, name: str, path: str, rate: str, per: str = "ip", methods: Optional[List[str]] = None):
+        self.name = name
+        self.path = path
+        self.limit = parse_rate(rate)
+        self.per = per
+        self.methods = set(methods) if methods else None
+
+    def matches(self, method: str, path: str) -> bool:
+        return path.startswith(self.path) and (self.methods is None or method in self.methods)
+
+
+def _client_ip(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _user_id(scope: Scope) -> Optional[int]:
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    # Verified payloads are cached, so this rarely decodes the JWT again
+    payload = verify_token(token)
+    return payload.get("user_id") if payload else None
+
+
+class RateLimitMiddleware:
+    """Reject requests over their policy's rate with 429 and a Retry-After header.
+
+    The first policy matching the request applies; requests matching none, and CORS preflights, are not
+    limited. If the store fails the request is let through rather than failing the API.
+    """
+
+    def __init__(self, app: ASGIApp, store, policies: List[RateLimitPolicy]):
+        self.app = app
+        self.store = store
+        self.policies = [policy for policy in policies if policy.limit is not None]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            if self.store.blocking:
+                retry_after = await run_in_threadpool(self.check, scope)
+            else:
+                retry_after = self.check(scope)
+            if retry_after:
+                await self._reject(send, retry_after)
+                return
+        await self.app(scope, receive, send)
+
+    def check(self, scope: Scope) -> float:
+        """Seconds the client must wait, or 0 when the request may proceed"""
+        method = scope["method"]
+        if method == "OPTIONS":
+            return 0.0
+        for policy in self.policies:
+            if policy.matches(method, scope["path"]):
+                break
+        else:
+            return 0.0
+
+        user_id = _user_id(scope) if policy.per == "user" else None
+        key = f"{policy.name}:user:{user_id}" if user_id is not None else f"{policy.name}:ip:{_client_ip(scope)}"
+        try:
+            return self.store.take(key, *policy.limit)
+        except Exception:
+            return 0.0
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: float) -> None:
+        body = json.dumps({"status_code": 429, "message": ErrorMessages.TOO_MANY_REQUESTS.value}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -13,3 +13,11 @@ class PaginatedResponse(BaseModel):
     page: int
     per_page: int
     data: List[Any]
+
+
+class CursorPaginatedResponse(BaseModel):
+    message: str
+    limit: int
+    # Pass as `cursor` to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
+    data: List[Any]
@@ -0,0 +1,53 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+class RevocationList:
+    """In-memory set of revoked token ids, refreshed from the database at most every `sync_interval` seconds.
+
+    Lookups are a set membership test, so authenticating a request never queries the database;
+    revocations made by other workers become visible after the next sync. Revocations made by this
+    worker are kept until a sync returns them, since the sync may read from a replica that has not
+    applied them yet.
+    """
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        self._jtis: Set[str] = set()
+        # jti -> token expiry (naive UTC) of revocations made here and not yet seen in a sync
+        self._local: Dict[str, datetime] = {}
+        self._last_sync: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._jtis
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._jtis.add(jti)
+            self._local[jti] = expires_at
+
+    def is_stale(self) -> bool:
+        return self._last_sync is None or time.time() - self._last_sync >= self.sync_interval
+
+    def sync(self, db: Session) -> None:
+        started = time.time()
+        # Claim the sync slot first so concurrent requests do not all hit the database
+        self._last_sync = started
+        now = datetime.fromtimestamp(started, timezone.utc).replace(tzinfo=None)
+        jtis = RevokedTokenRepository(db).get_active_jtis(now)
+        with self._lock:
+            # Local revocations missing from the result (made while the query ran, or not yet replicated)
+            # stay until they show up or their token expires
+            self._local = {jti: expires_at for jti, expires_at in self._local.items() if jti not in jtis and expires_at > now}
+            self._jtis = jtis | set(self._local)
+
+    def sync_if_stale(self, db: Session) -> None:
+        if self.is_stale():
+            self.sync(db)
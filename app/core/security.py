@@ -1,21 +1,74 @@
-
+import hashlib
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
 
+from app.config.database import bind_user, get_db
 from app.config.settings import settings
+from app.core.cache import TTLCache
+from app.core.revocation import RevocationList
 from app.core.exceptions import UnauthorizedError
 from app.constants.messages import AuthMessages
 
+
+class _LazyCryptContext:
+    """passlib CryptContext built on first use, keeping passlib out of application import time"""
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._context = None
+
+    def __getattr__(self, name: str):
+        if self._context is None:
+            from passlib.context import CryptContext
+            self._context = CryptContext(**self._kwargs)
+        return getattr(self._context, name)
+
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = _LazyCryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # JWT Bearer token
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Token types carried in the "type" claim
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+
+def _load_jwt_backend(name: str):
+    """Return (encode, decode, error class) for the configured JWT library"""
+    if name == "pyjwt":
+        try:
+            import jwt as pyjwt
+        except ImportError as exc:
+            raise RuntimeError("JWT_BACKEND=pyjwt requires the 'pyjwt' package to be installed") from exc
+        return pyjwt.encode, pyjwt.decode, pyjwt.PyJWTError
+
+    from jose import JWTError, jwt
+    return jwt.encode, jwt.decode, JWTError
+
+
+# Loaded by _ensure_jwt_backend on first use: python-jose imports cryptography, which is slow to import
+jwt_encode = jwt_decode = JWTError = None
+
+
+def _ensure_jwt_backend() -> None:
+    global jwt_encode, jwt_decode, JWTError
+    if jwt_decode is None:
+        encode, decode, error = _load_jwt_backend(settings.jwt_backend)
+        # jwt_decode last: a concurrent caller seeing it set also sees the others
+        jwt_encode, JWTError, jwt_decode = encode, error, decode
+
+# Verified token payloads keyed by the token's SHA-256 digest, dropped once the token expires
+token_cache = TTLCache(maxsize=settings.token_cache_size)
+
+# Revoked token ids, checked in memory on every request and synced periodically from the database
+revocation_list = RevocationList(sync_interval=settings.revocation_sync_interval_seconds)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -25,34 +78,64 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(user_id: str, email: str, expires_delta: timedelta = None) -> str:
-    if expires_delta is None:
-        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
-
+def _create_token(user_id: str, email: str, token_type: str, expires_delta: timedelta) -> str:
+    _ensure_jwt_backend()
     payload = {
         "user_id": user_id,
         "email": email,
+        "type": token_type,
+        "jti": uuid.uuid4().hex,
         "exp": datetime.now(timezone.utc) + expires_delta
     }
 
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return jwt_encode(payload, settings.secret_key, algorithm=settings.algorithm)
 
 
-def verify_token(token: str) -> dict:
+def create_access_token(user_id: str, email: str, expires_delta: timedelta = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
+
+    return _create_token(user_id, email, ACCESS_TOKEN_TYPE, expires_delta)
+
+
+def create_refresh_token(user_id: str, email: str, expires_delta: timedelta = None) -> str:
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=settings.refresh_token_expire_minutes)
+
+    return _create_token(user_id, email, REFRESH_TOKEN_TYPE, expires_delta)
+
+
+def token_expires_at(payload: dict) -> datetime:
+    """Token expiry as a naive UTC datetime, the way it is stored in the database"""
+    return datetime.fromtimestamp(payload["exp"], timezone.utc).replace(tzinfo=None)
+
+
+def verify_token(token: str, token_type: str = ACCESS_TOKEN_TYPE) -> dict:
+    cache_key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(cache_key)
+    if payload is not None:
+        return payload if payload.get("type", ACCESS_TOKEN_TYPE) == token_type else None
+
+    _ensure_jwt_backend()
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt_decode(token, settings.secret_key, algorithms=[settings.algorithm])
         user_id = payload.get("user_id")
         email = payload.get("email")
 
         if user_id is None or email is None:
             return None
 
-        return payload
+        token_cache.set(cache_key, payload, expires_at=payload["exp"])
+        # Tokens issued before the "type" claim existed are access tokens
+        return payload if payload.get("type", ACCESS_TOKEN_TYPE) == token_type else None
     except JWTError:
         return None
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> Optional[dict]:
+def get_current_user(
+        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+        db: Session = Depends(get_db),
+) -> Optional[dict]:
     token = credentials.credentials if credentials else None
     if not token:
         raise UnauthorizedError(AuthMessages.UNAUTHORIZED.value)
@@ -61,4 +144,9 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_
     if payload is None:
         raise UnauthorizedError(AuthMessages.UNAUTHORIZED.value)
 
+    bind_user(db, payload.get("user_id"))
+    revocation_list.sync_if_stale(db)
+    if revocation_list.is_revoked(payload.get("jti")):
+        raise UnauthorizedError(AuthMessages.UNAUTHORIZED.value)
+
     return payload
@@ -0,0 +1,16 @@
+"""Database-backed background jobs.
+
+Register a handler with `@job("name")` in app.jobs.tasks, queue it from a service with
+`enqueue(db, "name", {...})` and run `python -m app.jobs.worker`.
+"""
+
+from .registry import JobDefinition, enqueue, get_job, job, periodic_jobs
+from . import tasks  # noqa: F401  (registers the built-in handlers)
+
+__all__ = [
+    "JobDefinition",
+    "enqueue",
+    "get_job",
+    "job",
+    "periodic_jobs"
+]
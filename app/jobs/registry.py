@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+
+
+class JobDefinition:
+    """A registered job handler; `every` makes the worker keep one run of it scheduled at that interval"""
+
+    def __init__(self, name: str, handler: Callable, max_attempts: int, every: Optional[timedelta] = None):
+        self.name = name
+        self.handler = handler
+        self.max_attempts = max_attempts
+        self.every = every
+
+
+_registry: Dict[str, JobDefinition] = {}
+
+
+def job(name: str, max_attempts: Optional[int] = None, every: Optional[timedelta] = None):
+    """Register `handler(db, **payload)` as the job called `name`"""
+    def decorator(handler: Callable) -> Callable:
+        if name in _registry:
+            raise ValueError(f"Job {name!r} is already registered")
+        _registry[name] = JobDefinition(name, handler, max_attempts or settings.job_max_attempts, every)
+        return handler
+    return decorator
+
+
+def get_job(name: str) -> JobDefinition:
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown job {name!r}") from None
+
+
+def periodic_jobs() -> List[JobDefinition]:
+    return [definition for definition in _registry.values() if definition.every is not None]
+
+
+def enqueue(db: Session, name: str, payload: Optional[dict] = None, run_at: Optional[datetime] = None) -> Job:
+    """Queue a registered job; it runs on the next worker poll after `run_at` (default: now)"""
+    definition = get_job(name)
+    return JobRepository(db).enqueue(name, payload or {}, definition.max_attempts, run_at)
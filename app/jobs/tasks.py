@@ -0,0 +1,82 @@
+"""Job handlers. Each receives a database session plus the job payload as keyword arguments."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.config.database import bind_user
+from app.config.settings import settings
+from app.maintenance.partitions import ensure_future_partitions, is_partitioned
+from app.repositories.archive_repository import ArchiveRepository, archive_cutoff
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.job_repository import JobRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.user_repository import UserRepository
+from app.services.budget_service import BudgetService
+from app.services.recurring_service import RecurringRuleService
+from .registry import job
+
+
+def _each_shard(db: Session):
+    """Point the session at each user shard in turn (or just the primary database when unsharded)"""
+    router = getattr(db, "router", None)
+    for shard in (list(router.shards) if router is not None and router.shards else [None]):
+        db.info["shard"] = shard
+        yield shard
+    db.info.pop("shard", None)
+
+
+@job("partitions.ensure_future", every=timedelta(days=1))
+def ensure_transaction_partitions(db: Session):
+    for _ in _each_shard(db):
+        connection = db.connection()
+        if is_partitioned(connection):
+            ensure_future_partitions(connection, settings.partition_months_ahead)
+        db.commit()
+
+
+@job("transactions.archive", every=timedelta(days=1))
+def archive_transactions(db: Session):
+    for _ in _each_shard(db):
+        ArchiveRepository(db).archive_before(archive_cutoff())
+
+
+@job("recurring.materialize", every=timedelta(minutes=15))
+def materialize_recurring_transactions(db: Session):
+    for _ in _each_shard(db):
+        RecurringRuleService(db).materialize_due()
+
+
+@job("budgets.rollover", every=timedelta(days=1))
+def rollover_budgets(db: Session):
+    # Budgets roll over once their period has closed, so carried-over amounts count all of its spending.
+    # Looking back several days catches up on missed runs; budgets already rolled over are skipped.
+    today = date.today()
+    for user_id, carry_over in UserRepository(db).get_budget_rollover_users():
+        bind_user(db, user_id)
+        BudgetService(db).rollover_budgets(
+            user_id, today, carry_over, lookback_days=settings.budget_rollover_lookback_days
+        )
+    db.info.pop("user_id", None)
+
+
+@job("tokens.purge_expired", every=timedelta(hours=1))
+def purge_expired_revocations(db: Session):
+    # Revocation expiry is stored as naive UTC, like the token exp claim
+    RevokedTokenRepository(db).delete_expired(datetime.now(timezone.utc).replace(tzinfo=None))
+
+
+@job("idempotency.purge_expired", every=timedelta(hours=1))
+def purge_expired_idempotency_keys(db: Session):
+    IdempotencyRepository(db).delete_expired(datetime.now())
+
+
+@job("users.delete")
+def delete_user_account(db: Session, user_id: int):
+    bind_user(db, user_id)
+    UserRepository(db).delete_account(user_id, batch_size=settings.user_delete_batch_size)
+
+
+@job("jobs.purge_finished", every=timedelta(days=1))
+def purge_finished_jobs(db: Session):
+    JobRepository(db).delete_finished_before(datetime.now() - timedelta(days=settings.job_retention_days))
@@ -0,0 +1,120 @@
+"""Background job worker.
+
+    python -m app.jobs.worker [--once] [--poll-interval 5]
+
+Polls the jobs table, runs due jobs one at a time and keeps every periodic job scheduled. Run as many
+workers as needed: on PostgreSQL they claim jobs with FOR UPDATE SKIP LOCKED and never block each other.
+`--once` drains the due jobs and exits, which suits cron or local runs.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+from .registry import enqueue, get_job, periodic_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(self, session_factory: Callable[[], Session], worker_id: Optional[str] = None, poll_interval: Optional[float] = None):
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = settings.job_poll_interval_seconds if poll_interval is None else poll_interval
+        self._stopping = False
+
+    def stop(self, *_):
+        self._stopping = True
+
+    def schedule_periodic(self, db: Session) -> None:
+        """Queue a run of every periodic job that has none pending"""
+        repository = JobRepository(db)
+        for definition in periodic_jobs():
+            if not repository.has_pending(definition.name):
+                enqueue(db, definition.name)
+
+    def run_once(self) -> bool:
+        """Run the oldest due job, if any; returns whether a job was run"""
+        db = self.session_factory()
+        try:
+            repository = JobRepository(db)
+            now = datetime.now()
+            repository.requeue_stale(now - timedelta(seconds=settings.job_lock_timeout_seconds), now)
+            job = repository.claim_next(self.worker_id, now)
+            if job is None:
+                return False
+            self._execute(db, job)
+            return True
+        finally:
+            db.close()
+
+    def run(self, once: bool = False) -> None:
+        db = self.session_factory()
+        try:
+            self.schedule_periodic(db)
+        finally:
+            db.close()
+
+        while not self._stopping:
+            if not self.run_once():
+                if once:
+                    return
+                time.sleep(self.poll_interval)
+
+    def _execute(self, db: Session, job: Job) -> None:
+        repository = JobRepository(db)
+        job_id, name, payload, attempts = job.id, job.name, dict(job.payload or {}), job.attempts
+        definition = None
+        try:
+            definition = get_job(name)
+            definition.handler(db, **payload)
+        except Exception:
+            db.rollback()
+            job = repository.get_by_id(job_id)
+            now = datetime.now()
+            retry_at = None
+            if attempts < job.max_attempts:
+                retry_at = now + timedelta(seconds=settings.job_retry_backoff_seconds * 2 ** (attempts - 1))
+            repository.mark_failed(job, traceback.format_exc(), now, retry_at)
+            logger.warning("job %s (%s) failed on attempt %s/%s", job_id, name, attempts, job.max_attempts)
+            if retry_at is not None:
+                return
+        else:
+            repository.mark_succeeded(repository.get_by_id(job_id), datetime.now())
+            logger.info("job %s (%s) succeeded", job_id, name)
+
+        # A periodic job schedules its next run once this one is over, successful or not
+        if definition is not None and definition.every is not None:
+            enqueue(db, name, payload, run_at=datetime.now() + definition.every)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Run background jobs")
+    parser.add_argument("--once", action="store_true", help="Run the jobs that are due, then exit")
+    parser.add_argument("--poll-interval", type=float, default=settings.job_poll_interval_seconds)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    worker = Worker(SessionLocal, poll_interval=args.poll_interval)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run(once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,96 @@
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.config.settings import settings
-from app.config.database import engine
-from app.models import Base
+from app import models  # noqa: F401  registers every model before relationships are configured
+from app.config.settings import Settings, settings
+from app.config.database import close_database, init_database
 from app.api.v1.router import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.exceptions import BaseError
+from app.core.rate_limit import RateLimitMiddleware, RateLimitPolicy, rate_limit_store
 from app.core.responses import SuccessResponse
 
-app = FastAPI(title=settings.app_name, version=settings.app_version, debug=settings.debug)
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-
-@app.exception_handler(BaseError)
 async def base_error_handler(_: Request, exc: BaseError):
     return JSONResponse(status_code=exc.status_code, content={"status_code": exc.status_code, "message": exc.message})
 
 
-@app.get("/")
-def read_root():
-    return SuccessResponse(
-        message="Welcome to the API",
-        data={
-            "name": settings.app_name,
-            "version": settings.app_version,
-            "description": "A simple API for managing personal finances",
-        },
+def create_app(app_settings: Optional[Settings] = None) -> FastAPI:
+    """Build the application.
+
+    Nothing here touches the database: engines are created by the lifespan handler, or on first use
+    when the server does not run lifespan events. Import-time work is limited to module imports, so a
+    preloading server (gunicorn --preload) can build the app once and share it with its forked workers.
+    """
+    app_settings = app_settings or settings
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        init_database(app_settings)
+        yield
+        close_database()
+
+    application = FastAPI(
+        title=app_settings.app_name, version=app_settings.app_version, debug=app_settings.debug, lifespan=lifespan
+    )
+
+    # Rate limiting; added before CORS so 429 responses still carry CORS headers
+    application.add_middleware(
+        RateLimitMiddleware,
+        store=rate_limit_store,
+        policies=[
+            RateLimitPolicy("login", "/api/v1/auth/login", app_settings.rate_limit_login, methods=["POST"]),
+            RateLimitPolicy("register", "/api/v1/auth/register", app_settings.rate_limit_register, methods=["POST"]),
+            RateLimitPolicy("dashboard", "/api/v1/dashboard", app_settings.rate_limit_dashboard, per="user"),
+            RateLimitPolicy("api", "/api/", app_settings.rate_limit_default, per="user"),
+        ],
+    )
+
+    # Add CORS middleware
+    application.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
     )
 
+    # Compress large JSON / text responses
+    if app_settings.compression_encodings:
+        application.add_middleware(
+            CompressionMiddleware,
+            encodings=[name.strip() for name in app_settings.compression_encodings.split(",") if name.strip()],
+            levels={
+                "gzip": app_settings.compression_gzip_level,
+                "br": app_settings.compression_brotli_level,
+                "zstd": app_settings.compression_zstd_level,
+            },
+            minimum_size=app_settings.compression_minimum_size,
+            content_types=[
+                prefix.strip() for prefix in app_settings.compression_content_types.split(",") if prefix.strip()
+            ],
+        )
+
+    application.add_exception_handler(BaseError, base_error_handler)
+
+    @application.get("/")
+    def read_root():
+        return SuccessResponse(
+            message="Welcome to the API",
+            data={
+                "name": app_settings.app_name,
+                "version": app_settings.app_version,
+                "description": "A simple API for managing personal finances",
+            },
+        )
+
+    application.include_router(api_router)
+    return application
+
 
-app.include_router(api_router)
+# For `uvicorn app.main:app`; `uvicorn --factory app.main:create_app` builds a fresh one instead
+app = create_app()
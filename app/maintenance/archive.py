@@ -0,0 +1,39 @@
+"""Move transactions older than the archive horizon into transactions_archive.
+
+    python -m app.maintenance.archive [--horizon-months 24] [--batch-size 5000]
+
+Rows are moved in id-ordered batches, each committed on its own, so the job can be interrupted and
+re-run safely and never holds long locks on the hot table.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from app.config.settings import settings
+from app.repositories.archive_repository import ArchiveRepository, archive_cutoff
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.config.database import SessionLocal, router
+
+    parser = argparse.ArgumentParser(description="Archive old transactions")
+    parser.add_argument("--horizon-months", type=int, default=settings.archive_horizon_months)
+    parser.add_argument("--batch-size", type=int, default=settings.archive_batch_size)
+    args = parser.parse_args(argv)
+
+    cutoff = archive_cutoff(args.horizon_months)
+    db = SessionLocal()
+    try:
+        # Transactions live on the user shards when sharding is configured
+        for shard in list(router.shards) or [None]:
+            db.info["shard"] = shard
+            moved = ArchiveRepository(db).archive_before(cutoff, args.batch_size)
+            print(f"{shard or 'primary'}: archived {moved} transactions dated before {cutoff}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
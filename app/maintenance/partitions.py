@@ -0,0 +1,164 @@
+"""Monthly range partitions for the transactions table (PostgreSQL only).
+
+The table is converted to `PARTITION BY RANGE (transaction_date)` by an Alembic migration. This module
+keeps partitions ahead of time and detaches old ones:
+
+    python -m app.maintenance.partitions list
+    python -m app.maintenance.partitions create --months-ahead 3
+    python -m app.maintenance.partitions detach --before 2023-01 [--drop]
+"""
+
+import argparse
+import sys
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.config.settings import settings
+from app.utils.dates import add_months, month_start
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_bounds(month: date) -> Tuple[date, date]:
+    """Inclusive lower and exclusive upper bound of the partition holding `month`"""
+    start = month_start(month)
+    return start, add_months(start, 1)
+
+
+def is_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return connection.execute(text(
+        """
+        SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p
+                       JOIN pg_class c ON c.oid = p.partrelid
+                       WHERE c.relname = :table)
+        """
+    ), {"table": PARENT_TABLE}).scalar()
+
+
+def list_partitions(connection: Connection) -> List[Tuple[str, str]]:
+    """(partition name, bound expression) for every attached partition"""
+    return [tuple(row) for row in connection.execute(text(
+        """
+        SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :table
+        ORDER BY child.relname
+        """
+    ), {"table": PARENT_TABLE})]
+
+
+def create_partition(connection: Connection, month: date) -> bool:
+    """Create the partition for `month` if missing; returns True when a partition was created.
+
+    Rows that already landed in the default partition for that month are moved into the new
+    partition, since PostgreSQL refuses to attach a range the default partition already holds.
+    """
+    name = partition_name(month)
+    start, end = partition_bounds(month)
+    exists = connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+    if exists:
+        return False
+
+    params = {"start": start, "end": end}
+    connection.execute(text(
+        f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+    connection.execute(text(
+        f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION}
+            WHERE transaction_date >= :start AND transaction_date < :end
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+        """
+    ), params)
+    connection.execute(text(
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    return True
+
+
+def ensure_future_partitions(connection: Connection, months_ahead: int, today: Optional[date] = None) -> List[str]:
+    """Make sure partitions exist from the current month through `months_ahead` months ahead"""
+    current = month_start(today or date.today())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if create_partition(connection, month):
+            created.append(partition_name(month))
+    return created
+
+
+def detach_partitions_before(connection: Connection, before: date, drop: bool = False) -> List[str]:
+    """Detach (and optionally drop) monthly partitions that end on or before `before`.
+
+    Detaching is a metadata-only operation, so old months leave the table without a bulk DELETE.
+    """
+    cutoff = month_start(before)
+    detached = []
+    for name, _ in list_partitions(connection):
+        if name == DEFAULT_PARTITION:
+            continue
+        year, month = int(name[-7:-3]), int(name[-2:])
+        if date(year, month, 1) >= cutoff:
+            continue
+        connection.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if drop:
+            connection.execute(text(f"DROP TABLE {name}"))
+        detached.append(name)
+    return detached
+
+
+def _parse_month(value: str) -> date:
+    year, month = map(int, value.split("-"))
+    return date(year, month, 1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.config.database import engine, router
+
+    parser = argparse.ArgumentParser(description="Manage monthly partitions of the transactions table")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List attached partitions")
+    create_parser = subparsers.add_parser("create", help="Create partitions for upcoming months")
+    create_parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+    detach_parser = subparsers.add_parser("detach", help="Detach partitions for months before YYYY-MM")
+    detach_parser.add_argument("--before", type=_parse_month, required=True)
+    detach_parser.add_argument("--drop", action="store_true", help="Drop detached partitions")
+    args = parser.parse_args(argv)
+
+    # Transactions live on the user shards when sharding is configured
+    for database, database_engine in (router.shards or {"primary": engine}).items():
+        with database_engine.begin() as connection:
+            if not is_partitioned(connection):
+                print(f"{database}: transactions is not partitioned (PostgreSQL only); nothing to do")
+                continue
+
+            if args.command == "list":
+                for name, bound in list_partitions(connection):
+                    print(f"{database}: {name}\t{bound}")
+            elif args.command == "create":
+                for name in ensure_future_partitions(connection, args.months_ahead):
+                    print(f"{database}: created {name}")
+            elif args.command == "detach":
+                for name in detach_partitions_before(connection, args.before, drop=args.drop):
+                    print(f"{database}: {'dropped' if args.drop else 'detached'} {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
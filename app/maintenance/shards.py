@@ -0,0 +1,156 @@
+"""Manage user shards (DATABASE_SHARD_URLS).
+
+    python -m app.maintenance.shards init                      # create the shard schema on every shard
+    python -m app.maintenance.shards locate USER_ID
+    python -m app.maintenance.shards rebalance [--drain old=url,...] [--dry-run]
+
+Users are placed by consistent hashing, so after adding a shard (or listing a removed one under
+--drain) `rebalance` moves only the users whose shard changed. Moved rows get new ids on the target
+shard, and archived transactions return to the live table until the next archive run, so each moved
+user's data version is bumped to invalidate the ETags clients hold. Run it while the API and workers
+are stopped.
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Table, create_engine, delete, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config.sharding import ShardMap, create_shard_schema, parse_shard_urls, sharded_models
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.base import Base
+from app.models.transaction import Transaction
+from app.repositories.user_repository import UserRepository
+
+
+def users_on_shard(engine: Engine) -> Set[int]:
+    with Session(engine) as db:
+        user_ids = set()
+        for model in sharded_models():
+            user_ids.update(db.scalars(select(model.user_id).distinct()))
+    user_ids.discard(None)
+    return user_ids
+
+
+def _models_parents_first() -> List[type]:
+    """Sharded models ordered so that every table comes after the sharded tables it references"""
+    models = {model.__table__: model for model in sharded_models()}
+    return [models[table] for table in Base.metadata.sorted_tables if table in models]
+
+
+def _delete_user_rows(db: Session, user_id: int) -> None:
+    for model in reversed(_models_parents_first()):
+        db.execute(delete(model).where(model.user_id == user_id))
+
+
+def _rows(db: Session, model, user_id: int, batch_size: int):
+    """A user's rows as column dicts, in batches"""
+    result = db.execute(
+        select(model.__table__).where(model.user_id == user_id).order_by(model.id)
+        .execution_options(yield_per=batch_size)
+    ).mappings()
+    for batch in result.partitions(batch_size):
+        yield [dict(row) for row in batch]
+
+
+def move_user(user_id: int, source: Engine, target: Engine, primary: Engine, batch_size: int = 5000) -> int:
+    """Copy a user's rows to the target shard, then delete them from the source; returns the rows moved.
+
+    Tables are copied parents first. Foreign keys between sharded tables (a transaction's category and
+    recurring rule, say) are remapped to the ids the referenced rows got on the target shard. Once the
+    copy is committed, the user's data version is bumped on the primary, which holds the users table.
+    """
+    models = _models_parents_first()
+    tables = {model.__table__ for model in models}
+    # Source id -> target id, for every sharded table another sharded table references
+    new_ids: Dict[Table, Dict[int, int]] = {
+        key.column.table: {} for table in tables for key in table.foreign_keys if key.column.table in tables
+    }
+    moved = 0
+    with Session(source) as source_db, Session(target) as target_db:
+        # Leftovers of an interrupted move would otherwise be duplicated
+        _delete_user_rows(target_db, user_id)
+
+        for model in models:
+            # Archived rows go back to the live table; the archive job moves them out again
+            target_table = Transaction.__table__ if model is ArchivedTransaction else model.__table__
+            references = [
+                (column.name, key.column.table) for column in model.__table__.columns
+                for key in column.foreign_keys if key.column.table in new_ids
+            ]
+            for rows in _rows(source_db, model, user_id, batch_size):
+                source_ids = [row.pop("id") for row in rows]
+                for row in rows:
+                    row.pop("archived_at", None)
+                    for column, table in references:
+                        row[column] = new_ids[table].get(row[column])
+                if model.__table__ in new_ids:
+                    inserted = target_db.execute(
+                        insert(target_table).returning(target_table.c.id, sort_by_parameter_order=True), rows
+                    ).scalars()
+                    new_ids[model.__table__].update(zip(source_ids, inserted))
+                else:
+                    target_db.execute(insert(target_table), rows)
+                moved += len(rows)
+        target_db.commit()
+
+        with Session(primary) as users_db:
+            UserRepository(users_db).bump_data_version(user_id)
+            users_db.commit()
+
+        _delete_user_rows(source_db, user_id)
+        source_db.commit()
+    return moved
+
+
+def rebalance(primary: Engine, shards: Dict[str, Engine], drain: Optional[Dict[str, Engine]] = None, batch_size: int = 5000, dry_run: bool = False) -> List[Tuple[int, str, str]]:
+    """Move every user not on the shard the ring assigns them; `drain` lists shards being removed"""
+    shard_map = ShardMap(shards)
+    moves = []
+    for name, engine in {**shards, **(drain or {})}.items():
+        for user_id in sorted(users_on_shard(engine)):
+            target = shard_map.shard_for(user_id)
+            if target == name:
+                continue
+            moves.append((user_id, name, target))
+            if not dry_run:
+                move_user(user_id, engine, shards[target], primary, batch_size)
+    return moves
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.config.database import router
+
+    parser = argparse.ArgumentParser(description="Manage user shards")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("init", help="Create the shard schema on every configured shard")
+    locate_parser = subparsers.add_parser("locate", help="Print the shard of a user")
+    locate_parser.add_argument("user_id", type=int)
+    rebalance_parser = subparsers.add_parser("rebalance", help="Move users whose shard changed")
+    rebalance_parser.add_argument("--drain", type=parse_shard_urls, default={}, help="Shards being removed, name=url,...")
+    rebalance_parser.add_argument("--batch-size", type=int, default=5000)
+    rebalance_parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not router.shards:
+        print("DATABASE_SHARD_URLS is not set; nothing to do")
+        return 1
+
+    if args.command == "init":
+        for name, engine in router.shards.items():
+            create_shard_schema(engine)
+            print(f"initialised {name}")
+    elif args.command == "locate":
+        print(router.shard_map.shard_for(args.user_id))
+    elif args.command == "rebalance":
+        drain = {name: create_engine(url) for name, url in args.drain.items()}
+        for user_id, source, target in rebalance(router.primary, router.shards, drain, args.batch_size, args.dry_run):
+            print(f"{'would move' if args.dry_run else 'moved'} user {user_id}: {source} -> {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,12 @@ from .base import Base
 from .user import User
 from .category import Category
 from .transaction import Transaction, TransactionType, PaymentMethod
+from .archived_transaction import ArchivedTransaction
 from .budget import Budget
+from .revoked_token import RevokedToken
+from .job import Job, JobStatus
+from .idempotency_key import IdempotencyKey
+from .recurring_rule import RecurringRule, RecurrenceFrequency
 
 __all__ = [
     "Base",
@@ -11,5 +16,12 @@ __all__ = [
     "Transaction",
     "TransactionType",
     "PaymentMethod",
-    "Budget"
+    "ArchivedTransaction",
+    "Budget",
+    "RevokedToken",
+    "Job",
+    "JobStatus",
+    "IdempotencyKey",
+    "RecurringRule",
+    "RecurrenceFrequency"
 ]
@@ -0,0 +1,39 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SQLEnum, Date, DateTime, Index
+from sqlalchemy.orm import relationship
+from .base import Base
+from .transaction import TransactionType, PaymentMethod
+
+
+class ArchivedTransaction(Base):
+    """Cold copy of a transaction older than the archive horizon, moved out of the hot table.
+
+    Rows keep their original id so they can be served next to live transactions, and only carry
+    the indexes the federated reads need.
+    """
+
+    __tablename__ = "transactions_archive"
+    # Rows live on the owning user's shard when sharding is configured
+    __shard_by_user__ = True
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    category_id = Column(Integer, ForeignKey("categories.id"), index=True)
+    amount = Column(Integer)
+    transaction_date = Column(Date, nullable=False)
+    type = Column(SQLEnum(TransactionType), nullable=False)
+    payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
+    description = Column(String, nullable=True)
+    archived_at = Column(DateTime, default=datetime.now, nullable=False)
+
+    # Relationships
+    user = relationship("User", back_populates="archived_transactions")
+    category = relationship("Category", viewonly=True)
+
+    __table_args__ = (
+        Index("idx_transaction_archive_user_date", "user_id", "transaction_date"),
+    )
+
+    @property
+    def category_name(self) -> str:
+        return self.category.name if self.category else ""
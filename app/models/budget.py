@@ -13,8 +13,10 @@ class PredictionType(Enum):
 
 class Budget(Base):
     __tablename__ = "budgets"
+    # Rows live on the owning user's shard when sharding is configured
+    __shard_by_user__ = True
 
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     category_id = Column(Integer, ForeignKey("categories.id"), index=True)
     amount = Column(Integer)
     start_date = Column(Date, nullable=False, index=True)
@@ -5,8 +5,10 @@ from .base import Base
 
 class Category(Base):
     __tablename__ = "categories"
+    # Rows live on the owning user's shard when sharding is configured
+    __shard_by_user__ = True
 
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     name = Column(String, index=True)
 
     # Relationships
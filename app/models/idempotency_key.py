@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime, UniqueConstraint
+from .base import Base
+
+
+class IdempotencyKey(Base):
+    """Outcome of a write request sent with an Idempotency-Key header (see app.core.idempotency)"""
+
+    __tablename__ = "idempotency_keys"
+
+    # No foreign key, like revoked tokens: rows are short-lived and purged once expired
+    user_id = Column(Integer, nullable=False)
+    key = Column(String(255), nullable=False)
+    # sha256 of method, path and body; a reused key with a different request is rejected
+    request_hash = Column(String(64), nullable=False)
+    # Both stay NULL while the first request is still running
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(LargeBinary, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    __table_args__ = (
+        # Concurrent duplicates race on this constraint; exactly one of them claims the key
+        UniqueConstraint("user_id", "key", name="uq_idempotency_key_user_key"),
+    )
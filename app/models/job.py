@@ -0,0 +1,35 @@
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Enum as SQLEnum, Index
+from .base import Base
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """Deferred unit of work picked up by the background worker (see app.jobs)"""
+
+    __tablename__ = "jobs"
+
+    name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(SQLEnum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    # Earliest time the job may run; pushed back on retries
+    run_at = Column(DateTime, nullable=False, default=datetime.now)
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # Workers poll for the oldest due job in a status
+        Index("idx_job_status_run_at", "status", "run_at"),
+        Index("idx_job_name_status", "name", "status"),
+    )
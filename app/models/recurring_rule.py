@@ -0,0 +1,54 @@
+from enum import Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SQLEnum, Date, Boolean, Index
+from sqlalchemy.orm import relationship
+from .base import Base
+from .transaction import TransactionType, PaymentMethod
+
+
+class RecurrenceFrequency(Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class RecurringRule(Base):
+    """Template of a transaction repeated on a schedule, e.g. rent on the 1st of every month.
+
+    Occurrences are materialized as transactions by the "recurring.materialize" job; `next_run_date`
+    is the date of the next occurrence not yet created.
+    """
+
+    __tablename__ = "recurring_rules"
+    # Rows live on the owning user's shard when sharding is configured
+    __shard_by_user__ = True
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    amount = Column(Integer, nullable=False)
+    type = Column(SQLEnum(TransactionType), nullable=False)
+    payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
+    description = Column(String, nullable=True)
+
+    # Every `interval` days / weeks / months; weekly rules repeat on the weekday of start_date
+    frequency = Column(SQLEnum(RecurrenceFrequency), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    # Monthly rules: day of the month, moved to the last day in shorter months
+    day_of_month = Column(Integer, nullable=True)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    next_run_date = Column(Date, nullable=False)
+    # Cleared once the rule has passed its end_date
+    active = Column(Boolean, nullable=False, default=True)
+    # Expense occurrences refused by the budget checks (no covering budget, or over its limit); the rule
+    # moves past them, so these record what was skipped
+    rejected_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_rejected_date = Column(Date, nullable=True)
+
+    # Relationships
+    user = relationship("User", back_populates="recurring_rules")
+    category = relationship("Category")
+
+    __table_args__ = (
+        # The materializer walks due rules in id order
+        Index("idx_recurring_rule_due", "active", "next_run_date", "id"),
+    )
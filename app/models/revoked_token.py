@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from .base import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String, unique=True, nullable=False, index=True)
+    # No foreign key: revocations must outlive a deleted user until the token expires
+    user_id = Column(Integer, index=True)
+    # Original token expiry; rows past it no longer need to be kept in the revocation list
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,5 +1,5 @@
 from enum import Enum
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SQLEnum, Date
+from sqlalchemy import DDL, Column, Integer, String, ForeignKey, Enum as SQLEnum, Date, Index, Table, event
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -17,20 +17,92 @@ class PaymentMethod(Enum):
 
 
 class Transaction(Base):
+    # On PostgreSQL this table is range-partitioned by month on transaction_date (see the
+    # "partition transactions by month" migration and app.maintenance.partitions), with primary key
+    # (id, transaction_date). ids stay unique through the shared sequence, so the ORM keeps using id.
     __tablename__ = "transactions"
+    # Rows live on the owning user's shard when sharding is configured
+    __shard_by_user__ = True
 
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    # The primary key index is enough; skip the extra id index the base model adds
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     category_id = Column(Integer, ForeignKey("categories.id"), index=True)
     amount = Column(Integer)
-    transaction_date = Column(Date, nullable=False, index=True)
-    type = Column(SQLEnum(TransactionType), nullable=False, index=True)
+    transaction_date = Column(Date, nullable=False)
+    type = Column(SQLEnum(TransactionType), nullable=False)
     payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
     description = Column(String, nullable=True)
+    # Set on occurrences created from a recurring rule
+    recurring_rule_id = Column(Integer, ForeignKey("recurring_rules.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="transactions")
     category = relationship("Category", back_populates="transactions")
     
+    # Every query is scoped by user_id, so composite indexes lead with it; amount is included
+    # on PostgreSQL so spending sums are answered by index-only scans.
+    __table_args__ = (
+        # Budget period spending and budget spending joins: user + category + type + date range
+        Index(
+            "idx_transaction_user_category_type_date",
+            "user_id", "category_id", "type", "transaction_date",
+            postgresql_include=["amount"],
+        ),
+        # Monthly summary, top expenses and active budget spending: user + type + date range
+        Index(
+            "idx_transaction_user_type_date",
+            "user_id", "type", "transaction_date",
+            postgresql_include=["amount", "category_id"],
+        ),
+        # Transaction listing and recent transactions sorted by date
+        Index("idx_transaction_user_date", "user_id", "transaction_date"),
+        # Transaction listing sorted by creation time
+        Index("idx_transaction_user_created", "user_id", "created_at"),
+        # Transaction listing sorted by amount, and amount range filters
+        Index("idx_transaction_user_amount", "user_id", "amount"),
+        # One occurrence per rule and date, so re-running the materializer never duplicates; rows
+        # without a rule (NULL) never conflict. Contains the partition key, as PostgreSQL requires.
+        Index("uq_transaction_recurring_occurrence", "recurring_rule_id", "transaction_date", unique=True),
+    )
+
     @property
     def category_name(self) -> str:
         return self.category.name if self.category else ""
+
+
+# Full-text search over descriptions (see TransactionRepository.search). The columns live outside the
+# ORM model because they only exist on some databases: PostgreSQL gets a generated tsvector column with
+# a GIN index plus a trigram index for typo-tolerant word matches, and SQLite an external-content FTS5
+# table kept in sync by triggers. Migrated databases get them from the "add transaction search" migration.
+SEARCH_DDL = {
+    "postgresql": [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "ALTER TABLE transactions ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(description, ''))) STORED",
+        "CREATE INDEX idx_transaction_search_vector ON transactions USING gin (search_vector)",
+        "CREATE INDEX idx_transaction_description_trgm ON transactions USING gin (description gin_trgm_ops)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+        "description, content='transactions', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        "CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+        "INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description); END",
+        "CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+        "INSERT INTO transactions_fts (transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); END",
+        "CREATE TRIGGER transactions_fts_update AFTER UPDATE OF description ON transactions BEGIN "
+        "INSERT INTO transactions_fts (transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+        "INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description); END",
+    ],
+}
+
+
+def add_search_ddl(table: Table) -> None:
+    """Create the search structures whenever `table` is created through metadata.create_all"""
+    for dialect, statements in SEARCH_DDL.items():
+        for statement in statements:
+            event.listen(table, "after_create", DDL(statement).execute_if(dialect=dialect))
+    event.listen(table, "before_drop", DDL("DROP TABLE IF EXISTS transactions_fts").execute_if(dialect="sqlite"))
+
+
+add_search_ddl(Transaction.__table__)
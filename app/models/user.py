@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, false
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -10,8 +10,23 @@ class User(Base):
     first_name = Column(String)
     last_name = Column(String)
     hashed_password = Column(String)
+    # Set while a large account's data is being deleted in the background; the user is hidden meanwhile
+    deleted_at = Column(DateTime, nullable=True)
+    # Bumped on every write to the user's data; drives ETag / Last-Modified on read endpoints
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
+    data_updated_at = Column(DateTime, nullable=True)  # naive UTC
+    # Opt-in to the nightly "budgets.rollover" job, optionally carrying unspent amounts forward
+    budget_rollover_enabled = Column(Boolean, nullable=False, default=False, server_default=false())
+    budget_rollover_carry_over = Column(Boolean, nullable=False, default=False, server_default=false())
 
-    # Relationships
-    categories = relationship("Category", back_populates="user", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan")
-    budgets = relationship("Budget", back_populates="user", cascade="all, delete-orphan")
+    # Relationships. Child rows are removed by ON DELETE CASCADE (passive_deletes keeps the ORM from
+    # loading them); UserRepository.delete_account deletes them set-based where FKs are not enforced.
+    categories = relationship("Category", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    archived_transactions = relationship(
+        "ArchivedTransaction", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    budgets = relationship("Budget", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    recurring_rules = relationship(
+        "RecurringRule", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
@@ -3,11 +3,19 @@ from .user_repository import UserRepository
 from .category_repository import CategoryRepository
 from .transaction_repository import TransactionRepository
 from .budget_repository import BudgetRepository
+from .revoked_token_repository import RevokedTokenRepository
+from .archive_repository import ArchiveRepository
+from .job_repository import JobRepository
+from .idempotency_repository import IdempotencyRepository
 
 __all__ = [
     "BaseRepository",
     "UserRepository",
     "CategoryRepository",
     "TransactionRepository",
-    "BudgetRepository"
+    "BudgetRepository",
+    "RevokedTokenRepository",
+    "ArchiveRepository",
+    "JobRepository",
+    "IdempotencyRepository"
 ]
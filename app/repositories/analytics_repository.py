@@ -0,0 +1,72 @@
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Date, cast, func, literal_column
+from sqlalchemy.orm import Session
+
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.category import Category
+from app.models.transaction import Transaction, TransactionType
+from app.repositories.archive_repository import ArchiveRepository
+
+INTERVALS = ("day", "week", "month")
+
+# (bucket start, category id or None, type) -> total
+BucketTotals = Dict[Tuple[date, Optional[int], TransactionType], int]
+
+
+class AnalyticsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.archive = ArchiveRepository(db)
+
+    def _bucket(self, column, interval: str):
+        """SQL expression truncating a date column to the first day of its day / ISO week / month"""
+        if interval not in INTERVALS:
+            raise ValueError(f"Unknown interval {interval!r}")
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Inlined rather than bound, so SELECT and GROUP BY render the identical expression
+            return cast(func.date_trunc(literal_column(f"'{interval}'"), column), Date)
+        if interval == "week":
+            # Forward to Sunday (or stay on it), then back to that week's Monday
+            return func.date(column, "weekday 0", "-6 days")
+        if interval == "month":
+            return func.date(column, "start of month")
+        return func.date(column)
+
+    def get_bucket_totals(
+        self, user_id: int, start_date: date, end_date: date, interval: str, by_category: bool = False
+    ) -> Tuple[BucketTotals, Dict[int, str]]:
+        """Income and expense totals per bucket (and per category), summed by the database.
+
+        Returns the totals plus the names of the categories that appear in them. Archived transactions
+        are included when the range reaches the archive.
+        """
+        models = [Transaction]
+        if self.archive.reaches_archive(user_id, start_date):
+            models.append(ArchivedTransaction)
+
+        totals: BucketTotals = {}
+        names: Dict[int, str] = {}
+        for model in models:
+            bucket = self._bucket(model.transaction_date, interval).label("bucket")
+            columns = [bucket, model.type]
+            if by_category:
+                columns += [Category.id, Category.name]
+            query = self.db.query(*columns, func.sum(model.amount)).filter(
+                model.user_id == user_id,
+                model.transaction_date >= start_date,
+                model.transaction_date <= end_date,
+            )
+            if by_category:
+                query = query.join(Category, Category.id == model.category_id)
+            rows = query.group_by(*columns).all()
+
+            for row in rows:
+                bucket_start = row[0] if isinstance(row[0], date) else date.fromisoformat(row[0])
+                category_id = row[2] if by_category else None
+                if by_category:
+                    names[category_id] = row[3]
+                key = (bucket_start, category_id, row[1])
+                totals[key] = totals.get(key, 0) + int(row[-1] or 0)
+        return totals, names
@@ -0,0 +1,69 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.transaction import Transaction
+from app.utils.dates import add_months, month_start
+from .base import BaseRepository
+
+ARCHIVED_COLUMNS = [
+    "id", "user_id", "category_id", "amount", "transaction_date", "type", "payment_method", "description",
+    "created_at", "updated_at",
+]
+
+
+def archive_cutoff(horizon_months: Optional[int] = None, today: Optional[date] = None) -> date:
+    """Transactions dated before this day belong in the archive (whole months are archived)"""
+    if horizon_months is None:
+        horizon_months = settings.archive_horizon_months
+    return add_months(month_start(today or date.today()), -horizon_months)
+
+
+class ArchiveRepository(BaseRepository[ArchivedTransaction]):
+    def __init__(self, db: Session):
+        super().__init__(db, ArchivedTransaction)
+
+    def latest_archived_date(self, user_id: int) -> Optional[date]:
+        """Newest archived transaction date for a user, answered from the (user_id, transaction_date) index"""
+        return (
+            self.db.query(func.max(ArchivedTransaction.transaction_date))
+            .filter(ArchivedTransaction.user_id == user_id)
+            .scalar()
+        )
+
+    def reaches_archive(self, user_id: int, start_date: Optional[date] = None) -> bool:
+        """Whether reads from `start_date` onwards (or the whole history) need archived rows"""
+        if start_date is not None and start_date >= archive_cutoff():
+            # Nothing newer than the horizon is ever archived, so skip the lookup entirely
+            return False
+        latest = self.latest_archived_date(user_id)
+        return latest is not None and (start_date is None or latest >= start_date)
+
+    def archive_before(self, cutoff: date, batch_size: Optional[int] = None) -> int:
+        """Move transactions dated before `cutoff` into the archive in id-ordered, separately committed batches"""
+        batch_size = batch_size or settings.archive_batch_size
+        moved = 0
+        while True:
+            ids: List[int] = list(self.db.execute(
+                select(Transaction.id)
+                .where(Transaction.transaction_date < cutoff)
+                .order_by(Transaction.id)
+                .limit(batch_size)
+            ).scalars())
+            if not ids:
+                return moved
+
+            source = select(
+                *[Transaction.__table__.c[name] for name in ARCHIVED_COLUMNS],
+                literal(datetime.now()).label("archived_at"),
+            ).where(Transaction.id.in_(ids))
+            self.db.execute(insert(ArchivedTransaction).from_select(ARCHIVED_COLUMNS + ["archived_at"], source))
+            self.db.execute(
+                delete(Transaction).where(Transaction.id.in_(ids)).execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            moved += len(ids)
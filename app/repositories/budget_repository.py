@@ -1,15 +1,38 @@
+from dataclasses import dataclass
 from datetime import date
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
-from sqlalchemy import func, text, case
+from sqlalchemy import func, insert, text, case
 from sqlalchemy.orm import Session
 
-from app.models.budget import Budget
+from app.models.budget import Budget, PredictionType
 from app.models.transaction import Transaction, TransactionType
 from .base import BaseRepository
 
 
+@dataclass(slots=True)
+class BudgetSpending:
+    """A budget's columns and its spending, built straight from a result row.
+
+    The service fills in the derived fields and the row is then validated as a BudgetResponse as is.
+    """
+
+    id: int
+    category_id: int
+    amount: int
+    start_date: date
+    end_date: date
+    prediction_enabled: bool
+    prediction_type: Optional[PredictionType]
+    prediction_days_count: Optional[int]
+    total_spent: int
+    status: Optional[int] = None
+    remaining_budget: Optional[int] = None
+    prediction: Optional[dict] = None
+    forecast: Optional[dict] = None
+
+
 class BudgetRepository(BaseRepository[Budget]):
     def __init__(self, db: Session):
         super().__init__(db, Budget)
@@ -182,6 +205,84 @@ class BudgetRepository(BaseRepository[Budget]):
 
         return query.count()
 
+    def get_rollover_sources(
+            self, user_id: int, as_of: date, ended_since: Optional[date] = None
+    ) -> List[Tuple[Budget, int]]:
+        """Budgets covering `as_of` with their expense totals, in one query.
+
+        With `ended_since`, budgets that ended between that day and the day before `as_of` instead.
+        """
+        query = (
+            self.db.query(Budget, func.coalesce(func.sum(Transaction.amount), 0))
+            .outerjoin(
+                Transaction,
+                (Budget.user_id == Transaction.user_id)
+                & (Budget.category_id == Transaction.category_id)
+                & (Transaction.type == TransactionType.EXPENSE)
+                & (Transaction.transaction_date >= Budget.start_date)
+                & (Transaction.transaction_date <= Budget.end_date),
+            )
+            .filter(Budget.user_id == user_id)
+        )
+        if ended_since is not None:
+            query = query.filter(Budget.end_date < as_of, Budget.end_date >= ended_since)
+        else:
+            query = query.filter(Budget.start_date <= as_of, Budget.end_date >= as_of)
+        return [(budget, int(total_spent)) for budget, total_spent in query.group_by(Budget.id).order_by(Budget.id)]
+
+    def get_overlapping_periods(
+            self, user_id: int, category_ids: List[int], start_date: date, end_date: date
+    ) -> Dict[int, List[Tuple[date, date]]]:
+        """Periods of the user's budgets in these categories that touch [start_date, end_date], by category.
+
+        One query for a whole set of candidate budgets: pass the bounds of all their periods and check
+        each candidate against its category's periods.
+        """
+        rows = (
+            self.db.query(Budget.category_id, Budget.start_date, Budget.end_date)
+            .filter(
+                Budget.user_id == user_id,
+                Budget.category_id.in_(category_ids),
+                Budget.start_date <= end_date,
+                Budget.end_date >= start_date,
+            )
+            .all()
+        )
+        periods: Dict[int, List[Tuple[date, date]]] = {}
+        for category_id, period_start, period_end in rows:
+            periods.setdefault(category_id, []).append((period_start, period_end))
+        return periods
+
+    def create_many(self, rows: List[dict]) -> List[Budget]:
+        """Insert budgets with multi-row INSERT ... RETURNING; does not commit"""
+        if not rows:
+            return []
+        return list(self.db.scalars(insert(Budget).returning(Budget), rows))
+
+    def get_daily_spending(self, budget_ids: List[int], until: date) -> Dict[int, Dict[date, int]]:
+        """Expense totals per day within each budget's period up to `until`, for a whole page of budgets in one query"""
+        if not budget_ids:
+            return {}
+        rows = (
+            self.db.query(Budget.id, Transaction.transaction_date, func.sum(Transaction.amount))
+            .join(
+                Transaction,
+                (Budget.user_id == Transaction.user_id)
+                & (Budget.category_id == Transaction.category_id)
+                & (Transaction.type == TransactionType.EXPENSE)
+                & (Transaction.transaction_date >= Budget.start_date)
+                & (Transaction.transaction_date <= Budget.end_date)
+                & (Transaction.transaction_date <= until),
+            )
+            .filter(Budget.id.in_(budget_ids))
+            .group_by(Budget.id, Transaction.transaction_date)
+            .all()
+        )
+        spending: Dict[int, Dict[date, int]] = {}
+        for budget_id, day, total in rows:
+            spending.setdefault(budget_id, {})[day] = int(total)
+        return spending
+
     def get_budgets_with_spending_data(
             self,
             user_id: int,
@@ -190,11 +291,19 @@ class BudgetRepository(BaseRepository[Budget]):
             sort_by: str = "created_at",
             sort_order: str = "desc",
             status: int = None,
-    ) -> List[dict]:
+    ) -> List[BudgetSpending]:
         """Get budgets for a user with spending data for their date ranges (with pagination and optional status filter)"""
         query = (
             self.db.query(
-                Budget, func.coalesce(func.sum(Transaction.amount), 0).label("total_spent")
+                Budget.id,
+                Budget.category_id,
+                Budget.amount,
+                Budget.start_date,
+                Budget.end_date,
+                Budget.prediction_enabled,
+                Budget.prediction_type,
+                Budget.prediction_days_count,
+                func.coalesce(func.sum(Transaction.amount), 0).label("total_spent"),
             )
             .outerjoin(
                 Transaction,
@@ -256,15 +365,7 @@ class BudgetRepository(BaseRepository[Budget]):
             query = query.order_by(Budget.id)
 
         # Apply pagination
-        paginated_results = query.offset(skip).limit(limit).all()
-
-        results = []
-        for budget, total_spent in paginated_results:
-            results.append(
-                {"budget": budget, "total_spent": int(total_spent) if total_spent else 0}
-            )
-
-        return results
+        return [BudgetSpending(*row) for row in query.offset(skip).limit(limit)]
 
     def get_total_active_budgets(self, user_id: int) -> int:
         params = {"user_id": user_id}
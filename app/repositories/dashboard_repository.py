@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional
 import calendar
+from dataclasses import dataclass
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, extract, case
 from datetime import date
@@ -8,13 +9,46 @@ from app.models.budget import Budget
 from app.models.category import Category
 
 
+# Result rows, validated by the dashboard schemas through their attributes
+
+@dataclass(slots=True)
+class SummaryRow:
+    total_income: int
+    total_expenses: int
+    total_expenses_today: int
+
+
+@dataclass(slots=True)
+class BudgetUsageRow:
+    category: str
+    spent: int
+    limit: int
+    percentage: float
+
+
+@dataclass(slots=True)
+class RecentTransactionRow:
+    id: int
+    amount: int
+    type: str
+    category: str
+    transaction_date: date
+
+
+@dataclass(slots=True)
+class TopExpenseRow:
+    category: str
+    amount: int
+    percentage: float
+
+
 class DashboardRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def get_monthly_summary(
         self, user_id: int, period_start: date, period_end: date
-    ) -> Dict[str, int]:
+    ) -> SummaryRow:
         income_sum = (
             self.db.query(func.sum(Transaction.amount))
             .filter(
@@ -60,18 +94,14 @@ class DashboardRepository:
         else:
             expense_sum_today = 0
 
-        return {
-            "total_income": income_sum,
-            "total_expenses": expense_sum,
-            "total_expenses_today": expense_sum_today,
-        }
+        return SummaryRow(income_sum, expense_sum, expense_sum_today)
 
     def get_budgets_with_spending(
         self, user_id: int, period_start: date, period_end: date, limit: int = 3
-    ) -> List[Dict[str, Any]]:
+    ) -> List[BudgetUsageRow]:
         budgets = (
             self.db.query(
-                Budget,
+                Budget.amount,
                 Category.name,
                 func.coalesce(
                     func.sum(
@@ -107,20 +137,12 @@ class DashboardRepository:
             .all()
         )
 
-        result = []
-        for budget, category_name, spent in budgets:
-            result.append(
-                {
-                    "category": category_name,
-                    "spent": int(spent),
-                    "limit": budget.amount,
-                    "percentage": (
-                        round((spent / budget.amount) * 100, 2) if budget.amount > 0 else 0
-                    ),
-                }
+        return [
+            BudgetUsageRow(
+                category_name, int(spent), amount, round((spent / amount) * 100, 2) if amount > 0 else 0
             )
-
-        return result
+            for amount, category_name, spent in budgets
+        ]
 
     def get_recent_transactions(
         self,
@@ -128,9 +150,15 @@ class DashboardRepository:
         limit: int = 5,
         period_start: Optional[date] = None,
         period_end: Optional[date] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[RecentTransactionRow]:
         query = (
-            self.db.query(Transaction, Category.name.label("category_name"))
+            self.db.query(
+                Transaction.id,
+                Transaction.amount,
+                Transaction.type,
+                Category.name,
+                Transaction.transaction_date,
+            )
             .join(Category, Transaction.category_id == Category.id)
             .filter(Transaction.user_id == user_id)
         )
@@ -146,23 +174,14 @@ class DashboardRepository:
 
         transactions = query.order_by(Transaction.transaction_date.desc()).limit(limit).all()
 
-        result = []
-        for transaction, category_name in transactions:
-            result.append(
-                {
-                    "id": transaction.id,
-                    "amount": transaction.amount,
-                    "type": transaction.type.value,
-                    "category": category_name,
-                    "transaction_date": transaction.transaction_date,
-                }
-            )
-
-        return result
+        return [
+            RecentTransactionRow(transaction_id, amount, transaction_type.value, category_name, transaction_date)
+            for transaction_id, amount, transaction_type, category_name, transaction_date in transactions
+        ]
 
     def get_top_expenses(
         self, user_id: int, period_start: date, period_end: date, limit: int = 3
-    ) -> List[Dict[str, Any]]:
+    ) -> List[TopExpenseRow]:
         expense_query = (
             self.db.query(Category.name, func.sum(Transaction.amount).label("total"))
             .join(Transaction, Transaction.category_id == Category.id)
@@ -182,16 +201,9 @@ class DashboardRepository:
 
         total_expenses = sum(amount for _, amount in expense_query)
 
-        result = []
-        for category_name, amount in expense_query:
-            result.append(
-                {
-                    "category": category_name,
-                    "amount": amount,
-                    "percentage": (
-                        round((amount / total_expenses) * 100, 2) if total_expenses > 0 else 0
-                    ),
-                }
+        return [
+            TopExpenseRow(
+                category_name, amount, round((amount / total_expenses) * 100, 2) if total_expenses > 0 else 0
             )
-
-        return result
+            for category_name, amount in expense_query
+        ]
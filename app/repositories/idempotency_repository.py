@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.idempotency_key import IdempotencyKey
+from .base import BaseRepository
+
+
+class IdempotencyRepository(BaseRepository[IdempotencyKey]):
+    def __init__(self, db: Session):
+        super().__init__(db, IdempotencyKey)
+
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        return self.db.query(IdempotencyKey).filter(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key).first()
+
+    def claim(
+            self, user_id: int, key: str, request_hash: str, expires_at: datetime, now: datetime
+    ) -> Tuple[IdempotencyKey, bool]:
+        """Record that a request with this key is in progress.
+
+        Returns the row and whether this call claimed it. The claim is committed straight away so a
+        concurrent duplicate finds it; when two arrive together the unique constraint lets only one insert.
+        An expired row is replaced as if the key had never been used.
+        """
+        existing = self.get(user_id, key)
+        if existing is not None and existing.expires_at <= now:
+            self.db.delete(existing)
+            self.db.flush()
+            existing = None
+        if existing is not None:
+            return existing, False
+
+        record = IdempotencyKey(user_id=user_id, key=key, request_hash=request_hash, expires_at=expires_at)
+        try:
+            with self.db.begin_nested():
+                self.db.add(record)
+        except IntegrityError:
+            # Lost the race to a concurrent duplicate
+            self.db.commit()
+            return self.get(user_id, key), False
+        self.db.commit()
+        return record, True
+
+    def complete(self, record: IdempotencyKey, status_code: int, response_body: bytes) -> IdempotencyKey:
+        return self.update(record, {"status_code": status_code, "response_body": response_body})
+
+    def release(self, record_id: int) -> None:
+        """Forget an in-progress claim so the client can retry with the same key"""
+        self.db.query(IdempotencyKey).filter(IdempotencyKey.id == record_id).delete(synchronize_session=False)
+        self.db.commit()
+
+    def delete_expired(self, now: datetime) -> int:
+        deleted = self.db.query(IdempotencyKey).filter(IdempotencyKey.expires_at <= now).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JobStatus
+from .base import BaseRepository
+
+STALE_JOB_ERROR = "Worker lost: the job was still running when its lock timed out"
+
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self, db: Session):
+        super().__init__(db, Job)
+
+    def enqueue(self, name: str, payload: dict, max_attempts: int, run_at: Optional[datetime] = None) -> Job:
+        return self.create({
+            "name": name,
+            "payload": payload,
+            "max_attempts": max_attempts,
+            "run_at": run_at or datetime.now(),
+        })
+
+    def claim_next(self, worker_id: str, now: datetime) -> Optional[Job]:
+        """Lock the oldest due job for this worker, or return None when nothing is due.
+
+        On PostgreSQL concurrent workers skip rows another worker is claiming (FOR UPDATE SKIP LOCKED);
+        the status check on the UPDATE keeps the claim exclusive on databases without row locks.
+        """
+        candidate = (
+            self.db.query(Job.id)
+            .filter(Job.status == JobStatus.QUEUED, Job.run_at <= now)
+            .order_by(Job.run_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar()
+        )
+        if candidate is None:
+            self.db.rollback()
+            return None
+
+        claimed = self.db.execute(
+            update(Job)
+            .where(Job.id == candidate, Job.status == JobStatus.QUEUED)
+            .values(status=JobStatus.RUNNING, locked_by=worker_id, locked_at=now, attempts=Job.attempts + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+        return self.get_by_id(candidate) if claimed else None
+
+    def mark_succeeded(self, job: Job, now: datetime) -> Job:
+        return self.update(job, {"status": JobStatus.SUCCEEDED, "finished_at": now, "last_error": None})
+
+    def mark_failed(self, job: Job, error: str, now: datetime, retry_at: Optional[datetime] = None) -> Job:
+        """Put the job back in the queue for `retry_at`, or fail it for good when no retry is given"""
+        if retry_at is not None:
+            values = {"status": JobStatus.QUEUED, "run_at": retry_at, "locked_by": None, "locked_at": None}
+        else:
+            values = {"status": JobStatus.FAILED, "finished_at": now}
+        values["last_error"] = error
+        return self.update(job, values)
+
+    def has_pending(self, name: str) -> bool:
+        """Whether a job with this name is queued or running"""
+        return self.db.query(Job.id).filter(
+            Job.name == name,
+            Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+        ).first() is not None
+
+    def requeue_stale(self, locked_before: datetime, now: datetime) -> int:
+        """Release jobs whose worker died mid-run so another worker can pick them up; returns how many.
+
+        Jobs locked before `locked_before` are assumed orphaned. Those that have used all their attempts
+        (a job that keeps killing its worker, say) are failed instead of being run again.
+        """
+        stale = (Job.status == JobStatus.RUNNING, Job.locked_at < locked_before)
+        self.db.query(Job).filter(*stale, Job.attempts >= Job.max_attempts).update(
+            {"status": JobStatus.FAILED, "finished_at": now, "last_error": STALE_JOB_ERROR},
+            synchronize_session=False
+        )
+        released = self.db.query(Job).filter(*stale).update(
+            {"status": JobStatus.QUEUED, "locked_by": None, "locked_at": None},
+            synchronize_session=False
+        )
+        self.db.commit()
+        return released
+
+    def delete_finished_before(self, cutoff: datetime) -> int:
+        deleted = self.db.query(Job).filter(
+            Job.status.in_([JobStatus.SUCCEEDED, JobStatus.FAILED]),
+            Job.finished_at < cutoff
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
@@ -0,0 +1,41 @@
+from datetime import date
+from typing import List
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from .base import BaseRepository
+
+
+class RecurringRuleRepository(BaseRepository[RecurringRule]):
+    def __init__(self, db: Session):
+        super().__init__(db, RecurringRule)
+
+    def get_due(self, as_of: date, limit: int, after_id: int = 0) -> List[RecurringRule]:
+        """Active rules with an occurrence due on or before `as_of`, in id order after `after_id`"""
+        return (
+            self.db.query(RecurringRule)
+            .filter(
+                RecurringRule.active.is_(True),
+                RecurringRule.next_run_date <= as_of,
+                RecurringRule.id > after_id,
+            )
+            .order_by(RecurringRule.id)
+            .limit(limit)
+            .all()
+        )
+
+    def count_by_category_id(self, category_id: int) -> int:
+        return self.db.query(func.count(RecurringRule.id)).filter(RecurringRule.category_id == category_id).scalar()
+
+    def delete(self, id: int) -> bool:
+        """Delete a rule, detaching the transactions it created (also where foreign keys are not enforced)"""
+        self.db.execute(
+            update(Transaction)
+            .where(Transaction.recurring_rule_id == id)
+            .values(recurring_rule_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        return super().delete(id)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Set
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.revoked_token import RevokedToken
+from .base import BaseRepository
+
+
+class RevokedTokenRepository(BaseRepository[RevokedToken]):
+    def __init__(self, db: Session):
+        super().__init__(db, RevokedToken)
+
+    def revoke(self, jti: str, user_id: int, expires_at: datetime) -> bool:
+        """Record a revoked token; returns False when it was already revoked.
+
+        A single INSERT .. ON CONFLICT DO NOTHING on the unique jti, so of two concurrent revocations
+        of the same token exactly one returns True and neither fails.
+        """
+        dialect = self.db.get_bind(RevokedToken).dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(RevokedToken).values(jti=jti, user_id=user_id, expires_at=expires_at)\
+            .on_conflict_do_nothing(index_elements=["jti"])
+        inserted = self.db.execute(statement).rowcount == 1
+        self.db.commit()
+        return inserted
+
+    def is_revoked(self, jti: str) -> bool:
+        return self.db.query(RevokedToken.id).filter(RevokedToken.jti == jti).first() is not None
+
+    def get_active_jtis(self, now: datetime) -> Set[str]:
+        """JTIs of revoked tokens that have not expired yet"""
+        rows = self.db.query(RevokedToken.jti).filter(RevokedToken.expires_at > now).all()
+        return {jti for (jti,) in rows}
+
+    def delete_expired(self, now: datetime) -> int:
+        deleted = self.db.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
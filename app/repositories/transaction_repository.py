@@ -1,38 +1,274 @@
-from sqlalchemy.orm import Session, joinedload
-from app.models.transaction import Transaction
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, literal, literal_column, or_, select, text, tuple_, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.category import Category
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
+from app.repositories.archive_repository import ArchiveRepository
 from app.repositories.base import BaseRepository
+from app.schemas.transaction import TransactionFilters
+
+# Listing sort keys clients may ask for -> column; each but id is led by user_id in a composite index
+# (see Transaction.__table_args__), so sorted pages are read in index order. "date" is the API's default.
+SORT_FIELDS = {
+    "transaction_date": "transaction_date",
+    "date": "transaction_date",
+    "created_at": "created_at",
+    "amount": "amount",
+    "id": "id",
+}
+
+
+@dataclass(slots=True)
+class CategoryRow:
+    id: int
+    name: str
+
+
+@dataclass(slots=True)
+class TransactionRow:
+    """A listed transaction: the columns of TransactionResponse, validated from its attributes"""
+
+    id: int
+    amount: int
+    transaction_date: date
+    type: TransactionType
+    payment_method: PaymentMethod
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    category: Optional[CategoryRow]
+
+
+def _listing_columns(model):
+    """Columns selected for TransactionRow from `model` (live or archived transactions) outer-joined to Category"""
+    return (
+        model.id,
+        model.amount,
+        model.transaction_date,
+        model.type,
+        model.payment_method,
+        model.description,
+        model.created_at,
+        model.updated_at,
+        Category.id,
+        Category.name,
+    )
+
+
+def _to_row(row) -> TransactionRow:
+    *columns, category_id, category_name = row
+    return TransactionRow(*columns, CategoryRow(category_id, category_name) if category_id is not None else None)
 
 
 class TransactionRepository(BaseRepository[Transaction]):
     def __init__(self, db: Session):
         super().__init__(db, Transaction)
+        self.archive = ArchiveRepository(db)
 
-    def get_transaction_with_category(self, user_id: int, skip: int = 0, limit: int = 100, sort_by: str = "transaction_date", sort_order: str = "desc"):
-        query = self.db.query(Transaction)\
-            .options(joinedload(Transaction.category))\
-            .filter(Transaction.user_id == user_id)
-
-        # Apply sorting
-        if sort_by == "created_at":
-            if sort_order == "desc":
-                query = query.order_by(Transaction.created_at.desc())
-            else:
-                query = query.order_by(Transaction.created_at.asc())
-        elif sort_by == "transaction_date":
-            if sort_order == "desc":
-                query = query.order_by(Transaction.transaction_date.desc())
-            else:
-                query = query.order_by(Transaction.transaction_date.asc())
-        else:
-            # Default fallback to id sorting
+    def get_transaction_with_category(
+            self,
+            user_id: int,
+            skip: int = 0,
+            limit: int = 100,
+            sort_by: str = "transaction_date",
+            sort_order: str = "desc",
+            filters: Optional[TransactionFilters] = None,
+    ) -> List[TransactionRow]:
+        """A page of the user's transactions with their categories, archived ones included when kept.
+
+        Only the listed columns are selected, so no entities are loaded into the session.
+        `sort_by` must be one of SORT_FIELDS; rows with equal sort keys are ordered by id.
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field {sort_by!r}")
+        if self.archive.reaches_archive(user_id, filters.start_date if filters else None):
+            return self._get_federated_page(user_id, skip, limit, sort_by, sort_order, filters)
+
+        query = self._listing_query(Transaction).filter(Transaction.user_id == user_id)
+        query = self._apply_filters(query, Transaction, filters)
+
+        sort_column = getattr(Transaction, SORT_FIELDS[sort_by])
+        if sort_column is Transaction.id:
             query = query.order_by(Transaction.id)
+        elif sort_order == "desc":
+            query = query.order_by(sort_column.desc(), Transaction.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), Transaction.id.asc())
+
+        return [_to_row(row) for row in query.offset(skip).limit(limit)]
 
-        return query.offset(skip).limit(limit).all()\
+    def _listing_query(self, model):
+        return self.db.query(*_listing_columns(model)).outerjoin(Category, Category.id == model.category_id)
 
+    @staticmethod
+    def _apply_filters(query, model, filters: Optional[TransactionFilters]):
+        """Narrow a query on `model` (live or archived transactions) by the listing filters"""
+        if filters is None:
+            return query
+        if filters.start_date is not None:
+            query = query.filter(model.transaction_date >= filters.start_date)
+        if filters.end_date is not None:
+            query = query.filter(model.transaction_date <= filters.end_date)
+        if filters.category_id:
+            query = query.filter(model.category_id.in_(filters.category_id))
+        if filters.type is not None:
+            query = query.filter(model.type == filters.type)
+        if filters.payment_method:
+            query = query.filter(model.payment_method.in_(filters.payment_method))
+        if filters.min_amount is not None:
+            query = query.filter(model.amount >= filters.min_amount)
+        if filters.max_amount is not None:
+            query = query.filter(model.amount <= filters.max_amount)
+        return query
 
-    def count_by_user_id(self, user_id: int) -> int:
-        return self.db.query(Transaction).filter(Transaction.user_id == user_id).count()
+    def _get_federated_page(
+            self, user_id: int, skip: int, limit: int, sort_by: str, sort_order: str, filters: Optional[TransactionFilters]
+    ) -> List[TransactionRow]:
+        """Page over live and archived transactions as one list.
+
+        The page is chosen on a narrow UNION ALL of (id, sort key) from both tables, then only the
+        rows on that page are loaded with their categories.
+        """
+        sort_column = SORT_FIELDS[sort_by]
+
+        def keys(model, archived: bool):
+            return self._apply_filters(select(
+                model.id.label("id"),
+                getattr(model, sort_column).label("sort_key"),
+                literal(archived).label("archived"),
+            ).where(model.user_id == user_id), model, filters)
+
+        combined = union_all(keys(Transaction, False), keys(ArchivedTransaction, True)).subquery()
+        sort_key, tiebreak = combined.c.sort_key, combined.c.id
+        if sort_column != "id" and sort_order == "desc":
+            sort_key, tiebreak = sort_key.desc(), tiebreak.desc()
+        page = self.db.execute(
+            select(combined.c.id, combined.c.archived)
+            .order_by(sort_key, tiebreak)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
+        live_ids = [row.id for row in page if not row.archived]
+        archived_ids = [row.id for row in page if row.archived]
+        rows = {}
+        for model, ids in ((Transaction, live_ids), (ArchivedTransaction, archived_ids)):
+            if ids:
+                for item in map(_to_row, self._listing_query(model).filter(model.id.in_(ids))):
+                    rows[(model is ArchivedTransaction, item.id)] = item
+        return [rows[(bool(row.archived), row.id)] for row in page]
+
+    def search(
+            self,
+            user_id: int,
+            terms: List[str],
+            limit: int,
+            after: Optional[Tuple[date, int]] = None,
+            start_date: Optional[date] = None,
+            end_date: Optional[date] = None,
+            category_id: Optional[int] = None,
+            transaction_type: Optional[TransactionType] = None,
+            min_amount: Optional[int] = None,
+            max_amount: Optional[int] = None,
+    ) -> List[TransactionRow]:
+        """Live transactions whose description matches every term as a word prefix, newest first.
+
+        Keyset-paginated on (transaction_date, id): pass the last row's pair as `after` for the next page.
+        """
+        query = self._listing_query(Transaction)\
+            .filter(Transaction.user_id == user_id, self._search_condition(terms))
+
+        if start_date is not None:
+            query = query.filter(Transaction.transaction_date >= start_date)
+        if end_date is not None:
+            query = query.filter(Transaction.transaction_date <= end_date)
+        if category_id is not None:
+            query = query.filter(Transaction.category_id == category_id)
+        if transaction_type is not None:
+            query = query.filter(Transaction.type == transaction_type)
+        if min_amount is not None:
+            query = query.filter(Transaction.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(Transaction.amount <= max_amount)
+        if after is not None:
+            query = query.filter(tuple_(Transaction.transaction_date, Transaction.id) < tuple_(*after))
+
+        query = query.order_by(Transaction.transaction_date.desc(), Transaction.id.desc()).limit(limit)
+        return [_to_row(row) for row in query]
+
+    def _search_condition(self, terms: List[str]):
+        if self.db.get_bind(Transaction).dialect.name == "postgresql":
+            return or_(
+                # GIN-indexed tsvector; "term:*" matches words starting with term
+                literal_column("transactions.search_vector").op("@@")(
+                    func.to_tsquery(literal_column("'simple'"), " & ".join(f"{term}:*" for term in terms))
+                ),
+                # Typo tolerance through the trigram index: a description word similar to the query
+                literal(" ".join(terms)).op("<%")(Transaction.description),
+            )
+        # SQLite FTS5: quoted terms followed by * are prefix queries, all of which must match
+        match = " ".join(f'"{term}"*' for term in terms)
+        return text("transactions.id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH :search_match)")\
+            .bindparams(search_match=match)
+
+    def create_many(self, rows: List[dict]) -> int:
+        """Insert recurring-rule occurrences with one multi-row INSERT; returns how many were new.
+
+        Occurrences already present for their (recurring_rule_id, transaction_date) are skipped, so a
+        batch interrupted after its insert can safely be inserted again. Does not commit.
+        """
+        if not rows:
+            return 0
+        dialect = self.db.get_bind(Transaction).dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(Transaction).values(rows).on_conflict_do_nothing(
+            index_elements=["recurring_rule_id", "transaction_date"]
+        )
+        return self.db.execute(statement).rowcount
+
+    def count_by_user_id(self, user_id: int, filters: Optional[TransactionFilters] = None) -> int:
+        """Count the user's transactions matching the listing filters, archived ones included"""
+        total = self._apply_filters(
+            self.db.query(func.count(Transaction.id)).filter(Transaction.user_id == user_id), Transaction, filters
+        ).scalar()
+        if self.archive.reaches_archive(user_id, filters.start_date if filters else None):
+            total += self._apply_filters(
+                self.db.query(func.count(ArchivedTransaction.id)).filter(ArchivedTransaction.user_id == user_id),
+                ArchivedTransaction,
+                filters,
+            ).scalar()
+        return total
 
     def count_by_category_id(self, category_id: int) -> int:
-        """Count transactions for a specifict category"""
-        return self.db.query(Transaction).filter(Transaction.category_id == category_id).count()
+        """Count transactions for a specifict category, archived ones included"""
+        live = self.db.query(Transaction).filter(Transaction.category_id == category_id).count()
+        archived = self.db.query(ArchivedTransaction).filter(ArchivedTransaction.category_id == category_id).count()
+        return live + archived
+
+    def get_spending_total(self, user_id: int, category_id: int, start_date: date, end_date: date, exclude_transaction_id: Optional[int] = None) -> int:
+        """Sum expenses for a category between two dates, reading the archive only when the range reaches it"""
+        models = [Transaction]
+        if self.archive.reaches_archive(user_id, start_date):
+            models.append(ArchivedTransaction)
+
+        total = 0
+        for model in models:
+            query = self.db.query(func.coalesce(func.sum(model.amount), 0)).filter(
+                model.user_id == user_id,
+                model.category_id == category_id,
+                model.type == TransactionType.EXPENSE,
+                model.transaction_date >= start_date,
+                model.transaction_date <= end_date
+            )
+
+            # Exclude specific transaction if updating
+            if exclude_transaction_id:
+                query = query.filter(model.id != exclude_transaction_id)
+
+            total += int(query.scalar() or 0)
+        return total
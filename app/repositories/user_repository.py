@@ -1,19 +1,99 @@
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
 from app.models.user import User
 from .base import BaseRepository
 
+# Tables owned by a user, children before parents so deletes also work where FKs are not enforced
+ACCOUNT_MODELS = (Transaction, ArchivedTransaction, RecurringRule, Budget, Category)
+
 
 class UserRepository(BaseRepository[User]):
     def __init__(self, db: Session):
         super().__init__(db, User)
 
+    def get_by_id(self, id: int) -> Optional[User]:
+        return self.db.query(User).filter(User.id == id, User.deleted_at.is_(None)).first()
+
     def get_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
 
     def email_exists(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
+        # Accounts pending deletion still hold their email until they are gone
         query = self.db.query(User.id).filter(User.email == email)
         if exclude_user_id:
             query = query.filter(User.id != exclude_user_id)
         return query.first() is not None
+
+    def get_data_version(self, user_id: int) -> Tuple[int, Optional[datetime]]:
+        """Version counter and last change time (naive UTC) of a user's data; (0, None) if unknown"""
+        row = self.db.query(User.data_version, User.data_updated_at).filter(User.id == user_id).first()
+        return (row.data_version or 0, row.data_updated_at) if row else (0, None)
+
+    def bump_data_version(self, user_id: int) -> None:
+        """Mark the user's data as changed. Does not commit: call it before the commit of the write it
+        covers, so that the data and its version change together."""
+        self.db.query(User).filter(User.id == user_id).update(
+            {
+                User.data_version: User.data_version + 1,
+                User.data_updated_at: datetime.now(timezone.utc).replace(tzinfo=None),
+            },
+            synchronize_session=False
+        )
+
+    def bump_data_versions(self, user_ids: List[int]) -> None:
+        """bump_data_version for several users with one UPDATE; does not commit either"""
+        if not user_ids:
+            return
+        self.db.query(User).filter(User.id.in_(user_ids)).update(
+            {
+                User.data_version: User.data_version + 1,
+                User.data_updated_at: datetime.now(timezone.utc).replace(tzinfo=None),
+            },
+            synchronize_session=False
+        )
+
+    def get_budget_rollover_users(self) -> List[Tuple[int, bool]]:
+        """(user id, carry over) of every active user opted in to the nightly budget rollover"""
+        return [
+            (row.id, row.budget_rollover_carry_over)
+            for row in self.db.query(User.id, User.budget_rollover_carry_over)
+            .filter(User.budget_rollover_enabled.is_(True), User.deleted_at.is_(None))
+            .order_by(User.id)
+        ]
+
+    def mark_deleted(self, user: User) -> User:
+        return self.update(user, {"deleted_at": datetime.now()})
+
+    def delete_account(self, user_id: int, batch_size: Optional[int] = None) -> int:
+        """Delete a user and every row they own with set-based DELETEs; nothing is loaded into the session.
+
+        Without `batch_size` everything goes in one transaction. With it, owned rows are deleted in chunks
+        committed one at a time so a background job never holds long locks. Returns the owned rows deleted.
+        """
+        deleted = 0
+        for model in ACCOUNT_MODELS:
+            if not batch_size:
+                deleted += self._delete_where(model, model.user_id == user_id)
+                continue
+            while True:
+                chunk = select(model.id).where(model.user_id == user_id).limit(batch_size).scalar_subquery()
+                count = self._delete_where(model, model.id.in_(chunk))
+                self.db.commit()
+                deleted += count
+                if count < batch_size:
+                    break
+
+        self._delete_where(User, User.id == user_id)
+        self.db.commit()
+        return deleted
+
+    def _delete_where(self, model, condition) -> int:
+        return self.db.execute(delete(model).where(condition).execution_options(synchronize_session=False)).rowcount
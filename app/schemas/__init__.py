@@ -2,12 +2,12 @@ from .user import UserCreate, UserResponse, UserUpdate
 from .category import CategoryCreate, CategoryResponse, CategoryUpdate
 from .transaction import TransactionCreate, TransactionResponse, TransactionUpdate
 from .budget import BudgetCreate, BudgetResponse, BudgetUpdate
-from .auth import Token, LoginRequest
+from .auth import Token, LoginRequest, RefreshRequest, LogoutRequest
 
 __all__ = [
     "UserCreate", "UserResponse", "UserUpdate",
     "CategoryCreate", "CategoryResponse", "CategoryUpdate",
     "TransactionCreate", "TransactionResponse", "TransactionUpdate",
     "BudgetCreate", "BudgetResponse", "BudgetUpdate",
-    "Token", "LoginRequest"
+    "Token", "LoginRequest", "RefreshRequest", "LogoutRequest"
 ]
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+
+class TimeseriesSeries(BaseModel):
+    type: str
+    category_id: Optional[int] = None
+    category: Optional[str] = None
+    # One value per bucket, aligned with TimeseriesData.buckets
+    totals: List[int]
+    cumulative: List[int]
+    moving_average: List[float]
+
+
+class TimeseriesData(BaseModel):
+    interval: str
+    start_date: date
+    end_date: date
+    window: int
+    buckets: List[date]
+    series: List[TimeseriesSeries]
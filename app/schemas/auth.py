@@ -1,12 +1,23 @@
+from typing import Optional
 from pydantic import BaseModel
 
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str
     expires_in: int
+    refresh_expires_in: int
 
 
 class LoginRequest(BaseModel):
     email: str
     password: str
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
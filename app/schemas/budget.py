@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -14,6 +14,17 @@ class BudgetPrediction(BaseModel):
     prediction_type: PredictionType
 
 
+class BudgetForecast(BaseModel):
+    # Average spend per elapsed day so far
+    burn_rate: float
+    projected_spend: int
+    projected_remaining: int
+    # Chance that spending reaches the budget amount by the end of the period (0-1)
+    overrun_probability: float
+    days_elapsed: int
+    days_remaining: int
+
+
 class BudgetBase(BaseModel):
     category_id: int
     amount: int = Field(gt=0, description=ValidationMessages.INVALID_AMOUNT.value)
@@ -65,10 +76,24 @@ class BudgetResponse(BudgetBase):
     prediction_type: Optional[PredictionType] = None
     prediction_days_count: Optional[int] = None
     prediction: Optional[BudgetPrediction] = None
+    forecast: Optional[BudgetForecast] = None
 
     model_config = {"from_attributes": True}
 
 
+class BudgetRollover(BaseModel):
+    # Budgets covering this day are rolled over; defaults to today
+    as_of: Optional[date] = None
+    # Add each budget's unspent amount to its next period
+    carry_over: bool = False
+
+
+class BudgetRolloverResponse(BaseModel):
+    created: List[BudgetResponse]
+    # Budgets whose next period already overlaps a budget of the category
+    skipped: int
+
+
 class TotalActiveBudgetResponse(BaseModel):
     total_active_budgets: int
     remaining_active_budgets: int
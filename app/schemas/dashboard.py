@@ -17,6 +17,8 @@ class BudgetOverview(BaseModel):
     limit: int
     percentage: float
 
+    model_config = {"from_attributes": True}
+
 
 class RecentTransaction(BaseModel):
     id: int
@@ -25,12 +27,16 @@ class RecentTransaction(BaseModel):
     category: str
     transaction_date: date
 
+    model_config = {"from_attributes": True}
+
 
 class TopExpense(BaseModel):
     category: str
     amount: int
     percentage: float
 
+    model_config = {"from_attributes": True}
+
 
 class DashboardData(BaseModel):
     period: str
@@ -0,0 +1,53 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.constants.messages import ValidationMessages
+from app.models.recurring_rule import RecurrenceFrequency
+from app.models.transaction import PaymentMethod, TransactionType
+
+
+class RecurringRuleBase(BaseModel):
+    category_id: int
+    amount: int = Field(gt=0, description=ValidationMessages.INVALID_AMOUNT.value)
+    type: TransactionType
+    payment_method: PaymentMethod
+    description: Optional[str] = None
+    frequency: RecurrenceFrequency
+    # Every N days / weeks / months
+    interval: int = Field(1, ge=1, le=365)
+    # Monthly rules only; defaults to the day of start_date
+    day_of_month: Optional[int] = Field(None, ge=1, le=31)
+    start_date: date
+    end_date: Optional[date] = None
+
+
+class RecurringRuleCreate(RecurringRuleBase):
+    @field_validator("day_of_month")
+    @classmethod
+    def day_of_month_only_for_monthly_rules(cls, v, info):
+        if v is not None and info.data.get("frequency") != RecurrenceFrequency.MONTHLY:
+            raise ValueError("day_of_month applies to monthly rules only")
+        return v
+
+    @field_validator("end_date")
+    @classmethod
+    def end_date_not_before_start_date(cls, v, info):
+        if v and info.data.get("start_date") and v < info.data["start_date"]:
+            raise ValueError("end_date must not be before start_date")
+        return v
+
+
+class RecurringRuleResponse(RecurringRuleBase):
+    id: int
+    next_run_date: date
+    active: bool
+    # Occurrences skipped because no budget covered them or they would exceed it
+    rejected_count: int
+    last_rejected_date: Optional[date] = None
+    created_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
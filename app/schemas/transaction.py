@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
 from datetime import datetime, date
 from app.models.transaction import TransactionType, PaymentMethod
 from .category import CategoryResponse
@@ -36,3 +36,37 @@ class TransactionResponse(TransactionBase):
     model_config = {
         "from_attributes": True
     }
+
+
+class TransactionFilters(BaseModel):
+    """Listing filters; every one narrows a range of an index that leads with user_id"""
+    start_date: Optional[date] = Field(None, description="Earliest transaction date (YYYY-MM-DD)")
+    end_date: Optional[date] = Field(None, description="Latest transaction date (YYYY-MM-DD)")
+    # Repeat the parameter for several categories: ?category_id=1&category_id=2
+    category_id: Optional[List[int]] = Field(None, max_length=20)
+    type: Optional[TransactionType] = None
+    payment_method: Optional[List[PaymentMethod]] = Field(None, max_length=len(PaymentMethod))
+    min_amount: Optional[int] = Field(None, ge=0)
+    max_amount: Optional[int] = Field(None, ge=0)
+
+    @field_validator("end_date")
+    @classmethod
+    def end_date_not_before_start_date(cls, v, info):
+        if v and info.data.get("start_date") and v < info.data["start_date"]:
+            raise ValueError("end_date must not be before start_date")
+        return v
+
+    @field_validator("max_amount")
+    @classmethod
+    def max_amount_not_below_min_amount(cls, v, info):
+        if v is not None and info.data.get("min_amount") is not None and v < info.data["min_amount"]:
+            raise ValueError("max_amount must not be below min_amount")
+        return v
+
+
+class TransactionListParams(TransactionFilters):
+    """Query string of the transaction listing: pagination and sorting plus the filters"""
+    page: int = Field(1, ge=1)
+    per_page: int = Field(20, ge=1, le=100)
+    sort_by: str = Field("date", description="Field to sort by: date, transaction_date, created_at, amount or id")
+    sort_order: str = Field("desc", pattern="^(asc|desc)$", description="Sort order: asc or desc")
@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime
 
 
@@ -17,6 +17,16 @@ class UserUpdate(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     email: Optional[EmailStr] = None
+    budget_rollover_enabled: Optional[bool] = None
+    budget_rollover_carry_over: Optional[bool] = None
+
+    @field_validator("budget_rollover_enabled", "budget_rollover_carry_over")
+    @classmethod
+    def not_null(cls, v):
+        # The fields may be omitted, but the columns cannot hold null
+        if v is None:
+            raise ValueError("must be true or false")
+        return v
 
 
 class PasswordChange(BaseModel):
@@ -26,6 +36,8 @@ class PasswordChange(BaseModel):
 
 class UserResponse(UserBase):
     id: int
+    budget_rollover_enabled: bool = False
+    budget_rollover_carry_over: bool = False
     created_at: datetime
     updated_at: datetime
 
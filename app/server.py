@@ -0,0 +1,99 @@
+"""Production server: gunicorn managing uvicorn workers.
+
+    python -m app.server [--bind 0.0.0.0:8000] [--workers N]
+
+Every option defaults to a `SERVER_*` setting. With `SERVER_WORKERS=0` there is one worker per CPU core
+available to the process. With `SERVER_PRELOAD=true` the master imports the application once and the
+workers share its memory copy-on-write. Importing the app opens no database connections, and each worker
+still drops any engine it inherited, so no pooled connection is shared across a fork. It drops them
+without closing their connections, which would shut sockets the master still holds.
+
+On SIGTERM, workers stop accepting connections and finish in-flight requests for up to
+`SERVER_GRACEFUL_TIMEOUT` seconds. Workers restart after `SERVER_MAX_REQUESTS` requests, plus up to
+`SERVER_MAX_REQUESTS_JITTER` more so they do not all restart at once.
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from gunicorn.app.base import BaseApplication
+from uvicorn.workers import UvicornWorker
+
+from app.config.settings import Settings, settings
+
+
+class Worker(UvicornWorker):
+    # "auto" picks uvloop and httptools when they are installed (pip install uvicorn[standard])
+    CONFIG_KWARGS = {"loop": settings.server_loop, "http": settings.server_http}
+
+
+def available_cpus() -> int:
+    """CPU cores this process may run on, which in a container can be fewer than the host has"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(configured: int) -> int:
+    # Endpoints are synchronous and run in each worker's thread pool while they wait on the database, so
+    # one event loop per core keeps every core busy
+    return configured if configured > 0 else available_cpus()
+
+
+def _post_fork(_server, _worker) -> None:
+    from app.config.database import close_database
+
+    close_database(close=False)
+
+
+def gunicorn_options(app_settings: Settings) -> Dict[str, Any]:
+    return {
+        "bind": app_settings.server_bind,
+        "workers": worker_count(app_settings.server_workers),
+        "worker_class": Worker,
+        "preload_app": app_settings.server_preload,
+        "timeout": app_settings.server_timeout,
+        "graceful_timeout": app_settings.server_graceful_timeout,
+        "keepalive": app_settings.server_keepalive,
+        "max_requests": app_settings.server_max_requests,
+        "max_requests_jitter": app_settings.server_max_requests_jitter,
+        "post_fork": _post_fork,
+    }
+
+
+class Server(BaseApplication):
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    options = gunicorn_options(settings)
+
+    parser = argparse.ArgumentParser(description="Run the API with gunicorn and uvicorn workers")
+    parser.add_argument("--bind", default=options["bind"])
+    parser.add_argument("--workers", type=int, default=options["workers"])
+    parser.add_argument(
+        "--preload", action=argparse.BooleanOptionalAction, default=options["preload_app"],
+        help="Import the app in the master before forking workers",
+    )
+    args = parser.parse_args(argv)
+
+    options.update(bind=args.bind, workers=args.workers, preload_app=args.preload)
+    Server(options).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
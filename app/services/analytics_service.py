@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.constants.messages import AnalyticsMessages
+from app.core.exceptions import ValidationError
+from app.models.transaction import TransactionType
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.schemas.analytics import TimeseriesData, TimeseriesSeries
+
+# Upper bound on buckets per response, e.g. a little under three years of days
+MAX_BUCKETS = 1000
+
+
+def bucket_start(day: date, interval: str) -> date:
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_starts(start_date: date, end_date: date, interval: str) -> List[date]:
+    """Every bucket between the two dates, including empty ones"""
+    buckets = []
+    current = bucket_start(start_date, interval)
+    while current <= end_date:
+        buckets.append(current)
+        if interval == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7 if interval == "week" else 1)
+    return buckets
+
+
+def moving_average(values: List[int], window: int) -> List[float]:
+    """Trailing mean over up to `window` values, kept as a running sum so each step is O(1)"""
+    averages = []
+    total = 0
+    for index, value in enumerate(values):
+        total += value
+        if index >= window:
+            total -= values[index - window]
+        averages.append(round(total / min(index + 1, window), 2))
+    return averages
+
+
+class AnalyticsService:
+    def __init__(self, db: Session):
+        self.analytics_repo = AnalyticsRepository(db)
+
+    def get_timeseries(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        interval: str = "month",
+        by_category: bool = False,
+        transaction_type: Optional[TransactionType] = None,
+        window: int = 3,
+    ) -> TimeseriesData:
+        end_date = end_date or date.today()
+        # Default to the last twelve months, starting on a month boundary
+        start_date = start_date or (end_date.replace(day=1) - timedelta(days=365)).replace(day=1)
+        if end_date < start_date:
+            raise ValidationError(AnalyticsMessages.INVALID_DATE_RANGE.value)
+        buckets = bucket_starts(start_date, end_date, interval)
+        if len(buckets) > MAX_BUCKETS:
+            raise ValidationError(AnalyticsMessages.TOO_MANY_BUCKETS.value)
+
+        totals, names = self.analytics_repo.get_bucket_totals(user_id, start_date, end_date, interval, by_category)
+
+        # Gap-fill: one aligned column per (category, type), zero where the database returned no row
+        positions = {bucket: index for index, bucket in enumerate(buckets)}
+        columns = {}
+        for (bucket, category_id, type_), total in totals.items():
+            if transaction_type is not None and type_ != transaction_type:
+                continue
+            column = columns.setdefault((category_id, type_), [0] * len(buckets))
+            column[positions[bucket]] += total
+
+        keys = [(None, type_) for type_ in TransactionType if transaction_type in (None, type_)]
+        if by_category:
+            keys = sorted(columns, key=lambda key: (names[key[0]], key[1].value))
+
+        series = []
+        for category_id, type_ in keys:
+            values = columns.get((category_id, type_), [0] * len(buckets))
+            series.append(TimeseriesSeries(
+                type=type_.value,
+                category_id=category_id,
+                category=names.get(category_id),
+                totals=values,
+                cumulative=list(accumulate(values)),
+                moving_average=moving_average(values, window),
+            ))
+
+        return TimeseriesData(
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date,
+            window=window,
+            buckets=buckets,
+            series=series,
+        )
@@ -1,10 +1,22 @@
+from typing import Optional
+
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.core.exceptions import NotFoundError, UnauthorizedError, ConflictError, ValidationError
 from app.repositories.user_repository import UserRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 from app.schemas.auth import LoginRequest, Token as TokenData
 from app.models.user import User
-from app.core.security import create_access_token, verify_password, get_password_hash
+from app.core.security import (
+    REFRESH_TOKEN_TYPE,
+    create_access_token,
+    create_refresh_token,
+    get_password_hash,
+    revocation_list,
+    token_expires_at,
+    verify_password,
+    verify_token,
+)
 from app.schemas.user import UserCreate
 from app.config.settings import settings
 from app.utils.validation import is_password_length_valid
@@ -15,6 +27,7 @@ from app.constants.messages import ValidationMessages
 class AuthService:
     def __init__(self, db: Session):
         self.repository = UserRepository(db)
+        self.revoked_token_repository = RevokedTokenRepository(db)
 
     def create_user(self, user_data: UserCreate) -> User:
         if self.repository.email_exists(user_data.email):
@@ -42,13 +55,69 @@ class AuthService:
         if not verify_password(login_data.password, user.hashed_password):
             raise UnauthorizedError(AuthMessages.INVALID_PASSWORD.value)
 
+        return self._issue_tokens(user.id, user.email)
+
+    def refresh_tokens(self, refresh_token: str) -> TokenData:
+        """Exchange a refresh token for a new token pair, revoking the used refresh token (rotation)"""
+        payload = self._verify_refresh_token(refresh_token)
+
+        # A concurrent refresh with the same token may have passed the check above; only one can revoke it
+        if not self._revoke(payload):
+            raise UnauthorizedError(AuthMessages.INVALID_REFRESH_TOKEN.value)
+        return self._issue_tokens(payload["user_id"], payload["email"])
+
+    def logout(self, access_payload: dict, refresh_token: Optional[str] = None) -> None:
+        """Revoke the current access token and, when given, the session's refresh token.
+
+        The refresh token is checked first, so an invalid one revokes nothing.
+        """
+        refresh_payload = None
+        if refresh_token:
+            refresh_payload = self._verify_refresh_token(refresh_token)
+            if refresh_payload["user_id"] != access_payload["user_id"]:
+                raise UnauthorizedError(AuthMessages.INVALID_REFRESH_TOKEN.value)
+
+        self._revoke(access_payload)
+        if refresh_payload is not None:
+            self._revoke(refresh_payload)
+
+    def _verify_refresh_token(self, refresh_token: str) -> dict:
+        payload = verify_token(refresh_token, token_type=REFRESH_TOKEN_TYPE)
+        if payload is None:
+            raise UnauthorizedError(AuthMessages.INVALID_REFRESH_TOKEN.value)
+
+        # Refreshing is rare, so check the database too instead of waiting for the next revocation sync
+        jti = payload.get("jti")
+        if revocation_list.is_revoked(jti) or self.revoked_token_repository.is_revoked(jti):
+            raise UnauthorizedError(AuthMessages.INVALID_REFRESH_TOKEN.value)
+
+        return payload
+
+    def _revoke(self, payload: dict) -> bool:
+        """Revoke the token; returns False when it had already been revoked"""
+        jti = payload.get("jti")
+        if jti is None:
+            # Legacy tokens without an id cannot be revoked and simply expire
+            return True
+        expires_at = token_expires_at(payload)
+        revoked = self.revoked_token_repository.revoke(jti, payload["user_id"], expires_at)
+        revocation_list.add(jti, expires_at)
+        return revoked
+
+    def _issue_tokens(self, user_id: int, email: str) -> TokenData:
         access_token = create_access_token(
-            user_id=user.id,
-            email=user.email
+            user_id=user_id,
+            email=email
+        )
+        refresh_token = create_refresh_token(
+            user_id=user_id,
+            email=email
         )
 
         return TokenData(
             access_token=access_token,
+            refresh_token=refresh_token,
             token_type="bearer",
-            expires_in=settings.access_token_expire_minutes * 60
+            expires_in=settings.access_token_expire_minutes * 60,
+            refresh_expires_in=settings.refresh_token_expire_minutes * 60
         )
@@ -1,18 +1,32 @@
+import math
 from datetime import datetime, date, timedelta
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.constants.messages import BudgetMessages
 from app.core.exceptions import NotFoundError, ConflictError, ValidationError
-from app.models.budget import Budget
-from app.repositories.budget_repository import BudgetRepository
+from app.repositories.budget_repository import BudgetRepository, BudgetSpending
+from app.repositories.user_repository import UserRepository
 from app.schemas.budget import BudgetCreate, BudgetUpdate, PredictionType
+from app.utils.dates import add_months
+
+
+def next_period(start_date: date, end_date: date) -> Tuple[date, date]:
+    """Period following a budget's: whole calendar months stay whole months, other periods keep their length"""
+    if start_date.day == 1 and (end_date + timedelta(days=1)).day == 1:
+        months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+        return add_months(start_date, months), add_months(start_date, 2 * months) - timedelta(days=1)
+    length = end_date - start_date
+    return end_date + timedelta(days=1), end_date + timedelta(days=1) + length
 
 
 class BudgetService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = BudgetRepository(db)
+        self.user_repository = UserRepository(db)
 
     def get_user_budgets(
             self,
@@ -32,36 +46,21 @@ class BudgetService:
             user_id, skip, limit, sort_by, sort_order, status
         )
 
-        result = []
-        for item in budget_data:
-            budget = item["budget"]
-            total_spent = item["total_spent"]
+        # Daily spend series for every budget on the page, from a single query
+        today = datetime.now().date()
+        daily_spending = self.repository.get_daily_spending([budget.id for budget in budget_data], today)
 
-            remaining_budget = budget.amount - total_spent
-
-            budget_dict = {
-                "id": budget.id,
-                "category_id": budget.category_id,
-                "amount": budget.amount,
-                "status": self._get_budget_status(budget.start_date, budget.end_date),
-                "start_date": budget.start_date,
-                "end_date": budget.end_date,
-                "prediction_enabled": budget.prediction_enabled,
-                "prediction_type": budget.prediction_type,
-                "prediction_days_count": budget.prediction_days_count,
-                "remaining_budget": remaining_budget,
-                "prediction": None,
-            }
+        # Rows are completed in place and validated as BudgetResponse directly
+        for budget in budget_data:
+            budget.status = self._get_budget_status(budget.start_date, budget.end_date)
+            budget.remaining_budget = budget.amount - budget.total_spent
+            budget.forecast = self._calculate_forecast(budget, budget.total_spent, daily_spending.get(budget.id, {}), today)
 
             # Calculate prediction if enabled
             if budget.prediction_enabled:
-                prediction = self._calculate_prediction(budget, total_spent)
-                if prediction:
-                    budget_dict["prediction"] = prediction
-
-            result.append(budget_dict)
+                budget.prediction = self._calculate_prediction(budget, budget.total_spent)
 
-        return result, total
+        return budget_data, total
 
     def create_budget(self, user_id: int, budget_data: BudgetCreate):
         # Validate prediction settings
@@ -81,6 +80,8 @@ class BudgetService:
         )
 
         try:
+            # Committed by the insert, together with the budget
+            self.user_repository.bump_data_version(user_id)
             budget_result_dict = self.repository.create_budget(budget_dict)
             budget_result_dict["status"] = self._get_budget_status(
                 budget_data.start_date, budget_data.end_date
@@ -101,6 +102,75 @@ class BudgetService:
         except IntegrityError:
             raise ConflictError(BudgetMessages.ALREADY_EXISTS.value)
 
+    def rollover_budgets(
+            self, user_id: int, as_of: Optional[date] = None, carry_over: bool = False, lookback_days: Optional[int] = None
+    ) -> Tuple[List[dict], int]:
+        """Clone the budgets covering `as_of` (default today) into their next period.
+
+        With `lookback_days`, the budgets whose period ended in that many days before `as_of` are cloned
+        instead. With `carry_over` the unspent part of each budget is added to its clone. Clones whose period
+        overlaps an existing budget of the category are skipped, which also makes a repeated rollover a
+        no-op. Overlaps are checked with one query and the clones inserted with one multi-row statement.
+        Returns the created budgets and the number skipped.
+        """
+        as_of = as_of or datetime.now().date()
+        ended_since = as_of - timedelta(days=lookback_days) if lookback_days is not None else None
+        sources = self.repository.get_rollover_sources(user_id, as_of, ended_since)
+        if not sources:
+            return [], 0
+
+        candidates = []
+        for budget, total_spent in sources:
+            start_date, end_date = next_period(budget.start_date, budget.end_date)
+            candidates.append({
+                "user_id": user_id,
+                "category_id": budget.category_id,
+                "amount": budget.amount + (max(budget.amount - total_spent, 0) if carry_over else 0),
+                "start_date": start_date,
+                "end_date": end_date,
+                "prediction_enabled": budget.prediction_enabled,
+                "prediction_type": budget.prediction_type,
+                "prediction_days_count": budget.prediction_days_count,
+            })
+
+        existing = self.repository.get_overlapping_periods(
+            user_id,
+            sorted({candidate["category_id"] for candidate in candidates}),
+            min(candidate["start_date"] for candidate in candidates),
+            max(candidate["end_date"] for candidate in candidates),
+        )
+        rows = [
+            candidate for candidate in candidates
+            if not any(
+                period_start <= candidate["end_date"] and period_end >= candidate["start_date"]
+                for period_start, period_end in existing.get(candidate["category_id"], [])
+            )
+        ]
+
+        try:
+            created = self.repository.create_many(rows)
+            self.user_repository.bump_data_version(user_id)
+            self.db.commit()
+        except IntegrityError:
+            raise ConflictError(BudgetMessages.ALREADY_EXISTS.value)
+
+        budgets = [
+            {
+                "id": budget.id,
+                "category_id": budget.category_id,
+                "amount": budget.amount,
+                "status": self._get_budget_status(budget.start_date, budget.end_date),
+                "start_date": budget.start_date,
+                "end_date": budget.end_date,
+                "prediction_enabled": budget.prediction_enabled,
+                "prediction_type": budget.prediction_type,
+                "prediction_days_count": budget.prediction_days_count,
+                "remaining_budget": budget.amount,
+            }
+            for budget in created
+        ]
+        return budgets, len(candidates) - len(rows)
+
     def update_budget(self, budget_id: int, user_id: int, budget_data: BudgetUpdate):
         budget = self.repository.get_by_id(budget_id)
         if not budget:
@@ -129,6 +199,7 @@ class BudgetService:
                 raise ConflictError(BudgetMessages.ALREADY_EXISTS.value)
 
         try:
+            self.user_repository.bump_data_version(user_id)
             budget_update = self.repository.update_budget(budget_id, update_data)
             budget_update["status"] = self._get_budget_status(start_date, end_date)
 
@@ -142,9 +213,8 @@ class BudgetService:
 
             # Find the updated budget in the list and calculate remaining budget
             for item in budget_data_list:
-                if item["budget"].id == budget_id:
-                    total_spent = item["total_spent"]
-                    budget_update["remaining_budget"] = budget_update["amount"] - total_spent
+                if item.id == budget_id:
+                    budget_update["remaining_budget"] = budget_update["amount"] - item.total_spent
                     break
             else:
                 # If not found in spending data (shouldn't happen), default to full amount
@@ -160,9 +230,10 @@ class BudgetService:
         if not budget or budget.user_id != user_id:
             raise NotFoundError(BudgetMessages.NOT_FOUND.value)
 
+        self.user_repository.bump_data_version(user_id)
         return self.repository.delete(budget_id)
 
-    def _calculate_prediction(self, budget: Budget, total_spent: int) -> dict:
+    def _calculate_prediction(self, budget: BudgetSpending, total_spent: int) -> dict:
         """Calculate prediction data for a budget"""
         remaining_budget = budget.amount - total_spent
         today = datetime.now().date()
@@ -196,8 +267,46 @@ class BudgetService:
             "prediction_type": budget.prediction_type,
         }
 
+    def _calculate_forecast(
+            self, budget: BudgetSpending, total_spent: int, daily_spending: Dict[date, int], today: date
+    ) -> Optional[dict]:
+        """Project end-of-period spend for an active budget from its daily spend so far.
+
+        Remaining days are assumed to draw from the elapsed days' spend distribution, so the remaining
+        spend is approximately normal with mean `mean * r` and variance `variance * r`. The distribution
+        comes from `daily_spending` up to today only; future-dated expenses count towards `total_spent`.
+        """
+        if not budget.start_date <= today <= budget.end_date:
+            return None
+
+        days_elapsed = (today - budget.start_date).days + 1
+        days_remaining = (budget.end_date - today).days
+        elapsed_spending = [amount for day, amount in daily_spending.items() if day <= today]
+        mean = sum(elapsed_spending) / days_elapsed
+        # Days without expenses count as zero spend
+        variance = sum((amount - mean) ** 2 for amount in elapsed_spending)
+        variance = max(0.0, (variance + (days_elapsed - len(elapsed_spending)) * mean ** 2) / days_elapsed)
+
+        projected_spend = total_spent + mean * days_remaining
+        headroom = budget.amount - projected_spend
+        spread = math.sqrt(variance * days_remaining)
+        if spread == 0:
+            overrun_probability = 1.0 if headroom <= 0 else 0.0
+        else:
+            # 1 - Phi(headroom / spread)
+            overrun_probability = 0.5 * math.erfc(headroom / (spread * math.sqrt(2)))
+
+        return {
+            "burn_rate": round(mean, 2),
+            "projected_spend": round(projected_spend),
+            "projected_remaining": round(headroom),
+            "overrun_probability": round(overrun_probability, 4),
+            "days_elapsed": days_elapsed,
+            "days_remaining": days_remaining,
+        }
+
     def _get_applicable_days_in_range(
-            self, budget: Budget, start_date: date, end_date: date, total_days: int
+            self, budget: BudgetSpending, start_date: date, end_date: date, total_days: int
     ) -> int:
         """Calculate applicable days based on prediction type within date range"""
         if budget.prediction_type == PredictionType.DAILY:
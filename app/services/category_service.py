@@ -4,13 +4,17 @@ from app.core.exceptions import ConflictError, NotFoundError
 from app.repositories.category_repository import CategoryRepository
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.constants.messages import CategoryMessages
+from app.repositories.recurring_rule_repository import RecurringRuleRepository
 from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.user_repository import UserRepository
 
 
 class CategoryService:
     def __init__(self, db: Session):
         self.repository = CategoryRepository(db)
         self.transaction_repository = TransactionRepository(db)
+        self.recurring_rule_repository = RecurringRuleRepository(db)
+        self.user_repository = UserRepository(db)
 
     def get_user_categories(self, user_id: int):
         return self.repository.get_category_with_usage_count(user_id)
@@ -26,6 +30,8 @@ class CategoryService:
             'user_id': user_id
         })
 
+        # Committed by the create, together with the category
+        self.user_repository.bump_data_version(user_id)
         created_category = self.repository.create(category_dict)
         return self.repository.get_single_category_with_usage_count(created_category.id, user_id)
 
@@ -42,6 +48,7 @@ class CategoryService:
         if category_exists:
             raise ConflictError(CategoryMessages.ALREADY_EXISTS.value)
 
+        self.user_repository.bump_data_version(user_id)
         self.repository.update(category, category_data.model_dump())
         return self.repository.get_single_category_with_usage_count(category_id, user_id)
 
@@ -58,4 +65,9 @@ class CategoryService:
         if transaction_count > 0:
             raise ConflictError(CategoryMessages.CANNOT_DELETE_HAS_TRANSACTIONS.value)
 
+        # Rules would otherwise keep creating transactions in the deleted category
+        if self.recurring_rule_repository.count_by_category_id(category_id) > 0:
+            raise ConflictError(CategoryMessages.CANNOT_DELETE_HAS_RECURRING_RULES.value)
+
+        self.user_repository.bump_data_version(user_id)
         return self.repository.delete(category_id)
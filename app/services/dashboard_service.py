@@ -48,17 +48,17 @@ class DashboardService:
         summary_data = self.dashboard_repo.get_monthly_summary(user_id, period_start, period_end)
 
         # Calculate net balance and savings rate
-        net_balance = summary_data["total_income"] - summary_data["total_expenses"]
+        net_balance = summary_data.total_income - summary_data.total_expenses
 
-        if summary_data["total_income"] > 0:
-            savings_rate = round((net_balance / summary_data["total_income"]) * 100, 2)
+        if summary_data.total_income > 0:
+            savings_rate = round((net_balance / summary_data.total_income) * 100, 2)
         else:
             savings_rate = 0.0
 
         summary = DashboardSummary(
-            total_income=summary_data["total_income"],
-            total_expenses=summary_data["total_expenses"],
-            total_expenses_today=summary_data["total_expenses_today"],
+            total_income=summary_data.total_income,
+            total_expenses=summary_data.total_expenses,
+            total_expenses_today=summary_data.total_expenses_today,
             net_balance=net_balance,
             savings_rate=savings_rate,
         )
@@ -67,19 +67,19 @@ class DashboardService:
         budget_data = self.dashboard_repo.get_budgets_with_spending(
             user_id, period_start, period_end, budget_limit
         )
-        budgets = [BudgetOverview(**budget) for budget in budget_data]
+        budgets = [BudgetOverview.model_validate(budget) for budget in budget_data]
 
         # Get recent transactions with configurable limit, filtered by month if provided
         transaction_data = self.dashboard_repo.get_recent_transactions(
             user_id, transaction_limit, period_start, period_end
         )
-        recent_transactions = [RecentTransaction(**trans) for trans in transaction_data]
+        recent_transactions = [RecentTransaction.model_validate(trans) for trans in transaction_data]
 
         # Get top expenses with configurable limit
         expense_data = self.dashboard_repo.get_top_expenses(
             user_id, period_start, period_end, expense_limit
         )
-        top_expenses = [TopExpense(**expense) for expense in expense_data]
+        top_expenses = [TopExpense.model_validate(expense) for expense in expense_data]
 
         # Format period
         period = f"{period_start} to {period_end}"
@@ -0,0 +1,138 @@
+import calendar
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.constants.messages import CategoryMessages, RecurringRuleMessages
+from app.core.exceptions import NotFoundError
+from app.models.recurring_rule import RecurrenceFrequency, RecurringRule
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.recurring_rule_repository import RecurringRuleRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.recurring_rule import RecurringRuleCreate
+from app.services.transaction_service import TransactionService
+from app.utils.dates import add_months
+
+# Occurrences created per rule in one run; a rule further behind catches up on the following runs
+MAX_CATCH_UP_OCCURRENCES = 366
+
+
+def _on_day(month_start: date, day_of_month: int) -> date:
+    """`day_of_month` in the month of `month_start`, moved back to the month's last day if it is shorter"""
+    last_day = calendar.monthrange(month_start.year, month_start.month)[1]
+    return month_start.replace(day=min(day_of_month, last_day))
+
+
+def first_occurrence(frequency: RecurrenceFrequency, start_date: date, day_of_month: Optional[int] = None) -> date:
+    """Date of a schedule's first occurrence on or after start_date"""
+    if frequency != RecurrenceFrequency.MONTHLY or day_of_month is None:
+        return start_date
+    candidate = _on_day(start_date.replace(day=1), day_of_month)
+    if candidate < start_date:
+        candidate = _on_day(add_months(start_date, 1), day_of_month)
+    return candidate
+
+
+def next_occurrence(rule: RecurringRule, current: date) -> date:
+    """Occurrence following `current` (itself an occurrence of the rule)"""
+    if rule.frequency == RecurrenceFrequency.DAILY:
+        return current + timedelta(days=rule.interval)
+    if rule.frequency == RecurrenceFrequency.WEEKLY:
+        return current + timedelta(weeks=rule.interval)
+    return _on_day(add_months(current, rule.interval), rule.day_of_month or rule.start_date.day)
+
+
+def due_occurrences(rule: RecurringRule, as_of: date, limit: int = MAX_CATCH_UP_OCCURRENCES) -> Tuple[List[date], date]:
+    """Occurrences from next_run_date up to `as_of` (and end_date), plus the next_run_date after them"""
+    dates = []
+    current = rule.next_run_date
+    while current <= as_of and (rule.end_date is None or current <= rule.end_date) and len(dates) < limit:
+        dates.append(current)
+        current = next_occurrence(rule, current)
+    return dates, current
+
+
+class RecurringRuleService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = RecurringRuleRepository(db)
+        self.category_repository = CategoryRepository(db)
+        self.transaction_service = TransactionService(db)
+        self.user_repository = UserRepository(db)
+
+    def get_user_rules(self, user_id: int) -> List[RecurringRule]:
+        return self.repository.get_by_user_id(user_id)
+
+    def create_rule(self, user_id: int, rule_data: RecurringRuleCreate) -> RecurringRule:
+        category = self.category_repository.get_by_id(rule_data.category_id)
+        if not category or category.user_id != user_id:
+            raise NotFoundError(CategoryMessages.NOT_FOUND.value)
+
+        rule_dict = rule_data.model_dump()
+        if rule_dict["frequency"] == RecurrenceFrequency.MONTHLY and rule_dict["day_of_month"] is None:
+            rule_dict["day_of_month"] = rule_dict["start_date"].day
+        rule_dict.update({
+            "user_id": user_id,
+            "next_run_date": first_occurrence(rule_dict["frequency"], rule_dict["start_date"], rule_dict["day_of_month"]),
+        })
+        return self.repository.create(rule_dict)
+
+    def delete_rule(self, rule_id: int, user_id: int) -> bool:
+        """Stop a rule; transactions it already created are kept"""
+        rule = self.repository.get_by_id(rule_id)
+        if not rule or rule.user_id != user_id:
+            raise NotFoundError(RecurringRuleMessages.NOT_FOUND.value)
+        return self.repository.delete(rule_id)
+
+    def materialize_due(self, as_of: Optional[date] = None, batch_size: Optional[int] = None) -> Tuple[int, int]:
+        """Create the transactions of every rule due by `as_of` (default today).
+
+        Rules are processed in id-ordered batches; each batch's occurrences go in through multi-row
+        inserts and are committed together with the rules' new next_run_date. An occurrence that already
+        exists is skipped, so a run interrupted mid-batch can simply run again. Expense occurrences that
+        fail the budget checks are not created and not retried; the rule counts them in rejected_count
+        and last_rejected_date. Returns the transactions created and rejected.
+        """
+        as_of = as_of or date.today()
+        batch_size = batch_size or settings.recurring_batch_size
+        created = rejected = 0
+        after_id = 0
+        while True:
+            rules = self.repository.get_due(as_of, batch_size, after_id)
+            if not rules:
+                return created, rejected
+
+            occurrences = []
+            for rule in rules:
+                dates, rule.next_run_date = due_occurrences(rule, as_of)
+                if rule.end_date is not None and rule.next_run_date > rule.end_date:
+                    rule.active = False
+                occurrences += [
+                    {
+                        "user_id": rule.user_id,
+                        "category_id": rule.category_id,
+                        "amount": rule.amount,
+                        "type": rule.type,
+                        "payment_method": rule.payment_method,
+                        "description": rule.description,
+                        "transaction_date": day,
+                        "recurring_rule_id": rule.id,
+                    }
+                    for day in dates
+                ]
+
+            batch_created, batch_rejected = self.transaction_service.create_recurring_occurrences(occurrences)
+            created += batch_created
+            rejected += len(batch_rejected)
+            rules_by_id = {rule.id: rule for rule in rules}
+            for occurrence in batch_rejected:
+                rule, day = rules_by_id[occurrence["recurring_rule_id"]], occurrence["transaction_date"]
+                rule.rejected_count += 1
+                if rule.last_rejected_date is None or day > rule.last_rejected_date:
+                    rule.last_rejected_date = day
+            # One commit per batch: occurrences, rule progress and the users' data versions together
+            self.user_repository.bump_data_versions(sorted({rule.user_id for rule in rules}))
+            self.db.commit()
+            after_id = rules[-1].id
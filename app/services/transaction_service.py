@@ -1,15 +1,23 @@
+import re
 from datetime import datetime, date
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.transaction import Transaction, TransactionType
 from app.repositories.budget_repository import BudgetRepository
-from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.transaction_repository import SORT_FIELDS, TransactionRepository, TransactionRow
 from app.repositories.category_repository import CategoryRepository
-from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.repositories.user_repository import UserRepository
+from app.schemas.transaction import TransactionCreate, TransactionFilters, TransactionUpdate
 from app.constants.messages import CategoryMessages, TransactionMessages
+from app.utils.cursors import decode_cursor, encode_cursor
+
+# Search queries beyond this many words are truncated
+MAX_SEARCH_TERMS = 8
+# Rows per multi-row INSERT of recurring occurrences, well under SQLite's bound parameter limit
+OCCURRENCE_INSERT_CHUNK = 500
 
 
 class TransactionService:
@@ -17,17 +25,53 @@ class TransactionService:
         self.repository = TransactionRepository(db)
         self.budget_repository = BudgetRepository(db)
         self.category_repository = CategoryRepository(db)
+        self.user_repository = UserRepository(db)
+
+    def get_user_transactions_with_category(
+            self,
+            user_id: int,
+            skip: int = 0,
+            limit: int = 100,
+            sort_by: str = "date",
+            sort_order: str = "desc",
+            filters: Optional[TransactionFilters] = None,
+    ):
+        if sort_by not in SORT_FIELDS:
+            raise ValidationError(TransactionMessages.INVALID_SORT_FIELD.value)
 
-    def get_user_transactions_with_category(self, user_id: int, skip: int = 0, limit: int = 100, sort_by: str = "date", sort_order: str = "desc"):
         # Get total count
-        total = self.repository.count_by_user_id(user_id)
+        total = self.repository.count_by_user_id(user_id, filters)
 
         # Get paginated transactions
         transactions = self.repository.get_transaction_with_category(
-            user_id=user_id, skip=skip, limit=limit, sort_by=sort_by, sort_order=sort_order)
+            user_id=user_id, skip=skip, limit=limit, sort_by=sort_by, sort_order=sort_order, filters=filters)
 
         return transactions, total
 
+    def search_transactions(
+            self,
+            user_id: int,
+            query: str,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            **filters,
+    ) -> Tuple[List[TransactionRow], Optional[str]]:
+        """Search descriptions; returns a page of matches and the cursor of the next page (None on the last)"""
+        terms = re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+        if not terms:
+            raise ValidationError(TransactionMessages.INVALID_SEARCH_QUERY.value)
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise ValidationError(TransactionMessages.INVALID_CURSOR.value)
+
+        # One extra row tells whether another page follows
+        transactions = self.repository.search(user_id, terms, limit + 1, after, **filters)
+        if len(transactions) <= limit:
+            return transactions, None
+        last = transactions[limit - 1]
+        return transactions[:limit], encode_cursor(last.transaction_date, last.id)
+
     def create_transaction(self, user_id: int, transaction_data: TransactionCreate) -> Transaction:
         # Check if category exists before creating the transaction
         category = self.category_repository.get_by_id(transaction_data.category_id)
@@ -46,8 +90,42 @@ class TransactionService:
             'user_id': user_id
         })
 
+        # Committed by the create, together with the transaction
+        self.user_repository.bump_data_version(user_id)
         return self.repository.create(transaction_dict)
 
+    def create_recurring_occurrences(self, occurrences: List[dict]) -> Tuple[int, List[dict]]:
+        """Insert occurrences of recurring rules (transaction dicts with recurring_rule_id) in bulk.
+
+        Expenses get the checks of create_transaction: one needs a budget covering its date and must
+        fit in what is left of it, counting earlier occurrences of the same batch. Returns how many were
+        created and the occurrences rejected by these checks. Does not commit.
+        """
+        accepted = []
+        rejected = []
+        budgets = {}
+        spent = {}
+        for occurrence in sorted(occurrences, key=lambda item: item["transaction_date"]):
+            if occurrence["type"] == TransactionType.EXPENSE:
+                key = (occurrence["user_id"], occurrence["category_id"], occurrence["transaction_date"])
+                if key not in budgets:
+                    budgets[key] = self.budget_repository.get_budget_for_transaction_date(*key)
+                budget = budgets[key]
+                if budget is not None and budget.id not in spent:
+                    spent[budget.id] = self._get_budget_period_spending(
+                        budget, occurrence["user_id"], occurrence["category_id"]
+                    )
+                if budget is None or spent[budget.id] + occurrence["amount"] > budget.amount:
+                    rejected.append(occurrence)
+                    continue
+                spent[budget.id] += occurrence["amount"]
+            accepted.append(occurrence)
+
+        created = 0
+        for start in range(0, len(accepted), OCCURRENCE_INSERT_CHUNK):
+            created += self.repository.create_many(accepted[start:start + OCCURRENCE_INSERT_CHUNK])
+        return created, rejected
+
     def update_transaction(self, transaction_id: int, user_id: int, transaction_data: TransactionUpdate) -> Transaction:
         transaction = self.repository.get_by_id(transaction_id)
         if not transaction:
@@ -77,6 +155,7 @@ class TransactionService:
             if new_total_spent > budget.amount:
                 raise ValidationError(TransactionMessages.EXCEEDED_LIMIT.value)
 
+        self.user_repository.bump_data_version(user_id)
         return self.repository.update(transaction, update_data)
 
     def delete_transaction(self, transaction_id: int, user_id: int) -> bool:
@@ -87,6 +166,7 @@ class TransactionService:
         if transaction.user_id != user_id:
             raise NotFoundError(TransactionMessages.NOT_FOUND.value)
 
+        self.user_repository.bump_data_version(user_id)
         return self.repository.delete(transaction_id)
 
     def _require_budget_for_date(self, user_id: int, category_id: int, transaction_date: date):
@@ -106,17 +186,6 @@ class TransactionService:
 
     def _get_budget_period_spending(self, budget, user_id: int, category_id: int, exclude_transaction_id=None):
         """Calculate total spending for a category within the budget period"""
-        query = self.repository.db.query(func.coalesce(func.sum(Transaction.amount), 0)).filter(
-            Transaction.user_id == user_id,
-            Transaction.category_id == category_id,
-            Transaction.type == TransactionType.EXPENSE,
-            Transaction.transaction_date >= budget.start_date,
-            Transaction.transaction_date <= budget.end_date
+        return self.repository.get_spending_total(
+            user_id, category_id, budget.start_date, budget.end_date, exclude_transaction_id=exclude_transaction_id
         )
-
-        # Exclude specific transaction if updating
-        if exclude_transaction_id:
-            query = query.filter(Transaction.id != exclude_transaction_id)
-
-        result = query.scalar()
-        return int(result) if result else 0
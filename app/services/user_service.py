@@ -1,6 +1,9 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.config.settings import settings
+from app.jobs import enqueue
+from app.repositories.transaction_repository import TransactionRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserUpdate
 from app.core.exceptions import NotFoundError, ConflictError, ValidationError
@@ -16,6 +19,7 @@ from app.constants.messages import AuthMessages
 class UserService:
     def __init__(self, db: Session):
         self.repository = UserRepository(db)
+        self.transaction_repository = TransactionRepository(db)
 
     def get_user_by_id(self, user_id: int) -> User:
         user = self.repository.get_by_id(user_id)
@@ -60,6 +64,12 @@ class UserService:
         user = self.repository.get_by_id(user_id)
         if not user:
             raise NotFoundError(AuthMessages.USER_NOT_FOUND.value)
-        self.repository.delete(user_id)
+
+        if self.transaction_repository.count_by_user_id(user_id) <= settings.user_delete_inline_limit:
+            self.repository.delete_account(user_id)
+        else:
+            # Hide the account right away and delete its data in chunks off the request thread
+            self.repository.mark_deleted(user)
+            enqueue(self.repository.db, "users.delete", {"user_id": user_id})
 
         return True
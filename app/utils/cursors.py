@@ -0,0 +1,18 @@
+import base64
+from datetime import date
+from typing import Tuple
+
+
+def encode_cursor(day: date, id: int) -> str:
+    """Opaque keyset cursor for a (date, id) sort position"""
+    return base64.urlsafe_b64encode(f"{day.isoformat()}:{id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """Inverse of encode_cursor; raises ValueError for cursors it did not produce"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    day, _, id = raw.partition(":")
+    return date.fromisoformat(day), int(id)
@@ -0,0 +1,42 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.compression import available_encodings
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 11], "zstd": [1, 3, 19]}
+CASES = [(encoding, level) for encoding in available_encodings() for level in LEVELS[encoding]]
+
+
+def _transaction_page(size: int) -> bytes:
+    """JSON body shaped like GET /api/v1/transactions/ with `size` rows"""
+    start = date(2024, 1, 1)
+    rows = [
+        {
+            "id": i,
+            "amount": 1000 + i % 500,
+            "type": "expense",
+            "payment_method": "card",
+            "transaction_date": (start + timedelta(days=i % 365)).isoformat(),
+            "description": f"Transaction {i}",
+            "category_id": i % 10 + 1,
+            "created_at": "2024-01-01T12:00:00",
+            "updated_at": "2024-01-01T12:00:00",
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"success": True, "data": rows, "total": size, "skip": 0, "limit": size}).encode()
+
+
+@pytest.mark.parametrize("encoding,level", CASES)
+def test_compress_transaction_page(benchmark, encoding, level):
+    """One-shot compression of a 100-row transaction page; ratio and size land in extra_info"""
+    body = _transaction_page(100)
+    compress, _ = available_encodings()[encoding]
+
+    compressed = benchmark(compress, body, level)
+
+    benchmark.extra_info["original_bytes"] = len(body)
+    benchmark.extra_info["compressed_bytes"] = len(compressed)
+    benchmark.extra_info["ratio"] = round(len(body) / len(compressed), 2)
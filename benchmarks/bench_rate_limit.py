@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.rate_limit import MemoryBucketStore, RateLimitMiddleware, RateLimitPolicy, SQLiteBucketStore
+from app.core.security import create_access_token
+
+POLICIES = [
+    RateLimitPolicy("login", "/api/v1/auth/login", "10/minute", methods=["POST"]),
+    RateLimitPolicy("register", "/api/v1/auth/register", "5/minute", methods=["POST"]),
+    RateLimitPolicy("dashboard", "/api/v1/dashboard", "1000000/second", per="user"),
+    RateLimitPolicy("api", "/api/", "1000000/second", per="user"),
+]
+
+
+async def _app(scope, receive, send):
+    pass
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBucketStore()
+    return SQLiteBucketStore(str(tmp_path / "buckets.db"))
+
+
+def test_take_token(benchmark, store):
+    """One bucket update, the per-request cost of a store"""
+    benchmark(store.take, "api:user:1", 1000000, 1000000.0)
+
+
+def test_take_token_rotating_keys(benchmark):
+    """A new bucket per request (IP rotation) on a store already past max_buckets; pruning is amortized"""
+    store = MemoryBucketStore()
+    keys = (f"login:ip:{n}" for n in range(10 ** 9))
+    for _ in range(MemoryBucketStore.max_buckets):
+        store.take(next(keys), 10, 10 / 60)
+
+    benchmark(lambda: store.take(next(keys), 10, 10 / 60))
+
+
+def test_check_authenticated_request(benchmark, store):
+    """Policy match, user lookup from a (cached) access token and bucket update for a dashboard request"""
+    middleware = RateLimitMiddleware(_app, store, POLICIES)
+    token = create_access_token(user_id=1, email="bench@example.com")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/dashboard/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+    }
+
+    assert benchmark(middleware.check, scope) == 0
@@ -0,0 +1,47 @@
+import tracemalloc
+
+import pytest
+
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.transaction_repository import TransactionRepository
+from app.schemas.transaction import TransactionResponse
+from benchmarks.conftest import DATA_SIZES, seed_user_data
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+def test_get_category_with_usage_count(benchmark, db_session, size):
+    """Category list with per-category transaction counts"""
+    seed = seed_user_data(db_session, size * 10, category_count=size)
+    repository = CategoryRepository(db_session)
+
+    benchmark(repository.get_category_with_usage_count, seed["user_id"])
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+def test_search_transactions(benchmark, db_session, size):
+    """Description search (FTS5 on SQLite) for a 20-row page"""
+    seed = seed_user_data(db_session, size)
+    repository = TransactionRepository(db_session)
+
+    benchmark(repository.search, seed["user_id"], ["transaction", "1"], 21)
+
+
+@pytest.mark.parametrize("size", [100, 1000])
+def test_transaction_listing_page(benchmark, db_session, size):
+    """100-row listing page and its count, validated as TransactionResponse; extra_info holds the peak KiB"""
+    seed = seed_user_data(db_session, size)
+    repository = TransactionRepository(db_session)
+
+    def listing_page():
+        # Each request starts with an empty session
+        db_session.expunge_all()
+        total = repository.count_by_user_id(seed["user_id"])
+        rows = repository.get_transaction_with_category(seed["user_id"], 0, 100)
+        return [TransactionResponse.model_validate(row) for row in rows], total
+
+    benchmark(listing_page)
+
+    tracemalloc.start()
+    listing_page()
+    benchmark.extra_info["peak_kib"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    tracemalloc.stop()
@@ -0,0 +1,49 @@
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import security
+from app.core.security import create_access_token, get_current_user, revocation_list, token_cache, verify_token
+
+
+@pytest.fixture
+def access_token():
+    token_cache.clear()
+    yield create_access_token(1, "bench@example.com")
+    token_cache.clear()
+
+
+def test_create_access_token(benchmark):
+    benchmark(create_access_token, 1, "bench@example.com")
+
+
+def test_verify_token(benchmark, access_token):
+    payload = benchmark(verify_token, access_token)
+
+    assert payload["user_id"] == 1
+
+
+@pytest.mark.parametrize("backend", ["jose", "pyjwt"])
+def test_get_current_user_uncached(benchmark, monkeypatch, db_session, access_token, backend):
+    """Per-request auth overhead when every request pays for a full JWT decode"""
+    pytest.importorskip({"jose": "jose", "pyjwt": "jwt"}[backend])
+    jwt_encode, jwt_decode, jwt_error = security._load_jwt_backend(backend)
+    monkeypatch.setattr(security, "jwt_decode", jwt_decode)
+    monkeypatch.setattr(security, "JWTError", jwt_error)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+
+    revocation_list.sync(db_session)
+
+    def authenticate():
+        token_cache.clear()
+        return get_current_user(credentials, db_session)
+
+    benchmark(authenticate)
+
+
+def test_get_current_user_cached(benchmark, db_session, access_token):
+    """Per-request auth overhead once the verified payload is cached, including the revocation check"""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+    revocation_list.sync(db_session)
+    get_current_user(credentials, db_session)
+
+    benchmark(get_current_user, credentials, db_session)
@@ -0,0 +1,110 @@
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.security import create_access_token
+from app.models import Base, Category, User
+
+# Concurrent keep-alive clients, and requests each sends per round
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 50
+
+# name -> (command after `python -m`, extra environment, required modules)
+WORKER_MODELS = {
+    "uvicorn-single": (["uvicorn", "app.main:app", "--no-access-log"], {}, []),
+    "gunicorn-1": (["app.server", "--workers", "1"], {}, []),
+    "gunicorn-cpus": (["app.server"], {}, []),
+    "gunicorn-cpus-no-preload": (["app.server", "--no-preload"], {}, []),
+    "gunicorn-cpus-uvloop": (
+        ["app.server"], {"SERVER_LOOP": "uvloop", "SERVER_HTTP": "httptools"}, ["uvloop", "httptools"]
+    ),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def server_database(tmp_path_factory):
+    """A SQLite file with one user and a few categories, plus an access token for that user"""
+    url = f"sqlite:///{tmp_path_factory.mktemp('server') / 'bench.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(
+            User.__table__.insert().values(email="bench@example.com", first_name="Bench", last_name="User", hashed_password="x")
+        ).inserted_primary_key[0]
+        connection.execute(Category.__table__.insert(), [{"user_id": user_id, "name": f"Category {i}"} for i in range(20)])
+    engine.dispose()
+    return url, create_access_token(str(user_id), "bench@example.com")
+
+
+def _start(model: str, database_url: str):
+    command, extra_env, required = WORKER_MODELS[model]
+    missing = [name for name in required if importlib.util.find_spec(name) is None]
+    if missing:
+        pytest.skip(f"needs {', '.join(missing)}")
+
+    port = _free_port()
+    bind = ["--port", str(port)] if command[0] == "uvicorn" else ["--bind", f"127.0.0.1:{port}"]
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        # Every request comes from one user and one IP
+        "RATE_LIMIT_DEFAULT": "",
+        **extra_env,
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", *command, *bind], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/")
+            return process, base_url
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.kill()
+    pytest.fail(f"{model} did not start")
+
+
+def _load(base_url: str, path: str, token: str) -> int:
+    def client():
+        with httpx.Client(base_url=base_url, headers={"Authorization": f"Bearer {token}"}) as http:
+            for _ in range(REQUESTS_PER_CLIENT):
+                http.get(path).raise_for_status()
+        return REQUESTS_PER_CLIENT
+
+    with ThreadPoolExecutor(CLIENTS) as pool:
+        return sum(pool.map(lambda _: client(), range(CLIENTS)))
+
+
+@pytest.mark.parametrize("path", ["/", "/api/v1/categories/"])
+@pytest.mark.parametrize("model", list(WORKER_MODELS))
+def test_worker_model_throughput(benchmark, server_database, model, path):
+    """CLIENTS keep-alive clients sending REQUESTS_PER_CLIENT requests each; extra_info holds requests/s.
+
+    The load generator shares the machine (and its GIL) with the server, so compare models with each
+    other rather than reading the numbers as production capacity.
+    """
+    database_url, token = server_database
+    process, base_url = _start(model, database_url)
+    try:
+        _load(base_url, path, token)  # warm up every worker
+        benchmark.pedantic(_load, args=(base_url, path, token), rounds=3, iterations=1)
+        benchmark.extra_info["requests_per_second"] = round(CLIENTS * REQUESTS_PER_CLIENT / benchmark.stats["median"])
+    finally:
+        process.terminate()
+        process.wait(timeout=60)
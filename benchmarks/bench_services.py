@@ -0,0 +1,157 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.budget import Budget, PredictionType
+from app.models.recurring_rule import RecurrenceFrequency, RecurringRule
+from app.models.transaction import TransactionType, PaymentMethod
+from app.schemas.budget import BudgetResponse
+from app.schemas.transaction import TransactionCreate
+from app.repositories.user_repository import UserRepository
+from app.services.analytics_service import AnalyticsService
+from app.services.budget_service import BudgetService
+from app.services.dashboard_service import DashboardService
+from app.services.recurring_service import RecurringRuleService
+from app.services.transaction_service import TransactionService
+from benchmarks.conftest import DATA_SIZES, seed_user_data
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+def test_create_transaction(benchmark, db_session, size):
+    """Expense creation including category lookup, budget lookup and budget limit check"""
+    seed = seed_user_data(db_session, size)
+    service = TransactionService(db_session)
+    transaction_data = TransactionCreate(
+        amount=100,
+        transaction_date=seed["period_start"],
+        type=TransactionType.EXPENSE,
+        payment_method=PaymentMethod.CASH,
+        category_id=seed["category_ids"][0],
+        description="Benchmark",
+    )
+
+    benchmark(service.create_transaction, seed["user_id"], transaction_data)
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+def test_get_user_budgets(benchmark, db_session, size):
+    """Budget page with spending aggregation, scaling by number of budgets"""
+    seed = seed_user_data(db_session, size * 10, category_count=size)
+    service = BudgetService(db_session)
+
+    benchmark(service.get_user_budgets, seed["user_id"], 0, 100)
+
+
+def test_forecast_budget_page(benchmark, db_session):
+    """Forecasts for a 100-budget page from preloaded daily series; extra_info holds the per-budget cost"""
+    seed = seed_user_data(db_session, 100 * 30, category_count=100)
+    service = BudgetService(db_session)
+    page = service.repository.get_budgets_with_spending_data(seed["user_id"], 0, 100)
+    today = date.today()
+    daily_spending = service.repository.get_daily_spending([budget.id for budget in page], today)
+
+    def forecast_page():
+        return [
+            service._calculate_forecast(budget, budget.total_spent, daily_spending.get(budget.id, {}), today)
+            for budget in page
+        ]
+
+    benchmark(forecast_page)
+    benchmark.extra_info["per_budget_us"] = round(benchmark.stats.stats.median / len(page) * 1e6, 2)
+
+
+def test_budget_page_responses(benchmark, db_session):
+    """100-budget page from the query to validated BudgetResponse models, as GET /budgets/ builds it"""
+    seed = seed_user_data(db_session, 100 * 10, category_count=100)
+    service = BudgetService(db_session)
+
+    def budget_page():
+        budgets, _ = service.get_user_budgets(seed["user_id"], 0, 100)
+        return [BudgetResponse.model_validate(budget) for budget in budgets]
+
+    assert len(benchmark(budget_page)) == 100
+
+
+def test_dashboard_page_responses(benchmark, db_session):
+    """Dashboard with 100 budgets, recent transactions and top expenses, from the queries to the response model"""
+    seed = seed_user_data(db_session, 100 * 10, category_count=100)
+    service = DashboardService(db_session)
+
+    data = benchmark(
+        service.get_dashboard_data, seed["user_id"], transaction_limit=100, expense_limit=100, budget_limit=100
+    )
+    assert len(data.recent_transactions) == 100
+
+
+@pytest.mark.parametrize("period_days", [7, 31, 365])
+@pytest.mark.parametrize("prediction_type", [PredictionType.DAILY, PredictionType.WEEKDAYS])
+def test_calculate_prediction(benchmark, db_session, period_days, prediction_type):
+    """Prediction maths only; weekday counting is linear in the remaining period length"""
+    today = date.today()
+    budget = Budget(
+        amount=100000,
+        start_date=today,
+        end_date=today + timedelta(days=period_days - 1),
+        prediction_enabled=True,
+        prediction_type=prediction_type,
+    )
+    service = BudgetService(db_session)
+
+    benchmark(service._calculate_prediction, budget, 2500)
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+def test_get_dashboard_data(benchmark, db_session, size):
+    """Full dashboard assembly for the current month"""
+    seed = seed_user_data(db_session, size)
+    service = DashboardService(db_session)
+
+    benchmark(service.get_dashboard_data, seed["user_id"])
+
+
+@pytest.mark.parametrize("size", DATA_SIZES)
+@pytest.mark.parametrize("interval", ["day", "month"])
+def test_get_timeseries(benchmark, db_session, size, interval):
+    """Per-category time series over a year: database grouping plus gap-filling and moving averages"""
+    seed = seed_user_data(db_session, size)
+    service = AnalyticsService(db_session)
+    start_date = seed["period_end"] - timedelta(days=364)
+
+    benchmark(service.get_timeseries, seed["user_id"], start_date, seed["period_end"], interval, True)
+
+
+@pytest.mark.parametrize("size", [1000, 10000])
+@pytest.mark.parametrize("batch_size", [None, 1000])
+def test_delete_account(benchmark, db_session, size, batch_size):
+    """Set-based account deletion, in one transaction (inline) or in committed chunks (background job)"""
+    repository = UserRepository(db_session)
+
+    def setup():
+        seed = seed_user_data(db_session, size)
+        return (seed["user_id"],), {"batch_size": batch_size}
+
+    benchmark.pedantic(repository.delete_account, setup=setup, rounds=5)
+
+
+@pytest.mark.parametrize("rule_count", [100, 1000, 5000])
+def test_materialize_recurring_rules(benchmark, db_session, rule_count):
+    """One run over `rule_count` monthly income rules each one occurrence behind (multi-row inserts per batch)"""
+    seed = seed_user_data(db_session, 0)
+    service = RecurringRuleService(db_session)
+    as_of = seed["period_start"]
+
+    def setup():
+        db_session.query(RecurringRule).delete()
+        db_session.add_all([
+            RecurringRule(
+                user_id=seed["user_id"], category_id=seed["category_ids"][0], amount=100,
+                type=TransactionType.INCOME, payment_method=PaymentMethod.BANK_TRANSFER,
+                frequency=RecurrenceFrequency.MONTHLY, interval=1, day_of_month=as_of.day,
+                start_date=as_of, next_run_date=as_of,
+            )
+            for _ in range(rule_count)
+        ])
+        db_session.commit()
+        return (as_of,), {}
+
+    benchmark.pedantic(service.materialize_due, setup=setup, rounds=5)
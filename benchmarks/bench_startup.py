@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+from app.main import create_app
+
+# Modules that a cold import of the application should not load; they are imported on first use
+LAZY_MODULES = ["jose", "passlib.context", "cryptography"]
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+
+def test_cold_import(benchmark):
+    """Fresh interpreter importing app.main, as each server worker (or a preloading master) does"""
+    benchmark.pedantic(_run, args=("import app.main",), rounds=5, iterations=1)
+
+    loaded = _run(f"import sys, app.main; print([name for name in {LAZY_MODULES!r} if name in sys.modules])")
+    assert loaded.strip() == "[]"
+
+
+def test_create_app(benchmark):
+    """Building the app once the modules are imported: middleware and routes, no database connection"""
+    benchmark(create_app)
+
+
+@pytest.mark.parametrize("module", ["app.core.security", "app.config.database", "app.api.v1.router"])
+def test_module_import(benchmark, module):
+    """Cold import of one module; extra_info holds its own `-X importtime` cumulative cost in ms"""
+    def importtime():
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"], check=True, capture_output=True, text=True
+        )
+        return result.stderr
+
+    report = benchmark.pedantic(importtime, rounds=3, iterations=1)
+    line = next(line for line in report.splitlines() if line.rstrip().endswith(f"| {module}"))
+    benchmark.extra_info["cumulative_ms"] = int(line.split("|")[1]) / 1000
@@ -0,0 +1,101 @@
+import pytest
+import sqlite3
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, User, Category, Transaction, Budget, TransactionType, PaymentMethod
+
+# Benchmarks run against an in-memory SQLite database, like the integration tests
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+# Data sizes used to parameterize benchmarks so asymptotic behaviour is visible
+DATA_SIZES = [10, 100, 1000]
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@event.listens_for(engine, "connect")
+def setup_sqlite_date_adapters(dbapi_connection, connection_record):
+    """Configure SQLite connection to handle dates properly in Python 3.13+"""
+    if not hasattr(sqlite3, '_adapters_registered'):
+        sqlite3.register_adapter(date, lambda val: val.isoformat())
+        sqlite3.register_adapter(datetime, lambda val: val.isoformat())
+        sqlite3._adapters_registered = True
+
+
+BenchmarkSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    """Create a fresh database for each benchmark"""
+    Base.metadata.create_all(bind=engine)
+    db = BenchmarkSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+def seed_user_data(db, transaction_count: int, category_count: int = 10) -> dict:
+    """Insert a user with categories, a current budget per category and `transaction_count` expenses.
+
+    Rows are inserted in bulk so seeding cost stays out of the measured code paths.
+    """
+    today = date.today()
+    period_start = today.replace(day=1)
+    period_end = (period_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+    user = User(email="bench@example.com", first_name="Bench", last_name="User", hashed_password="x")
+    db.add(user)
+    db.flush()
+
+    categories = [Category(user_id=user.id, name=f"Category {i}") for i in range(category_count)]
+    db.add_all(categories)
+    db.flush()
+
+    budgets = [
+        Budget(
+            user_id=user.id,
+            category_id=category.id,
+            amount=10 ** 9,
+            start_date=period_start,
+            end_date=period_end,
+        )
+        for category in categories
+    ]
+    db.add_all(budgets)
+
+    if transaction_count:
+        db.execute(
+            Transaction.__table__.insert(),
+            [
+                {
+                    "user_id": user.id,
+                    "category_id": categories[i % category_count].id,
+                    "amount": 100 + i,
+                    "transaction_date": period_start + timedelta(days=i % (period_end - period_start).days),
+                    "type": TransactionType.EXPENSE if i % 5 else TransactionType.INCOME,
+                    "payment_method": PaymentMethod.CASH,
+                    "description": f"Transaction {i}",
+                    "created_at": datetime.now(),
+                    "updated_at": datetime.now(),
+                }
+                for i in range(transaction_count)
+            ],
+        )
+    db.commit()
+
+    return {
+        "user_id": user.id,
+        "category_ids": [category.id for category in categories],
+        "period_start": period_start,
+        "period_end": period_end,
+    }
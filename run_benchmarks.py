@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner script for the expenses tracker application.
+Runs the micro-benchmarks in benchmarks/ and compares them against a stored baseline.
+"""
+
+import sys
+import subprocess
+
+# Where pytest-benchmark stores saved runs (one sub-directory per machine/interpreter)
+BENCHMARK_STORAGE = "benchmarks/.results"
+
+# Name of the saved run used as the comparison baseline
+BASELINE_NAME = "baseline"
+
+# Maximum allowed slowdown of the median before a comparison fails
+REGRESSION_THRESHOLD = "10%"
+
+
+def run_command(command):
+    """Run a command and return the result"""
+    try:
+        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        print(result.stdout)
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+        return result.returncode
+    except Exception as e:
+        print(f"Error running command: {e}", file=sys.stderr)
+        return 1
+
+
+def main():
+    """Main benchmark runner function"""
+    if len(sys.argv) < 2:
+        print("Usage: python run_benchmarks.py <option> [filter]")
+        print("\nOptions:")
+        print("  all           - Run all benchmarks")
+        print("  save          - Run all benchmarks and store the results as the new baseline")
+        print("  compare       - Run all benchmarks and fail on >10% median regressions against the baseline")
+        print("\nAn optional filter is passed to pytest -k, e.g. 'python run_benchmarks.py compare dashboard'")
+        return 1
+
+    option = sys.argv[1].lower()
+    keyword = f" -k '{sys.argv[2]}'" if len(sys.argv) > 2 else ""
+
+    # Base pytest command
+    base_cmd = f"python -m pytest benchmarks/ -o python_files=bench_*.py -p no:cacheprovider --benchmark-storage={BENCHMARK_STORAGE}{keyword}"
+
+    # Command mapping
+    commands = {
+        "all": base_cmd,
+        "save": f"{base_cmd} --benchmark-save={BASELINE_NAME}",
+        "compare": (
+            f"{base_cmd} --benchmark-compare --benchmark-compare-fail=median:{REGRESSION_THRESHOLD} "
+            "--benchmark-columns=min,median,mean,stddev,rounds"
+        ),
+    }
+
+    if option not in commands:
+        print(f"Unknown option: {option}")
+        print("Run 'python run_benchmarks.py' to see available options")
+        return 1
+
+    print(f"Running: {commands[option]}")
+    return run_command(commands[option])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,7 @@ def main():
         print("  user          - Run user tests")
         print("  coverage      - Run tests with coverage report")
         print("  verbose       - Run tests with verbose output")
+        print("  parallel      - Run tests across all CPUs with pytest-xdist")
         return 1
 
     option = sys.argv[1].lower()
@@ -50,7 +51,8 @@ def main():
         "transactions": f"{base_cmd} tests/test_transactions_integration.py",
         "user": f"{base_cmd} tests/test_user_integration.py",
         "coverage": f"{base_cmd} tests/ --cov=app --cov-report=html --cov-report=term",
-        "verbose": f"{base_cmd} tests/ -v -s"
+        "verbose": f"{base_cmd} tests/ -v -s",
+        "parallel": f"{base_cmd} tests/ -n auto"
     }
 
     if option not in commands:
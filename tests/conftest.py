@@ -1,65 +1,138 @@
+import os
 import pytest
 import warnings
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.config.database import get_db
+from app.core.rate_limit import rate_limit_store
+from app.core.security import create_access_token, get_password_hash, pwd_context
 from app.models.base import Base
+from app.models.user import User
 import sqlite3
 from datetime import date, datetime
 
 # Suppress SQLite date adapter deprecation warnings in Python 3.13+
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="sqlalchemy.engine.default")
 
-# Test database URL (SQLite in-memory database)
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Test database URL (SQLite in-memory database unless TEST_DATABASE_URL points elsewhere)
+SQLALCHEMY_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///:memory:")
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+# bcrypt's minimum cost factor keeps hashing real but cheap; production uses the library default
+pwd_context.update(bcrypt__rounds=4)
+
+
+def _worker_database_url(database_url: str) -> str:
+    """Give every pytest-xdist worker its own database so parallel workers never share rows"""
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    url = make_url(database_url)
+    if not worker_id or not url.database or url.database == ":memory:":
+        # No xdist, or an in-memory database which is already private to the worker process
+        return database_url
+
+    if url.get_backend_name() == "sqlite":
+        root, extension = os.path.splitext(url.database)
+        return url.set(database=f"{root}_{worker_id}{extension}").render_as_string(hide_password=False)
+
+    worker_url = url.set(database=f"{url.database}_{worker_id}")
+    server_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    with server_engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": worker_url.database}
+        ).scalar()
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    server_engine.dispose()
+    return worker_url.render_as_string(hide_password=False)
+
+
+SQLALCHEMY_DATABASE_URL = _worker_database_url(SQLALCHEMY_DATABASE_URL)
+
+if SQLALCHEMY_DATABASE_URL == "sqlite:///:memory:":
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args=(
+        {"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
+    ))
 
 # Register custom date adapters for SQLite to avoid Python 3.12+ deprecation warnings
-@event.listens_for(engine, "connect")
-def setup_sqlite_date_adapters(dbapi_connection, connection_record):
-    """Configure SQLite connection to handle dates properly in Python 3.13+"""
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def setup_sqlite_date_adapters(dbapi_connection, connection_record):
+        """Configure SQLite connection to handle dates properly in Python 3.13+"""
+
+        # Register adapters if they haven't been registered yet
+        if not hasattr(sqlite3, '_adapters_registered'):
+            # Convert Python date to ISO format string for SQLite
+            sqlite3.register_adapter(date, lambda val: val.isoformat())
+            sqlite3.register_adapter(datetime, lambda val: val.isoformat())
+            sqlite3._adapters_registered = True
+
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
 
-    # Register adapters if they haven't been registered yet
-    if not hasattr(sqlite3, '_adapters_registered'):
-        # Convert Python date to ISO format string for SQLite
-        sqlite3.register_adapter(date, lambda val: val.isoformat())
-        sqlite3.register_adapter(datetime, lambda val: val.isoformat())
-        sqlite3._adapters_registered = True
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sessions join the per-test outer transaction; their commits only release a SAVEPOINT
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, join_transaction_mode="create_savepoint")
 
 
-def override_get_db():
+@pytest.fixture(scope="session")
+def database_schema():
+    """Create the schema once per test session (per xdist worker)"""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_connection(database_schema):
+    """Connection holding an outer transaction that is rolled back after each test"""
+    connection = engine.connect()
+    transaction = connection.begin()
     try:
-        db = TestingSessionLocal()
-        yield db
+        yield connection
     finally:
-        db.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database for each test"""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+def db_session(db_connection):
+    """Database session whose changes disappear when the test ends"""
+    db = TestingSessionLocal(bind=db_connection)
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start every test with fresh rate limit buckets; all requests share the test client's IP and user ids repeat"""
+    rate_limit_store.clear()
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_connection):
     """Create a test client with database dependency override"""
+    def override_get_db():
+        db = TestingSessionLocal(bind=db_connection)
+        try:
+            yield db
+        finally:
+            db.close()
+
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
@@ -117,26 +190,22 @@ def sample_transaction_data():
 
 
 @pytest.fixture
-def authenticated_user(client, sample_user_data):
-    """Create a user and return authentication token"""
-    # Register user
-    register_response = client.post("/api/v1/auth/register", json=sample_user_data)
-    assert register_response.status_code == 201
-    user_data = register_response.json()["data"]
-
-    # Login and get token
-    login_data = {
-        "email": sample_user_data["email"],
-        "password": sample_user_data["password"]
-    }
-    login_response = client.post("/api/v1/auth/login", json=login_data)
-    assert login_response.status_code == 200
+def authenticated_user(client, db_session, sample_user_data):
+    """Create a user directly in the database and return a pre-minted authentication token"""
+    user = User(
+        email=sample_user_data["email"],
+        first_name=sample_user_data["first_name"],
+        last_name=sample_user_data["last_name"],
+        hashed_password=get_password_hash(sample_user_data["password"]),
+    )
+    db_session.add(user)
+    db_session.commit()
 
-    token_data = login_response.json()["data"]
+    token = create_access_token(user_id=user.id, email=user.email)
     return {
-        "token": token_data["access_token"],
-        "user_id": user_data["id"],  # Get user_id from registration response
-        "headers": {"Authorization": f"Bearer {token_data['access_token']}"}
+        "token": token,
+        "user_id": user.id,
+        "headers": {"Authorization": f"Bearer {token}"}
     }
 
 
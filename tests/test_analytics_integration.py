@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.category import Category
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
+
+
+@pytest.fixture
+def history(db_session, authenticated_user):
+    """Transactions in two categories spread over January-March 2025, with an empty February"""
+    user_id = authenticated_user["user_id"]
+    food = Category(user_id=user_id, name="Food")
+    rent = Category(user_id=user_id, name="Rent")
+    db_session.add_all([food, rent])
+    db_session.flush()
+
+    rows = [
+        (food, TransactionType.EXPENSE, 1000, date(2025, 1, 6)),
+        (food, TransactionType.EXPENSE, 500, date(2025, 1, 8)),
+        (rent, TransactionType.EXPENSE, 3000, date(2025, 1, 1)),
+        (rent, TransactionType.INCOME, 9000, date(2025, 1, 31)),
+        (food, TransactionType.EXPENSE, 700, date(2025, 3, 2)),
+    ]
+    db_session.add_all([
+        Transaction(
+            user_id=user_id,
+            category_id=category.id,
+            type=type_,
+            amount=amount,
+            transaction_date=day,
+            payment_method=PaymentMethod.CASH,
+        )
+        for category, type_, amount, day in rows
+    ])
+    db_session.commit()
+    return {"food": food.id, "rent": rent.id}
+
+
+def _timeseries(client, headers, **params):
+    response = client.get("/api/v1/analytics/timeseries", params=params, headers=headers)
+    assert response.status_code == 200, response.json()
+    return response.json()["data"]
+
+
+class TestTimeseries:
+    """Integration tests for GET /api/v1/analytics/timeseries"""
+
+    def test_monthly_totals_are_gap_filled(self, client: TestClient, authenticated_user, history):
+        data = _timeseries(client, authenticated_user["headers"], start_date="2025-01-01", end_date="2025-03-31", window=2)
+
+        assert data["buckets"] == ["2025-01-01", "2025-02-01", "2025-03-01"]
+        series = {item["type"]: item for item in data["series"]}
+        assert series["expense"]["totals"] == [4500, 0, 700]
+        assert series["expense"]["cumulative"] == [4500, 4500, 5200]
+        assert series["expense"]["moving_average"] == [4500.0, 2250.0, 350.0]
+        assert series["income"]["totals"] == [9000, 0, 0]
+
+    def test_weekly_buckets_start_on_monday(self, client: TestClient, authenticated_user, history):
+        data = _timeseries(
+            client, authenticated_user["headers"], start_date="2025-01-01", end_date="2025-01-19", interval="week", type="expense"
+        )
+
+        assert data["buckets"] == ["2024-12-30", "2025-01-06", "2025-01-13"]
+        assert [item["type"] for item in data["series"]] == ["expense"]
+        assert data["series"][0]["totals"] == [3000, 1500, 0]
+
+    def test_series_per_category(self, client: TestClient, authenticated_user, history):
+        data = _timeseries(
+            client, authenticated_user["headers"], start_date="2025-01-01", end_date="2025-01-08", interval="day", group_by_category=True
+        )
+
+        assert len(data["buckets"]) == 8
+        by_key = {(item["category"], item["type"]): item["totals"] for item in data["series"]}
+        assert list(by_key) == [("Food", "expense"), ("Rent", "expense")]
+        assert by_key[("Food", "expense")][5] == 1000
+        assert by_key[("Food", "expense")][7] == 500
+        assert sum(by_key[("Rent", "expense")]) == 3000
+
+    def test_invalid_ranges_are_rejected(self, client: TestClient, authenticated_user):
+        headers = authenticated_user["headers"]
+        reversed_range = client.get(
+            "/api/v1/analytics/timeseries", params={"start_date": "2025-02-01", "end_date": "2025-01-01"}, headers=headers
+        )
+        too_long = client.get(
+            "/api/v1/analytics/timeseries", params={"start_date": "2020-01-01", "end_date": "2025-01-01", "interval": "day"}, headers=headers
+        )
+
+        assert reversed_range.status_code == 400
+        assert too_long.status_code == 400
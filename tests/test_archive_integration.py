@@ -0,0 +1,94 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.models.archived_transaction import ArchivedTransaction
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
+from app.repositories.archive_repository import ArchiveRepository, archive_cutoff
+from app.repositories.transaction_repository import TransactionRepository
+from app.constants.messages import CategoryMessages
+
+
+def _add_transaction(db_session, user_id, category_id, transaction_date, amount=1000, type=TransactionType.EXPENSE):
+    transaction = Transaction(
+        user_id=user_id,
+        category_id=category_id,
+        amount=amount,
+        transaction_date=transaction_date,
+        type=type,
+        payment_method=PaymentMethod.CASH,
+    )
+    db_session.add(transaction)
+    db_session.flush()
+    return transaction
+
+
+class TestTransactionArchive:
+    """Tests for moving old transactions to the archive and reading them back"""
+
+    def test_archive_cutoff_is_start_of_month(self):
+        assert archive_cutoff(24, today=date(2026, 10, 19)) == date(2024, 10, 1)
+
+    def test_archive_moves_only_old_rows(self, db_session, authenticated_user, created_category):
+        user_id = authenticated_user["user_id"]
+        old_id = _add_transaction(db_session, user_id, created_category["id"], date(2020, 1, 15)).id
+        recent_id = _add_transaction(db_session, user_id, created_category["id"], date.today()).id
+
+        moved = ArchiveRepository(db_session).archive_before(date(2021, 1, 1), batch_size=1)
+
+        assert moved == 1
+        assert db_session.query(Transaction).filter(Transaction.id == recent_id).count() == 1
+        assert db_session.query(Transaction).filter(Transaction.id == old_id).count() == 0
+        archived = db_session.get(ArchivedTransaction, old_id)
+        assert archived.transaction_date == date(2020, 1, 15)
+        assert archived.archived_at is not None
+
+    def test_listing_includes_archived_transactions(self, client: TestClient, db_session, authenticated_user, created_category):
+        user_id = authenticated_user["user_id"]
+        _add_transaction(db_session, user_id, created_category["id"], date(2020, 1, 15))
+        _add_transaction(db_session, user_id, created_category["id"], date(2020, 3, 15))
+        _add_transaction(db_session, user_id, created_category["id"], date.today())
+        ArchiveRepository(db_session).archive_before(date(2021, 1, 1))
+
+        response = client.get(
+            "/api/v1/transactions/",
+            params={"sort_by": "transaction_date"},
+            headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        dates = [item["transaction_date"] for item in data["data"]]
+        assert dates == [date.today().isoformat(), "2020-03-15", "2020-01-15"]
+        assert all(item["category"]["id"] == created_category["id"] for item in data["data"])
+
+        response = client.get(
+            "/api/v1/transactions/",
+            params={"sort_by": "transaction_date", "page": 2, "per_page": 2},
+            headers=authenticated_user["headers"]
+        )
+        assert [item["transaction_date"] for item in response.json()["data"]] == ["2020-01-15"]
+
+    def test_spending_total_reads_archive_for_old_ranges(self, db_session, authenticated_user, created_category):
+        user_id = authenticated_user["user_id"]
+        _add_transaction(db_session, user_id, created_category["id"], date(2020, 1, 15), amount=700)
+        _add_transaction(db_session, user_id, created_category["id"], date(2020, 1, 20), amount=300)
+        ArchiveRepository(db_session).archive_before(date(2020, 1, 16))
+
+        repository = TransactionRepository(db_session)
+        total = repository.get_spending_total(user_id, created_category["id"], date(2020, 1, 1), date(2020, 1, 31))
+
+        assert total == 1000
+
+    def test_cannot_delete_category_with_archived_transactions(self, client: TestClient, db_session, authenticated_user, created_category):
+        _add_transaction(db_session, authenticated_user["user_id"], created_category["id"], date(2020, 1, 15))
+        ArchiveRepository(db_session).archive_before(date(2021, 1, 1))
+
+        response = client.delete(
+            f"/api/v1/categories/{created_category['id']}",
+            headers=authenticated_user["headers"]
+        )
+
+        assert response.status_code == 409
+        assert response.json()["message"] == CategoryMessages.CANNOT_DELETE_HAS_TRANSACTIONS.value
@@ -1,6 +1,12 @@
+import time
+from datetime import datetime, timedelta, timezone
+
 from fastapi.testclient import TestClient
 
 from app.constants.messages import AuthMessages
+from app.core.revocation import RevocationList
+from app.core.security import create_access_token, token_cache
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 
 
 class TestAuthEndpoints:
@@ -144,3 +150,173 @@ class TestAuthEndpoints:
 
         response = client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 404  # Treated as user not found
+
+    def test_cached_token_reused_across_requests(self, client: TestClient, authenticated_user):
+        """Test that a verified token is cached and keeps authenticating requests"""
+        token_cache.clear()
+
+        for _ in range(3):
+            response = client.get("/api/v1/users/", headers=authenticated_user["headers"])
+            assert response.status_code == 200
+
+        assert len(token_cache) == 1
+
+    def test_expired_token_rejected(self, client: TestClient, authenticated_user):
+        """Test that an expired token is rejected and never cached"""
+        token = create_access_token(
+            user_id=authenticated_user["user_id"],
+            email="test@example.com",
+            expires_delta=timedelta(seconds=-1)
+        )
+
+        response = client.get("/api/v1/users/", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+
+    def test_cached_token_expires(self, client: TestClient, authenticated_user, monkeypatch):
+        """Test that a cached token payload is dropped once its exp has passed"""
+        token_cache.clear()
+        assert client.get("/api/v1/users/", headers=authenticated_user["headers"]).status_code == 200
+        assert len(token_cache) == 1
+
+        now = time.time()
+        monkeypatch.setattr("app.core.cache.time.time", lambda: now + timedelta(days=30).total_seconds())
+        cache_key = next(iter(token_cache._data))
+        assert token_cache.get(cache_key) is None
+        assert len(token_cache) == 0
+
+    def _login(self, client: TestClient, sample_user_data):
+        client.post("/api/v1/auth/register", json=sample_user_data)
+        response = client.post("/api/v1/auth/login", json={
+            "email": sample_user_data["email"],
+            "password": sample_user_data["password"]
+        })
+        assert response.status_code == 200
+        return response.json()["data"]
+
+    def test_login_returns_refresh_token(self, client: TestClient, sample_user_data):
+        """Test that login issues a short-lived access token and a refresh token"""
+        token_data = self._login(client, sample_user_data)
+
+        assert isinstance(token_data["refresh_token"], str)
+        assert token_data["refresh_token"] != token_data["access_token"]
+        assert token_data["refresh_expires_in"] > token_data["expires_in"]
+
+    def test_refresh_token_success(self, client: TestClient, sample_user_data):
+        """Test exchanging a refresh token for a new token pair"""
+        token_data = self._login(client, sample_user_data)
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == AuthMessages.TOKEN_REFRESHED.value
+        new_tokens = data["data"]
+        assert new_tokens["refresh_token"] != token_data["refresh_token"]
+
+        profile_response = client.get(
+            "/api/v1/users/",
+            headers={"Authorization": f"Bearer {new_tokens['access_token']}"}
+        )
+        assert profile_response.status_code == 200
+
+    def test_refresh_token_rotation(self, client: TestClient, sample_user_data):
+        """Test that a refresh token can only be used once"""
+        token_data = self._login(client, sample_user_data)
+        client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+
+        assert response.status_code == 401
+        assert response.json()["message"] == AuthMessages.INVALID_REFRESH_TOKEN.value
+
+    def test_concurrent_refresh_rotates_once(self, client: TestClient, sample_user_data, monkeypatch):
+        """Test that of two refreshes passing the revocation check together, only one gets tokens"""
+        token_data = self._login(client, sample_user_data)
+        # Both requests see the token as not yet revoked, as when they race past the check
+        monkeypatch.setattr("app.services.auth_service.revocation_list.is_revoked", lambda jti: False)
+        monkeypatch.setattr("app.repositories.revoked_token_repository.RevokedTokenRepository.is_revoked", lambda self, jti: False)
+
+        first = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+        second = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+        assert second.json()["message"] == AuthMessages.INVALID_REFRESH_TOKEN.value
+
+    def test_refresh_with_access_token_fails(self, client: TestClient, sample_user_data):
+        """Test that an access token is not accepted as a refresh token"""
+        token_data = self._login(client, sample_user_data)
+
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["access_token"]})
+
+        assert response.status_code == 401
+
+    def test_refresh_token_cannot_authenticate(self, client: TestClient, sample_user_data):
+        """Test that a refresh token is not accepted as a bearer access token"""
+        token_data = self._login(client, sample_user_data)
+
+        response = client.get(
+            "/api/v1/users/",
+            headers={"Authorization": f"Bearer {token_data['refresh_token']}"}
+        )
+
+        assert response.status_code == 401
+
+    def test_logout_revokes_tokens(self, client: TestClient, sample_user_data):
+        """Test that logout revokes both the access token and the refresh token"""
+        token_data = self._login(client, sample_user_data)
+        headers = {"Authorization": f"Bearer {token_data['access_token']}"}
+
+        response = client.post(
+            "/api/v1/auth/logout",
+            json={"refresh_token": token_data["refresh_token"]},
+            headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == AuthMessages.LOGOUT_SUCCESS.value
+        assert client.get("/api/v1/users/", headers=headers).status_code == 401
+        refresh_response = client.post("/api/v1/auth/refresh", json={"refresh_token": token_data["refresh_token"]})
+        assert refresh_response.status_code == 401
+
+    def test_logout_with_invalid_refresh_token_keeps_session(self, client: TestClient, sample_user_data):
+        """Test that a rejected refresh token does not revoke the caller's access token"""
+        token_data = self._login(client, sample_user_data)
+        headers = {"Authorization": f"Bearer {token_data['access_token']}"}
+
+        response = client.post("/api/v1/auth/logout", json={"refresh_token": "not-a-token"}, headers=headers)
+
+        assert response.status_code == 401
+        assert response.json()["message"] == AuthMessages.INVALID_REFRESH_TOKEN.value
+        assert client.get("/api/v1/users/", headers=headers).status_code == 200
+
+    def test_logout_unauthorized(self, client: TestClient):
+        """Test logout without authentication"""
+        response = client.post("/api/v1/auth/logout")
+        assert response.status_code == 401
+
+
+class TestRevocationList:
+    """Tests for the in-memory revocation list and its database sync"""
+
+    def test_local_revocation_survives_syncs_until_replicated(self, db_session):
+        revocations = RevocationList(sync_interval=60)
+        expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+        revocations.add("jti-1", expires_at)
+
+        # The sync reads a database (say a lagging replica) that has not seen the revocation yet
+        revocations.sync(db_session)
+        assert revocations.is_revoked("jti-1")
+
+        RevokedTokenRepository(db_session).revoke("jti-1", 1, expires_at)
+        revocations.sync(db_session)
+        assert revocations.is_revoked("jti-1")
+        assert revocations._local == {}
+
+    def test_expired_local_revocation_is_dropped(self, db_session):
+        revocations = RevocationList(sync_interval=60)
+        revocations.add("jti-1", datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1))
+
+        revocations.sync(db_session)
+
+        assert not revocations.is_revoked("jti-1")
@@ -1,6 +1,10 @@
+from datetime import date, timedelta
+
 from fastapi.testclient import TestClient
 
 from app.constants.messages import BudgetMessages
+from app.jobs.tasks import rollover_budgets
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
 
 
 class TestBudgetEndpoints:
@@ -438,3 +442,162 @@ class TestBudgetEndpoints:
             headers=authenticated_user["headers"]
         )
         assert response.status_code == 422  # Validation error
+
+    def test_get_budgets_forecast(self, client: TestClient, db_session, authenticated_user, created_category):
+        """Active budgets get a forecast projected from their daily spend so far"""
+        today = date.today()
+        budget_ids = {}
+        for amount in (50000, 9000):
+            category = client.post(
+                "/api/v1/categories/", json={"name": f"Forecast {amount}"}, headers=authenticated_user["headers"]
+            ).json()["data"]
+            response = client.post(
+                "/api/v1/budgets/",
+                json={
+                    "category_id": category["id"],
+                    "amount": amount,
+                    "start_date": (today - timedelta(days=9)).isoformat(),
+                    "end_date": (today + timedelta(days=20)).isoformat(),
+                },
+                headers=authenticated_user["headers"]
+            )
+            budget_ids[amount] = response.json()["data"]["id"]
+            # 3000 spent over the 10 elapsed days
+            db_session.add_all([
+                Transaction(
+                    user_id=authenticated_user["user_id"],
+                    category_id=category["id"],
+                    amount=1000,
+                    transaction_date=today - timedelta(days=days_ago),
+                    type=TransactionType.EXPENSE,
+                    payment_method=PaymentMethod.CASH,
+                )
+                for days_ago in (9, 4, 0)
+            ])
+        db_session.commit()
+
+        response = client.get("/api/v1/budgets/", headers=authenticated_user["headers"])
+        assert response.status_code == 200
+        forecasts = {budget["id"]: budget["forecast"] for budget in response.json()["data"]}
+
+        roomy = forecasts[budget_ids[50000]]
+        assert roomy["burn_rate"] == 300
+        assert roomy["days_elapsed"] == 10
+        assert roomy["days_remaining"] == 20
+        assert roomy["projected_spend"] == 9000
+        assert roomy["projected_remaining"] == 41000
+        assert roomy["overrun_probability"] < 0.001
+        # Projected to land exactly on the limit: as likely to overrun as not
+        assert forecasts[budget_ids[9000]]["overrun_probability"] == 0.5
+
+    def test_get_budgets_forecast_with_future_expenses(self, client: TestClient, authenticated_user, created_category):
+        """Future-dated expenses count as spent but stay out of the daily spend distribution"""
+        headers = authenticated_user["headers"]
+        today = date.today()
+        budget = client.post("/api/v1/budgets/", json={
+            "category_id": created_category["id"],
+            "amount": 50000,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=9)).isoformat(),
+        }, headers=headers).json()["data"]
+        for days_ahead in (5, 6):
+            response = client.post("/api/v1/transactions/", json={
+                "amount": 1000,
+                "transaction_date": (today + timedelta(days=days_ahead)).isoformat(),
+                "type": "expense",
+                "payment_method": "cash",
+                "category_id": created_category["id"],
+            }, headers=headers)
+            assert response.status_code == 201
+
+        response = client.get("/api/v1/budgets/", headers=headers)
+        assert response.status_code == 200
+        forecast = next(item for item in response.json()["data"] if item["id"] == budget["id"])["forecast"]
+        assert forecast["burn_rate"] == 0
+        assert forecast["projected_spend"] == 2000
+        assert forecast["overrun_probability"] == 0
+
+    def test_rollover_budgets(self, client: TestClient, db_session, authenticated_user, created_category):
+        """Test rollover clones budgets into their next period, carrying over unspent amounts"""
+        headers = authenticated_user["headers"]
+        client.post("/api/v1/budgets/", json={
+            "category_id": created_category["id"], "amount": 50000,
+            "start_date": "2025-01-01", "end_date": "2025-01-31",
+        }, headers=headers)
+        db_session.add(Transaction(
+            user_id=authenticated_user["user_id"], category_id=created_category["id"], amount=20000,
+            transaction_date=date(2025, 1, 10), type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+        ))
+        db_session.commit()
+
+        response = client.post(
+            "/api/v1/budgets/rollover", json={"as_of": "2025-01-31", "carry_over": True}, headers=headers
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["message"] == BudgetMessages.ROLLED_OVER_SUCCESS.value
+        assert data["data"]["skipped"] == 0
+        [budget] = data["data"]["created"]
+        assert budget["start_date"] == "2025-02-01"
+        assert budget["end_date"] == "2025-02-28"
+        assert budget["amount"] == 80000
+
+        # The next period exists now, so rolling over again creates nothing
+        repeat = client.post("/api/v1/budgets/rollover", json={"as_of": "2025-01-31"}, headers=headers).json()
+        assert repeat["data"] == {"created": [], "skipped": 1}
+
+    def test_rollover_keeps_length_of_custom_periods(self, client: TestClient, authenticated_user, created_category):
+        """Test periods that are not whole months keep their length"""
+        headers = authenticated_user["headers"]
+        client.post("/api/v1/budgets/", json={
+            "category_id": created_category["id"], "amount": 7000,
+            "start_date": "2025-03-03", "end_date": "2025-03-16",
+        }, headers=headers)
+
+        response = client.post("/api/v1/budgets/rollover", json={"as_of": "2025-03-10"}, headers=headers)
+
+        [budget] = response.json()["data"]["created"]
+        assert (budget["start_date"], budget["end_date"], budget["amount"]) == ("2025-03-17", "2025-03-30", 7000)
+
+    def test_rollover_job_for_opted_in_users(self, client: TestClient, db_session, authenticated_user, created_category):
+        """Test the nightly job rolls over budgets whose period has ended, catching up on missed days"""
+        headers = authenticated_user["headers"]
+        today = date.today()
+        # Ended three days ago: a missed run must not lose it; carry-over counts its whole period
+        ended = client.post("/api/v1/budgets/", json={
+            "category_id": created_category["id"], "amount": 6000,
+            "start_date": (today - timedelta(days=8)).isoformat(), "end_date": (today - timedelta(days=3)).isoformat(),
+        }, headers=headers).json()["data"]
+        db_session.add(Transaction(
+            user_id=authenticated_user["user_id"], category_id=created_category["id"], amount=1000,
+            transaction_date=today - timedelta(days=3), type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+        ))
+        db_session.commit()
+        # Still running, and ended before the lookback window: both left alone
+        other = client.post("/api/v1/categories/", json={"name": "Running"}, headers=headers).json()["data"]
+        client.post("/api/v1/budgets/", json={
+            "category_id": other["id"], "amount": 3000,
+            "start_date": (today - timedelta(days=5)).isoformat(), "end_date": today.isoformat(),
+        }, headers=headers)
+        client.post("/api/v1/budgets/", json={
+            "category_id": other["id"], "amount": 3000,
+            "start_date": (today - timedelta(days=30)).isoformat(), "end_date": (today - timedelta(days=20)).isoformat(),
+        }, headers=headers)
+
+        rollover_budgets(db_session)
+        assert len(client.get("/api/v1/budgets/", headers=headers).json()["data"]) == 3
+
+        response = client.put(
+            "/api/v1/users/", json={"budget_rollover_enabled": True, "budget_rollover_carry_over": True}, headers=headers
+        )
+        assert response.json()["data"]["budget_rollover_enabled"] is True
+        rollover_budgets(db_session)
+        rollover_budgets(db_session)
+
+        budgets = client.get("/api/v1/budgets/", headers=headers).json()["data"]
+        assert len(budgets) == 4
+        clone = next(budget for budget in budgets if budget["start_date"] == (today - timedelta(days=2)).isoformat())
+        assert clone["category_id"] == ended["category_id"]
+        assert clone["end_date"] == (today + timedelta(days=3)).isoformat()
+        assert clone["amount"] == 6000 + 5000
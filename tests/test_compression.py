@@ -0,0 +1,104 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, available_encodings
+
+PAYLOAD = {"data": [{"id": i, "description": f"Transaction {i}", "amount": 1000 + i} for i in range(200)]}
+
+
+def _client(encodings=("zstd", "br", "gzip"), minimum_size=500):
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return JSONResponse(PAYLOAD, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small():
+        return JSONResponse({"ok": True})
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" + b"0" * 5000, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        def rows():
+            yield "["
+            for i in range(500):
+                yield json.dumps({"id": i, "description": f"Transaction {i}"}) + ("," if i < 499 else "")
+            yield "]"
+        return StreamingResponse(rows(), media_type="application/json")
+
+    @app.get("/short-stream")
+    def short_stream():
+        return StreamingResponse(iter(["[", "1", "]"]), media_type="application/json")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=list(encodings),
+        levels={"gzip": 6, "br": 4, "zstd": 3},
+        minimum_size=minimum_size,
+    )
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """Tests for response compression"""
+
+    def test_large_json_is_gzipped(self):
+        response = _client().get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["ETag"] == '"abc-gzip"'
+        assert int(response.headers["Content-Length"]) < len(json.dumps(PAYLOAD))
+        assert response.json() == PAYLOAD
+
+    @pytest.mark.parametrize("encoding", ["br", "zstd"])
+    def test_optional_encodings(self, encoding):
+        if encoding not in available_encodings():
+            pytest.skip(f"{encoding} support is not installed")
+        response = _client().get("/large", headers={"Accept-Encoding": f"gzip;q=0.5, {encoding}"})
+
+        assert response.headers["Content-Encoding"] == encoding
+        assert response.json() == PAYLOAD
+
+    def test_server_preference_breaks_ties(self):
+        response = _client(encodings=("gzip",)).get("/large", headers={"Accept-Encoding": "br, gzip, zstd"})
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_identity_when_nothing_acceptable(self):
+        response = _client().get("/large", headers={"Accept-Encoding": "identity, gzip;q=0"})
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == PAYLOAD
+
+    def test_small_response_is_not_compressed(self):
+        response = _client().get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.json() == {"ok": True}
+
+    def test_content_type_outside_allowlist_is_not_compressed(self):
+        response = _client().get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert len(response.content) == 5004
+
+    def test_streaming_response_is_compressed_incrementally(self):
+        client = _client()
+        with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert "Content-Length" not in response.headers
+            raw = b"".join(response.iter_raw())
+
+        assert len(json.loads(gzip.decompress(raw))) == 500
+
+    def test_short_stream_is_sent_uncompressed(self):
+        response = _client().get("/short-stream", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        assert response.json() == [1]
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestConditionalGet:
+    """Integration tests for ETag / Last-Modified handling on read endpoints"""
+
+    def test_read_endpoints_send_validators(self, client: TestClient, authenticated_user):
+        for path in ("/api/v1/categories/", "/api/v1/budgets/", "/api/v1/dashboard/"):
+            response = client.get(path, headers=authenticated_user["headers"])
+            assert response.headers["ETag"].startswith('"')
+            assert "Last-Modified" in response.headers
+            assert response.headers["Cache-Control"] == "private, no-cache"
+
+    def test_matching_etag_returns_304(self, client: TestClient, authenticated_user, created_category):
+        response = client.get("/api/v1/categories/", headers=authenticated_user["headers"])
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        headers = {**authenticated_user["headers"], "If-None-Match": etag}
+        cached = client.get("/api/v1/categories/", headers=headers)
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        weak = client.get("/api/v1/categories/", headers={**headers, "If-None-Match": f'"other", W/{etag}'})
+        assert weak.status_code == 304
+
+    def test_write_changes_etag(self, client: TestClient, authenticated_user, created_category):
+        etag = client.get("/api/v1/categories/", headers=authenticated_user["headers"]).headers["ETag"]
+
+        response = client.put(
+            f"/api/v1/categories/{created_category['id']}",
+            json={"name": "Groceries"},
+            headers=authenticated_user["headers"]
+        )
+        assert response.status_code == 200
+
+        refreshed = client.get("/api/v1/categories/", headers={**authenticated_user["headers"], "If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etag
+        assert refreshed.json()["data"][0]["name"] == "Groceries"
+
+    def test_write_and_version_bump_commit_together(self, client: TestClient, authenticated_user, created_category, monkeypatch):
+        etag = client.get("/api/v1/categories/", headers=authenticated_user["headers"]).headers["ETag"]
+
+        def fail(self, user_id):
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr("app.repositories.user_repository.UserRepository.bump_data_version", fail)
+        with pytest.raises(RuntimeError):
+            client.put(
+                f"/api/v1/categories/{created_category['id']}",
+                json={"name": "Groceries"},
+                headers=authenticated_user["headers"]
+            )
+        monkeypatch.undo()
+
+        # The version was not bumped, so neither may the data have changed
+        cached = client.get("/api/v1/categories/", headers={**authenticated_user["headers"], "If-None-Match": etag})
+        assert cached.status_code == 304
+        listing = client.get("/api/v1/categories/", headers=authenticated_user["headers"])
+        assert listing.json()["data"][0]["name"] == created_category["name"]
+
+    def test_etag_depends_on_query_and_path(self, client: TestClient, authenticated_user):
+        first = client.get("/api/v1/budgets/", params={"page": 1}, headers=authenticated_user["headers"])
+        second = client.get("/api/v1/budgets/", params={"page": 2}, headers=authenticated_user["headers"])
+        categories = client.get("/api/v1/categories/", headers=authenticated_user["headers"])
+
+        assert len({first.headers["ETag"], second.headers["ETag"], categories.headers["ETag"]}) == 3
+
+    def test_if_modified_since(self, client: TestClient, authenticated_user):
+        response = client.get("/api/v1/categories/", headers=authenticated_user["headers"])
+        last_modified = response.headers["Last-Modified"]
+
+        cached = client.get("/api/v1/categories/", headers={**authenticated_user["headers"], "If-Modified-Since": last_modified})
+        assert cached.status_code == 304
+
+        earlier = format_datetime(datetime.now(timezone.utc) - timedelta(days=2), usegmt=True)
+        stale = client.get("/api/v1/categories/", headers={**authenticated_user["headers"], "If-Modified-Since": earlier})
+        assert stale.status_code == 200
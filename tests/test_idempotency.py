@@ -0,0 +1,98 @@
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.models.idempotency_key import IdempotencyKey
+from app.models.transaction import Transaction
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+
+def _income(category_id: int, amount: int = 2500) -> dict:
+    return {
+        "amount": amount,
+        "category_id": category_id,
+        "type": "income",
+        "payment_method": "cash",
+        "transaction_date": date.today().isoformat(),
+        "description": "Salary",
+    }
+
+
+class TestIdempotencyKeys:
+    """Integration tests for the Idempotency-Key header on create endpoints"""
+
+    def test_retry_replays_response_without_creating_again(
+            self, client: TestClient, db_session, authenticated_user, created_category
+    ):
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "retry-1"}
+
+        first = client.post("/api/v1/transactions/", json=_income(created_category["id"]), headers=headers)
+        retry = client.post("/api/v1/transactions/", json=_income(created_category["id"]), headers=headers)
+
+        assert first.status_code == 201
+        assert retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        count = db_session.query(Transaction).filter(Transaction.user_id == authenticated_user["user_id"]).count()
+        assert count == 1
+
+    def test_requests_without_key_are_not_deduplicated(self, client: TestClient, db_session, authenticated_user, created_category):
+        for _ in range(2):
+            response = client.post("/api/v1/transactions/", json=_income(created_category["id"]), headers=authenticated_user["headers"])
+            assert response.status_code == 201
+
+        assert db_session.query(IdempotencyKey).count() == 0
+
+    def test_key_reused_for_different_body_is_rejected(self, client: TestClient, authenticated_user, created_category):
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "retry-2"}
+        client.post("/api/v1/transactions/", json=_income(created_category["id"]), headers=headers)
+
+        response = client.post("/api/v1/transactions/", json=_income(created_category["id"], amount=999), headers=headers)
+
+        assert response.status_code == 400
+
+    def test_duplicate_of_in_progress_request_conflicts(self, client: TestClient, db_session, authenticated_user, created_category):
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "retry-3", "Content-Type": "application/json"}
+        body = json.dumps(_income(created_category["id"])).encode()
+        now = datetime.now()
+        # A first attempt with the same request that has claimed the key but not finished yet
+        IdempotencyRepository(db_session).claim(
+            authenticated_user["user_id"],
+            "retry-3",
+            hashlib.sha256(b"POST /api/v1/transactions/\n" + body).hexdigest(),
+            expires_at=now + timedelta(hours=1),
+            now=now,
+        )
+
+        response = client.post("/api/v1/transactions/", content=body, headers=headers)
+
+        assert response.status_code == 409
+
+    def test_failed_request_releases_key(self, client: TestClient, authenticated_user, created_category, sample_budget_data):
+        headers = {**authenticated_user["headers"], "Idempotency-Key": "budget-1"}
+        budget = {**sample_budget_data, "category_id": created_category["id"], "amount": 0}
+
+        failed = client.post("/api/v1/budgets/", json=budget, headers=headers)
+        assert failed.status_code == 422
+
+        budget["amount"] = 50000
+        created = client.post("/api/v1/budgets/", json=budget, headers=headers)
+        replayed = client.post("/api/v1/budgets/", json=budget, headers=headers)
+
+        assert created.status_code == 201
+        assert replayed.headers["Idempotent-Replayed"] == "true"
+        assert replayed.json()["data"]["id"] == created.json()["data"]["id"]
+
+    def test_expired_key_is_claimed_again(self, db_session, authenticated_user):
+        repository = IdempotencyRepository(db_session)
+        now = datetime.now()
+        repository.claim(authenticated_user["user_id"], "old", "a" * 64, expires_at=now - timedelta(seconds=1), now=now - timedelta(days=1))
+
+        record, claimed = repository.claim(authenticated_user["user_id"], "old", "b" * 64, expires_at=now + timedelta(hours=1), now=now)
+
+        assert claimed is True
+        assert record.request_hash == "b" * 64
+        assert repository.delete_expired(now + timedelta(hours=2)) == 1
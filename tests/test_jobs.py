@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.jobs import enqueue, job, periodic_jobs
+from app.jobs.worker import Worker
+from app.models.job import Job, JobStatus
+from tests.conftest import TestingSessionLocal
+
+calls = []
+
+
+@job("tests.record", max_attempts=3)
+def record(db, value):
+    calls.append(value)
+
+
+@job("tests.explode", max_attempts=2)
+def explode(db):
+    raise RuntimeError("boom")
+
+
+@job("tests.tick", every=timedelta(minutes=10))
+def tick(db):
+    calls.append("tick")
+
+
+@pytest.fixture
+def worker(db_connection):
+    calls.clear()
+    return Worker(lambda: TestingSessionLocal(bind=db_connection), worker_id="test-worker", poll_interval=0)
+
+
+class TestJobQueue:
+    """Tests for the database-backed job queue and worker"""
+
+    def test_enqueued_job_runs_once(self, db_session, worker):
+        queued = enqueue(db_session, "tests.record", {"value": 42})
+
+        assert worker.run_once() is True
+        assert worker.run_once() is False
+
+        db_session.expire_all()
+        finished = db_session.get(Job, queued.id)
+        assert calls == [42]
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.attempts == 1
+        assert finished.locked_by == "test-worker"
+        assert finished.finished_at is not None
+
+    def test_future_job_waits_for_run_at(self, db_session, worker):
+        enqueue(db_session, "tests.record", {"value": 1}, run_at=datetime.now() + timedelta(hours=1))
+
+        assert worker.run_once() is False
+        assert calls == []
+
+    def test_failed_job_is_retried_with_backoff_then_failed(self, db_session, worker):
+        queued = enqueue(db_session, "tests.explode")
+
+        assert worker.run_once() is True
+        db_session.expire_all()
+        retried = db_session.get(Job, queued.id)
+        assert retried.status == JobStatus.QUEUED
+        assert retried.run_at > datetime.now()
+        assert "RuntimeError: boom" in retried.last_error
+
+        # Make the retry due now instead of waiting out the backoff
+        retried.run_at = datetime.now()
+        db_session.commit()
+        assert worker.run_once() is True
+
+        db_session.expire_all()
+        failed = db_session.get(Job, queued.id)
+        assert failed.status == JobStatus.FAILED
+        assert failed.attempts == 2
+        assert worker.run_once() is False
+
+    def test_stale_running_job_is_requeued(self, db_session, worker):
+        queued = enqueue(db_session, "tests.record", {"value": 7})
+        queued.status = JobStatus.RUNNING
+        queued.locked_by = "dead-worker"
+        queued.locked_at = datetime.now() - timedelta(days=1)
+        db_session.commit()
+
+        assert worker.run_once() is True
+        assert calls == [7]
+
+    def test_stale_job_out_of_attempts_is_failed(self, db_session, worker):
+        queued = enqueue(db_session, "tests.record", {"value": 7})
+        queued.status = JobStatus.RUNNING
+        queued.attempts = queued.max_attempts
+        queued.locked_by = "dead-worker"
+        queued.locked_at = datetime.now() - timedelta(days=1)
+        db_session.commit()
+
+        assert worker.run_once() is False
+
+        db_session.expire_all()
+        failed = db_session.get(Job, queued.id)
+        assert calls == []
+        assert failed.status == JobStatus.FAILED
+        assert failed.finished_at is not None
+        assert "Worker lost" in failed.last_error
+
+    def test_unknown_job_name_is_rejected(self, db_session):
+        with pytest.raises(KeyError):
+            enqueue(db_session, "tests.missing")
+
+    def test_periodic_job_is_scheduled_and_rescheduled(self, db_session, worker):
+        assert "tests.tick" in [definition.name for definition in periodic_jobs()]
+        worker.schedule_periodic(db_session)
+        worker.schedule_periodic(db_session)
+
+        ticks = db_session.query(Job).filter(Job.name == "tests.tick")
+        assert ticks.count() == 1
+
+        while worker.run_once():
+            pass
+
+        assert "tick" in calls
+        db_session.expire_all()
+        pending = ticks.filter(Job.status == JobStatus.QUEUED).one()
+        assert pending.run_at > datetime.now() + timedelta(minutes=9)
@@ -0,0 +1,24 @@
+from datetime import date
+
+from app.maintenance.partitions import is_partitioned, partition_bounds, partition_name
+from app.utils.dates import add_months
+
+
+class TestTransactionPartitions:
+    """Tests for the monthly partition helpers"""
+
+    def test_partition_name(self):
+        assert partition_name(date(2025, 10, 15)) == "transactions_y2025m10"
+        assert partition_name(date(2026, 1, 1)) == "transactions_y2026m01"
+
+    def test_partition_bounds_cover_whole_month(self):
+        assert partition_bounds(date(2025, 2, 14)) == (date(2025, 2, 1), date(2025, 3, 1))
+        assert partition_bounds(date(2025, 12, 31)) == (date(2025, 12, 1), date(2026, 1, 1))
+
+    def test_add_months_across_years(self):
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+    def test_schema_from_models_is_not_partitioned(self, db_session):
+        """Partitioning is applied by migration only; create_all (and SQLite) keep a plain table"""
+        assert is_partitioned(db_session.connection()) is False
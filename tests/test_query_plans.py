@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.models.budget import Budget
+from app.models.category import Category
+from app.models.transaction import Transaction, TransactionType, PaymentMethod
+from app.models.user import User
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.transaction_repository import TransactionRepository
+from app.schemas.transaction import TransactionFilters
+from app.services.transaction_service import TransactionService
+
+
+@contextmanager
+def captured_selects(db_session):
+    """Collect the SELECT statements (with driver parameters) emitted on the session's connection"""
+    statements = []
+    connection = db_session.connection()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(db_session, statement, parameters) -> str:
+    """Return the database's query plan for a captured statement as plain text"""
+    connection = db_session.connection()
+    if connection.dialect.name == "postgresql":
+        # Test tables are tiny, so forbid sequential scans to check the index is usable for the shape
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+        connection.exec_driver_sql("RESET enable_seqscan")
+        return "\n".join(row[0] for row in rows)
+
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+def assert_no_full_scan(plan: str):
+    assert "Seq Scan on transactions" not in plan
+    assert "SCAN transactions" not in plan
+
+
+def plans_for(db_session, call) -> str:
+    with captured_selects(db_session) as statements:
+        call()
+    assert statements, "no SELECT statement was captured"
+    return "\n".join(explain(db_session, statement, parameters) for statement, parameters in statements)
+
+
+@pytest.fixture
+def seeded_user(db_session):
+    user = User(email="plans@example.com", first_name="Plan", last_name="User", hashed_password="x")
+    db_session.add(user)
+    db_session.flush()
+    category = Category(user_id=user.id, name="Food")
+    db_session.add(category)
+    db_session.flush()
+    budget = Budget(
+        user_id=user.id, category_id=category.id, amount=100000,
+        start_date=date(2025, 10, 1), end_date=date(2025, 10, 31),
+    )
+    db_session.add(budget)
+    db_session.add(Transaction(
+        user_id=user.id, category_id=category.id, amount=2500, transaction_date=date(2025, 10, 15),
+        type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+    ))
+    db_session.commit()
+    return {"user_id": user.id, "category_id": category.id, "budget": budget}
+
+
+class TestTransactionQueryPlans:
+    """Verify that the hot transaction queries are answered by the composite indexes"""
+
+    def test_budget_period_spending_uses_category_index(self, db_session, seeded_user):
+        service = TransactionService(db_session)
+
+        plan = plans_for(db_session, lambda: service._get_budget_period_spending(
+            seeded_user["budget"], seeded_user["user_id"], seeded_user["category_id"]
+        ))
+
+        assert "idx_transaction_user_category_type_date" in plan
+        assert_no_full_scan(plan)
+
+    def test_monthly_summary_uses_type_date_index(self, db_session, seeded_user):
+        repository = DashboardRepository(db_session)
+
+        plan = plans_for(db_session, lambda: repository.get_monthly_summary(
+            seeded_user["user_id"], date(2025, 10, 1), date(2025, 10, 31)
+        ))
+
+        assert "idx_transaction_user_type_date" in plan
+        assert_no_full_scan(plan)
+
+    def test_top_expenses_uses_type_date_index(self, db_session, seeded_user):
+        repository = DashboardRepository(db_session)
+
+        plan = plans_for(db_session, lambda: repository.get_top_expenses(
+            seeded_user["user_id"], date(2025, 10, 1), date(2025, 10, 31)
+        ))
+
+        if db_session.connection().dialect.name == "postgresql":
+            assert "idx_transaction_user_type_date" in plan
+        else:
+            # Without table statistics SQLite may prefer the (user_id, transaction_date) range index
+            assert "idx_transaction_user_type_date" in plan or "idx_transaction_user_date" in plan
+        assert_no_full_scan(plan)
+
+    @pytest.mark.parametrize("sort_by,index_name", [
+        ("transaction_date", "idx_transaction_user_date"),
+        ("created_at", "idx_transaction_user_created"),
+        ("amount", "idx_transaction_user_amount"),
+    ])
+    def test_transaction_listing_uses_sort_index(self, db_session, seeded_user, sort_by, index_name):
+        repository = TransactionRepository(db_session)
+
+        plan = plans_for(db_session, lambda: repository.get_transaction_with_category(
+            seeded_user["user_id"], sort_by=sort_by
+        ))
+
+        assert index_name in plan
+        assert_no_full_scan(plan)
+
+    @pytest.mark.parametrize("filters,sort_by,index_names", [
+        (TransactionFilters(start_date=date(2025, 10, 1), end_date=date(2025, 10, 31)), "transaction_date",
+         ["idx_transaction_user_date"]),
+        (TransactionFilters(min_amount=1000, max_amount=5000), "amount", ["idx_transaction_user_amount"]),
+        (TransactionFilters(type=TransactionType.EXPENSE, start_date=date(2025, 10, 1)), "transaction_date",
+         ["idx_transaction_user_type_date", "idx_transaction_user_date"]),
+        (TransactionFilters(category_id=[1, 2], payment_method=[PaymentMethod.CASH]), "created_at",
+         ["idx_transaction_user_category_type_date", "idx_transaction_user_created"]),
+    ])
+    def test_filtered_transaction_listing_uses_index(self, db_session, seeded_user, filters, sort_by, index_names):
+        repository = TransactionRepository(db_session)
+
+        plan = plans_for(db_session, lambda: (
+            repository.get_transaction_with_category(seeded_user["user_id"], sort_by=sort_by, filters=filters),
+            repository.count_by_user_id(seeded_user["user_id"], filters),
+        ))
+
+        # The planner picks between the range index and the sort index, but never scans the table
+        assert any(index_name in plan for index_name in index_names)
+        assert_no_full_scan(plan)
@@ -0,0 +1,119 @@
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import MemoryBucketStore, RateLimitMiddleware, RateLimitPolicy, SQLiteBucketStore, parse_rate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBuckets:
+    """Tests for the token bucket stores"""
+
+    def test_parse_rate(self):
+        assert parse_rate("10/minute") == (10, 10 / 60)
+        assert parse_rate("") is None
+
+    def test_memory_bucket_allows_burst_then_refills(self):
+        clock = FakeClock()
+        store = MemoryBucketStore(clock=clock)
+        capacity, rate = parse_rate("3/minute")
+
+        assert [store.take("k", capacity, rate) for _ in range(3)] == [0, 0, 0]
+        assert store.take("k", capacity, rate) == 20  # one token every 20s
+        assert store.take("other", capacity, rate) == 0
+
+        clock.now += 20
+        assert store.take("k", capacity, rate) == 0
+
+    def test_memory_pruning_keeps_each_buckets_own_refill_time(self):
+        class SmallStore(MemoryBucketStore):
+            max_buckets = 4
+
+        clock = FakeClock()
+        store = SmallStore(clock=clock)
+        login, fast = parse_rate("3/minute"), parse_rate("100/second")
+        for _ in range(3):
+            store.take("login:ip:1", *login)
+
+        # Rotating keys of a fast policy push the store past max_buckets and trigger prunes
+        for ip in range(10):
+            clock.now += 1
+            store.take(f"api:ip:{ip}", *fast)
+
+        # The drained login bucket survived, while the fast buckets refilled and were dropped
+        assert store.take("login:ip:1", *login) > 0
+        assert len(store._buckets) < 10
+
+    def test_sqlite_buckets_are_shared_between_stores(self, tmp_path):
+        clock = FakeClock()
+        path = str(tmp_path / "buckets.db")
+        # Two stores on one file stand in for two gunicorn workers
+        first, second = SQLiteBucketStore(path, clock=clock), SQLiteBucketStore(path, clock=clock)
+        capacity, rate = parse_rate("2/second")
+
+        assert first.take("k", capacity, rate) == 0
+        assert second.take("k", capacity, rate) == 0
+        assert first.take("k", capacity, rate) == 0.5
+
+        clock.now += 0.5
+        assert second.take("k", capacity, rate) == 0
+
+    def test_sqlite_prunes_full_buckets(self, tmp_path):
+        clock = FakeClock()
+        store = SQLiteBucketStore(str(tmp_path / "buckets.db"), clock=clock)
+        login, fast = parse_rate("3/hour"), parse_rate("100/second")
+        for _ in range(3):
+            store.take("login:ip:1", *login)
+        for ip in range(10):
+            store.take(f"api:ip:{ip}", *fast)
+
+        # The fast buckets refill within a second; the drained login bucket needs an hour
+        clock.now += store.prune_interval
+        store.take("api:ip:new", *fast)
+
+        keys = {key for (key,) in store._connection().execute("SELECT key FROM rate_limit_buckets")}
+        assert keys == {"login:ip:1", "api:ip:new"}
+        assert store.take("login:ip:1", *login) > 0
+
+
+class TestRateLimitMiddleware:
+    """Integration tests for rate limit policies on the API"""
+
+    def test_login_is_limited_per_ip(self, client: TestClient, authenticated_user, sample_user_data):
+        credentials = {"email": sample_user_data["email"], "password": "wrong-password"}
+        statuses = [client.post("/api/v1/auth/login", json=credentials).status_code for _ in range(11)]
+
+        assert 429 not in statuses[:10]
+        assert statuses[10] == 429
+        response = client.post("/api/v1/auth/login", json=credentials)
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["status_code"] == 429
+
+    def test_user_policy_buckets_per_user(self):
+        from app.core.security import create_access_token
+
+        app_calls = []
+
+        async def app(scope, receive, send):
+            app_calls.append(scope["path"])
+
+        middleware = RateLimitMiddleware(
+            app, MemoryBucketStore(), [RateLimitPolicy("dashboard", "/api/v1/dashboard", "1/minute", per="user")]
+        )
+
+        def scope(user_id, path="/api/v1/dashboard/"):
+            token = create_access_token(user_id=user_id, email=f"{user_id}@example.com")
+            headers = [(b"authorization", f"Bearer {token}".encode())]
+            return {"type": "http", "method": "GET", "path": path, "headers": headers, "client": ("10.0.0.1", 1)}
+
+        assert middleware.check(scope(1)) == 0
+        assert middleware.check(scope(1)) > 0
+        # Same IP, different user
+        assert middleware.check(scope(2)) == 0
+        # Paths outside every policy are never limited
+        assert middleware.check(scope(1, "/")) == 0
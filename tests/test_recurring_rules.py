@@ -0,0 +1,142 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.constants.messages import CategoryMessages, RecurringRuleMessages
+from app.models.recurring_rule import RecurrenceFrequency, RecurringRule
+from app.models.transaction import Transaction
+from app.services.recurring_service import RecurringRuleService, due_occurrences, first_occurrence
+
+
+def _rule(category_id: int, **overrides) -> dict:
+    rule = {
+        "category_id": category_id,
+        "amount": 150000,
+        "type": "income",
+        "payment_method": "bank_transfer",
+        "description": "Salary",
+        "frequency": "monthly",
+        "start_date": "2025-01-31",
+    }
+    rule.update(overrides)
+    return rule
+
+
+def _transaction_dates(db_session, user_id: int):
+    rows = db_session.query(Transaction.transaction_date).filter(Transaction.user_id == user_id)
+    return sorted(row.transaction_date for row in rows)
+
+
+class TestRecurrence:
+    """Unit tests for occurrence dates"""
+
+    def test_monthly_rule_keeps_day_of_month_through_short_months(self):
+        rule = RecurringRule(
+            frequency=RecurrenceFrequency.MONTHLY, interval=1, day_of_month=31,
+            start_date=date(2025, 1, 31), next_run_date=date(2025, 1, 31),
+        )
+
+        dates, next_run_date = due_occurrences(rule, date(2025, 4, 30))
+
+        assert dates == [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+        assert next_run_date == date(2025, 5, 31)
+
+    def test_first_monthly_occurrence_on_or_after_start(self):
+        assert first_occurrence(RecurrenceFrequency.MONTHLY, date(2025, 3, 10), 5) == date(2025, 4, 5)
+        assert first_occurrence(RecurrenceFrequency.MONTHLY, date(2025, 3, 10), 15) == date(2025, 3, 15)
+
+    def test_weekly_rule_stops_at_end_date(self):
+        rule = RecurringRule(
+            frequency=RecurrenceFrequency.WEEKLY, interval=2, start_date=date(2025, 1, 6),
+            end_date=date(2025, 2, 10), next_run_date=date(2025, 1, 6),
+        )
+
+        dates, _ = due_occurrences(rule, date(2025, 12, 31))
+
+        assert dates == [date(2025, 1, 6), date(2025, 1, 20), date(2025, 2, 3)]
+
+
+class TestRecurringRules:
+    """Integration tests for recurring rules and their materialization"""
+
+    def test_create_and_list_rule(self, client: TestClient, authenticated_user, created_category):
+        headers = authenticated_user["headers"]
+
+        response = client.post("/api/v1/recurring-rules/", json=_rule(created_category["id"]), headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["message"] == RecurringRuleMessages.CREATED_SUCCESS.value
+        assert data["data"]["day_of_month"] == 31
+        assert data["data"]["next_run_date"] == "2025-01-31"
+        listing = client.get("/api/v1/recurring-rules/", headers=headers).json()
+        assert [rule["id"] for rule in listing["data"]] == [data["data"]["id"]]
+
+    def test_create_rule_rejects_day_of_month_for_weekly_rules(self, client: TestClient, authenticated_user, created_category):
+        response = client.post(
+            "/api/v1/recurring-rules/",
+            json=_rule(created_category["id"], frequency="weekly", day_of_month=3),
+            headers=authenticated_user["headers"],
+        )
+
+        assert response.status_code == 422
+
+    def test_materialize_is_idempotent_across_runs(self, client: TestClient, db_session, authenticated_user, created_category):
+        client.post("/api/v1/recurring-rules/", json=_rule(created_category["id"]), headers=authenticated_user["headers"])
+        service = RecurringRuleService(db_session)
+
+        assert service.materialize_due(date(2025, 3, 31)) == (3, 0)
+        # An interrupted run may leave the rule behind its occurrences; nothing is created twice
+        rule = db_session.query(RecurringRule).one()
+        rule.next_run_date = date(2025, 1, 31)
+        db_session.commit()
+        assert service.materialize_due(date(2025, 4, 30)) == (1, 0)
+
+        assert _transaction_dates(db_session, authenticated_user["user_id"]) == [
+            date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)
+        ]
+        assert db_session.query(RecurringRule).one().next_run_date == date(2025, 5, 31)
+
+    def test_materialize_applies_budget_checks_to_expenses(
+            self, client: TestClient, db_session, authenticated_user, created_budget
+    ):
+        # The budget allows 50000; two occurrences of 20000 fit, the third would overspend
+        start = date.fromisoformat(created_budget["start_date"])
+        client.post("/api/v1/recurring-rules/", json=_rule(
+            created_budget["category_id"], type="expense", amount=20000, frequency="daily",
+            start_date=start.isoformat(), end_date=(start + timedelta(days=4)).isoformat(),
+        ), headers=authenticated_user["headers"])
+
+        created, rejected = RecurringRuleService(db_session).materialize_due(start + timedelta(days=10))
+
+        assert (created, rejected) == (2, 3)
+        assert _transaction_dates(db_session, authenticated_user["user_id"]) == [start, start + timedelta(days=1)]
+        assert db_session.query(RecurringRule).one().active is False
+        # Rejections are recorded on the rule rather than lost
+        rule = client.get("/api/v1/recurring-rules/", headers=authenticated_user["headers"]).json()["data"][0]
+        assert rule["rejected_count"] == 3
+        assert rule["last_rejected_date"] == (start + timedelta(days=4)).isoformat()
+
+    def test_delete_rule_keeps_created_transactions(self, client: TestClient, db_session, authenticated_user, created_category):
+        headers = authenticated_user["headers"]
+        rule_id = client.post("/api/v1/recurring-rules/", json=_rule(created_category["id"]), headers=headers).json()["data"]["id"]
+        RecurringRuleService(db_session).materialize_due(date(2025, 2, 28))
+
+        response = client.delete(f"/api/v1/recurring-rules/{rule_id}", headers=headers)
+
+        assert response.status_code == 204
+        assert client.delete(f"/api/v1/recurring-rules/{rule_id}", headers=headers).status_code == 404
+        transactions = db_session.query(Transaction).filter(Transaction.user_id == authenticated_user["user_id"]).all()
+        assert len(transactions) == 2
+        assert all(transaction.recurring_rule_id is None for transaction in transactions)
+
+    def test_category_used_by_a_rule_cannot_be_deleted(self, client: TestClient, authenticated_user, created_category):
+        headers = authenticated_user["headers"]
+        rule_id = client.post("/api/v1/recurring-rules/", json=_rule(created_category["id"]), headers=headers).json()["data"]["id"]
+
+        response = client.delete(f"/api/v1/categories/{created_category['id']}", headers=headers)
+
+        assert response.status_code == 409
+        assert response.json()["message"] == CategoryMessages.CANNOT_DELETE_HAS_RECURRING_RULES.value
+        client.delete(f"/api/v1/recurring-rules/{rule_id}", headers=headers)
+        assert client.delete(f"/api/v1/categories/{created_category['id']}", headers=headers).status_code == 204
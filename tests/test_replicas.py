@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.config.database import (
+    DatabaseRouter, RecentWrites, ReplicaSet, RoutingSession, bind_user, get_db
+)
+from app.models import Base, User
+
+
+def _database(path, first_name):
+    """SQLite file database holding a single user whose first name tells the databases apart"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(User(id=1, email="replica@example.com", first_name=first_name, last_name="User", hashed_password="x"))
+        db.commit()
+    return engine
+
+
+@pytest.fixture
+def databases(tmp_path):
+    engines = {
+        "primary": _database(tmp_path / "primary.db", "primary"),
+        "replica1": _database(tmp_path / "replica1.db", "replica1"),
+        "replica2": _database(tmp_path / "replica2.db", "replica2"),
+    }
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _session_factory(primary, replicas, window=60):
+    router = DatabaseRouter(primary, ReplicaSet(replicas, check_interval=60), RecentWrites(window))
+    return sessionmaker(class_=RoutingSession, autoflush=False, bind=primary, router=router)
+
+
+def _served_by(factory, read_only=True, user_id=None):
+    with factory() as db:
+        db.info["read_only"] = read_only
+        if user_id is not None:
+            bind_user(db, user_id)
+        return db.get(User, 1).first_name
+
+
+class TestReplicaRouting:
+    """Tests for sending read-only sessions to replicas"""
+
+    def test_read_only_session_uses_replica(self, databases):
+        factory = _session_factory(databases["primary"], [databases["replica1"]])
+        assert _served_by(factory, read_only=True) == "replica1"
+        assert _served_by(factory, read_only=False) == "primary"
+
+    def test_replicas_are_used_round_robin(self, databases):
+        factory = _session_factory(databases["primary"], [databases["replica1"], databases["replica2"]])
+        served = [_served_by(factory) for _ in range(4)]
+        assert served == ["replica1", "replica2", "replica1", "replica2"]
+
+    def test_unhealthy_replica_is_skipped(self, databases, tmp_path):
+        broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        factory = _session_factory(databases["primary"], [broken, databases["replica1"]])
+        assert [_served_by(factory) for _ in range(3)] == ["replica1"] * 3
+
+    def test_falls_back_to_primary_without_healthy_replicas(self, databases, tmp_path):
+        broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        factory = _session_factory(databases["primary"], [broken])
+        assert _served_by(factory) == "primary"
+
+    def test_reads_stay_on_primary_after_a_write(self, databases):
+        factory = _session_factory(databases["primary"], [databases["replica1"]])
+        _served_by(factory, read_only=False, user_id=7)
+
+        assert _served_by(factory, read_only=True, user_id=7) == "primary"
+        assert _served_by(factory, read_only=True, user_id=8) == "replica1"
+
+    def test_read_your_writes_window_expires(self, databases):
+        factory = _session_factory(databases["primary"], [databases["replica1"]], window=0.01)
+        _served_by(factory, read_only=False, user_id=7)
+
+        recent_writes = factory.kw["router"].recent_writes
+        recent_writes._written_at[7] -= 1
+        assert _served_by(factory, read_only=True, user_id=7) == "replica1"
+
+    def test_flush_in_read_only_session_goes_to_primary(self, databases):
+        factory = _session_factory(databases["primary"], [databases["replica1"]])
+        with factory() as db:
+            db.info["read_only"] = True
+            db.add(User(email="new@example.com", first_name="New", last_name="User", hashed_password="x"))
+            db.commit()
+
+        with sessionmaker(bind=databases["primary"])() as db:
+            assert db.query(User).filter(User.email == "new@example.com").count() == 1
+
+    @pytest.mark.parametrize("method, read_only", [("GET", True), ("HEAD", True), ("POST", False), ("DELETE", False)])
+    def test_get_db_marks_safe_methods_read_only(self, method, read_only):
+        request = Request({"type": "http", "method": method, "headers": []})
+        dependency = get_db(request)
+        db = next(dependency)
+        try:
+            assert db.info["read_only"] is read_only
+        finally:
+            dependency.close()
@@ -0,0 +1,39 @@
+from app.config import database
+from app.config.settings import settings
+from app.server import Server, Worker, available_cpus, gunicorn_options, worker_count
+
+
+class TestServer:
+    """Tests for the gunicorn runner configuration"""
+
+    def test_worker_count_defaults_to_available_cpus(self):
+        assert worker_count(0) == available_cpus()
+        assert worker_count(3) == 3
+
+    def test_options_come_from_settings(self):
+        app_settings = settings.model_copy(update={"server_workers": 2, "server_max_requests": 500, "server_preload": False})
+        options = gunicorn_options(app_settings)
+
+        assert options["workers"] == 2
+        assert options["max_requests"] == 500
+        assert options["preload_app"] is False
+
+        server = Server(options)
+        assert server.cfg.worker_class is Worker
+        assert server.cfg.max_requests_jitter == settings.server_max_requests_jitter
+        assert server.cfg.graceful_timeout == settings.server_graceful_timeout
+
+    def test_post_fork_drops_inherited_engines(self):
+        inherited = database.init_database()
+        gunicorn_options(settings)["post_fork"](None, None)
+
+        assert database.get_database() is not inherited
+
+    def test_post_fork_leaves_inherited_connections_open(self, monkeypatch):
+        inherited = database.init_database()
+        disposed = []
+        monkeypatch.setattr(type(inherited.engine), "dispose", lambda engine, close=True: disposed.append(close))
+
+        gunicorn_options(settings)["post_fork"](None, None)
+
+        assert disposed and not any(disposed)
@@ -0,0 +1,206 @@
+from datetime import date
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config.database import SAFE_METHODS, DatabaseRouter, RecentWrites, ReplicaSet, RoutingSession, get_db
+from app.config.sharding import ShardMap, create_shard_schema, parse_shard_urls
+from app.main import app
+from app.maintenance.shards import rebalance
+from app.repositories.user_repository import UserRepository
+from app.models import (
+    ArchivedTransaction, Base, Budget, Category, PaymentMethod, RecurrenceFrequency, RecurringRule, Transaction,
+    TransactionType, User,
+)
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    """A primary database plus two shard databases, all SQLite files"""
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    Base.metadata.create_all(bind=primary)
+    shards = {name: create_engine(f"sqlite:///{tmp_path / f'{name}.db'}") for name in ("shard_a", "shard_b")}
+    for engine in shards.values():
+        create_shard_schema(engine)
+
+    router = DatabaseRouter(primary, ReplicaSet([], check_interval=60), RecentWrites(0), shards)
+    yield router
+    for engine in [primary, *shards.values()]:
+        engine.dispose()
+
+
+def _count(engine, model, user_id):
+    with Session(engine) as db:
+        return db.query(model).filter(model.user_id == user_id).count()
+
+
+class TestShardMap:
+    """Tests for consistent hashing of user ids onto shards"""
+
+    def test_placement_is_stable_and_spread(self):
+        shard_map = ShardMap(["a", "b", "c"])
+        placements = [shard_map.shard_for(user_id) for user_id in range(3000)]
+
+        assert placements == [ShardMap(["c", "b", "a"]).shard_for(user_id) for user_id in range(3000)]
+        for name in ("a", "b", "c"):
+            assert 600 < placements.count(name) < 1400
+
+    def test_adding_a_shard_only_moves_users_to_it(self):
+        before = ShardMap(["a", "b", "c"])
+        after = ShardMap(["a", "b", "c", "d"])
+
+        moved = [user_id for user_id in range(3000) if before.shard_for(user_id) != after.shard_for(user_id)]
+
+        assert all(after.shard_for(user_id) == "d" for user_id in moved)
+        assert len(moved) < 1200
+
+    def test_parse_shard_urls(self):
+        assert parse_shard_urls("a=sqlite:///a.db, b=sqlite:///b.db") == {"a": "sqlite:///a.db", "b": "sqlite:///b.db"}
+        assert parse_shard_urls("") == {}
+        with pytest.raises(ValueError):
+            parse_shard_urls("sqlite:///a.db")
+
+
+class TestShardRouting:
+    """Tests for routing user-scoped tables to the user's shard"""
+
+    def test_api_writes_land_on_the_users_shard(self, sharded, sample_user_data, sample_category_data):
+        factory = sessionmaker(class_=RoutingSession, autoflush=False, bind=sharded.primary, router=sharded)
+
+        def override_get_db(request: Request):
+            db = factory()
+            db.info["read_only"] = request.method in SAFE_METHODS
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            with TestClient(app) as client:
+                user_id = client.post("/api/v1/auth/register", json=sample_user_data).json()["data"]["id"]
+                login = {"email": sample_user_data["email"], "password": sample_user_data["password"]}
+                token = client.post("/api/v1/auth/login", json=login).json()["data"]["access_token"]
+                headers = {"Authorization": f"Bearer {token}"}
+
+                category = client.post("/api/v1/categories/", json=sample_category_data, headers=headers).json()["data"]
+                transaction = {
+                    "amount": 1000,
+                    "category_id": category["id"],
+                    "transaction_date": date.today().isoformat(),
+                    "type": "income",
+                    "payment_method": "cash",
+                }
+                assert client.post("/api/v1/transactions/", json=transaction, headers=headers).status_code == 201
+                listing = client.get("/api/v1/transactions/", headers=headers).json()
+        finally:
+            app.dependency_overrides.clear()
+
+        home = sharded.shard_map.shard_for(user_id)
+        other = next(name for name in sharded.shards if name != home)
+        with Session(sharded.primary) as db:
+            assert db.get(User, user_id) is not None
+        assert _count(sharded.shards[home], Category, user_id) == 1
+        assert _count(sharded.shards[home], Transaction, user_id) == 1
+        assert _count(sharded.shards[other], Transaction, user_id) == 0
+        assert _count(sharded.primary, Transaction, user_id) == 0
+        assert listing["total"] == 1
+
+    def test_rebalance_moves_misplaced_users(self, sharded):
+        user_id = 42
+        home = sharded.shard_map.shard_for(user_id)
+        wrong = next(name for name in sharded.shards if name != home)
+        with Session(sharded.shards[wrong]) as db:
+            category = Category(user_id=user_id, name="Food")
+            db.add(category)
+            db.flush()
+            db.add(Budget(
+                user_id=user_id, category_id=category.id, amount=500,
+                start_date=date(2026, 1, 1), end_date=date(2026, 1, 31),
+            ))
+            for day in (1, 2):
+                db.add(Transaction(
+                    user_id=user_id, category_id=category.id, amount=100, transaction_date=date(2026, 1, day),
+                    type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+                ))
+            db.add(ArchivedTransaction(
+                id=999, user_id=user_id, category_id=category.id, amount=100, transaction_date=date(2020, 1, 1),
+                type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+            ))
+            db.commit()
+
+        assert rebalance(sharded.primary, sharded.shards, dry_run=True) == [(user_id, wrong, home)]
+        assert _count(sharded.shards[wrong], Transaction, user_id) == 2
+
+        assert rebalance(sharded.primary, sharded.shards) == [(user_id, wrong, home)]
+
+        for model in (Category, Budget, Transaction, ArchivedTransaction):
+            assert _count(sharded.shards[wrong], model, user_id) == 0
+        with Session(sharded.shards[home]) as db:
+            category = db.query(Category).filter(Category.user_id == user_id).one()
+            assert db.query(Budget).filter(Budget.category_id == category.id).count() == 1
+            assert db.query(Transaction).filter(Transaction.category_id == category.id).count() == 3
+        assert rebalance(sharded.primary, sharded.shards) == []
+
+    def test_rebalance_moves_recurring_rules_with_their_occurrences(self, sharded):
+        user_id = 42
+        home = sharded.shard_map.shard_for(user_id)
+        wrong = next(name for name in sharded.shards if name != home)
+        with Session(sharded.shards[wrong]) as db:
+            # Padding so source ids differ from the ids the rows get on the target shard
+            db.add_all([Category(user_id=7, name="Other"), RecurringRule(
+                user_id=7, category_id=1, amount=1, type=TransactionType.EXPENSE, payment_method=PaymentMethod.CASH,
+                frequency=RecurrenceFrequency.DAILY, start_date=date(2026, 1, 1), next_run_date=date(2026, 1, 1),
+            )])
+            db.flush()
+            category = Category(user_id=user_id, name="Rent")
+            db.add(category)
+            db.flush()
+            rule = RecurringRule(
+                user_id=user_id, category_id=category.id, amount=1000, type=TransactionType.EXPENSE,
+                payment_method=PaymentMethod.BANK_TRANSFER, frequency=RecurrenceFrequency.MONTHLY, day_of_month=1,
+                start_date=date(2026, 1, 1), next_run_date=date(2026, 3, 1),
+            )
+            db.add(rule)
+            db.flush()
+            for month in (1, 2):
+                db.add(Transaction(
+                    user_id=user_id, category_id=category.id, amount=1000, transaction_date=date(2026, month, 1),
+                    type=TransactionType.EXPENSE, payment_method=PaymentMethod.BANK_TRANSFER, recurring_rule_id=rule.id,
+                ))
+            db.commit()
+
+        assert rebalance(sharded.primary, sharded.shards) == [(user_id, wrong, home)]
+
+        for model in (Category, RecurringRule, Transaction):
+            assert _count(sharded.shards[wrong], model, user_id) == 0
+        with Session(sharded.shards[home]) as db:
+            category = db.query(Category).filter(Category.user_id == user_id).one()
+            rule = db.query(RecurringRule).filter(RecurringRule.user_id == user_id).one()
+            assert rule.category_id == category.id
+            assert rule.next_run_date == date(2026, 3, 1)
+            occurrences = db.query(Transaction).filter(Transaction.user_id == user_id).all()
+            assert [transaction.recurring_rule_id for transaction in occurrences] == [rule.id, rule.id]
+
+    def test_rebalance_invalidates_etags_of_moved_users(self, sharded):
+        user_id = 42
+        home = sharded.shard_map.shard_for(user_id)
+        wrong = next(name for name in sharded.shards if name != home)
+        with Session(sharded.primary) as db:
+            db.add(User(id=user_id, email="moved@example.com", first_name="Moved", last_name="User", hashed_password="x"))
+            db.commit()
+            before = UserRepository(db).get_data_version(user_id)
+        with Session(sharded.shards[wrong]) as db:
+            db.add(Category(user_id=user_id, name="Food"))
+            db.commit()
+
+        rebalance(sharded.primary, sharded.shards)
+
+        # The ETag of every conditional GET is derived from the data version
+        with Session(sharded.primary) as db:
+            version, updated_at = UserRepository(db).get_data_version(user_id)
+        assert version == before[0] + 1
+        assert updated_at is not None
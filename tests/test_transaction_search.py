@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.category import Category
+from app.models.transaction import PaymentMethod, Transaction, TransactionType
+
+
+@pytest.fixture
+def searchable(db_session, authenticated_user):
+    user_id = authenticated_user["user_id"]
+    food, travel = Category(user_id=user_id, name="Food"), Category(user_id=user_id, name="Travel")
+    db_session.add_all([food, travel])
+    db_session.flush()
+
+    today = date.today()
+    rows = [
+        (food, 2500, 0, "Lunch at Café Rouge"),
+        (food, 1200, 1, "Lunch with team"),
+        (food, 800, 2, "Coffee beans"),
+        (travel, 9000, 3, "Train tickets to Lyon"),
+        (food, 4000, 4, "Team lunch restaurant"),
+        (travel, 300, 5, None),
+    ]
+    transactions = [
+        Transaction(
+            user_id=user_id,
+            category_id=category.id,
+            amount=amount,
+            transaction_date=today - timedelta(days=days_ago),
+            type=TransactionType.EXPENSE,
+            payment_method=PaymentMethod.CREDIT_CARD,
+            description=description,
+        )
+        for category, amount, days_ago, description in rows
+    ]
+    db_session.add_all(transactions)
+    db_session.commit()
+    return {"food": food.id, "travel": travel.id, "ids": [transaction.id for transaction in transactions]}
+
+
+def _search(client, headers, **params):
+    response = client.get("/api/v1/transactions/search", params=params, headers=headers)
+    assert response.status_code == 200, response.json()
+    return response.json()
+
+
+class TestTransactionSearch:
+    """Integration tests for GET /api/v1/transactions/search"""
+
+    def test_prefix_terms_all_match_newest_first(self, client: TestClient, authenticated_user, searchable):
+        result = _search(client, authenticated_user["headers"], q="lunch tea")
+
+        assert [item["description"] for item in result["data"]] == ["Lunch with team", "Team lunch restaurant"]
+        assert result["next_cursor"] is None
+
+    def test_accents_and_case_are_ignored(self, client: TestClient, authenticated_user, searchable):
+        result = _search(client, authenticated_user["headers"], q="CAFE")
+        assert [item["description"] for item in result["data"]] == ["Lunch at Café Rouge"]
+
+    def test_filters_combine_with_search(self, client: TestClient, authenticated_user, searchable):
+        headers = authenticated_user["headers"]
+
+        assert len(_search(client, headers, q="lunch", min_amount=2000)["data"]) == 2
+        assert _search(client, headers, q="lunch", category_id=searchable["travel"])["data"] == []
+        recent = _search(client, headers, q="lunch", start_date=(date.today() - timedelta(days=1)).isoformat())
+        assert len(recent["data"]) == 2
+
+    def test_keyset_pagination(self, client: TestClient, authenticated_user, searchable):
+        headers = authenticated_user["headers"]
+
+        first = _search(client, headers, q="lunch", limit=2)
+        second = _search(client, headers, q="lunch", limit=2, cursor=first["next_cursor"])
+
+        assert [item["id"] for item in first["data"]] == searchable["ids"][:2]
+        assert [item["id"] for item in second["data"]] == [searchable["ids"][4]]
+        assert second["next_cursor"] is None
+
+    def test_updates_and_deletes_are_reflected(self, client: TestClient, db_session, authenticated_user, searchable):
+        headers = authenticated_user["headers"]
+        coffee = db_session.get(Transaction, searchable["ids"][2])
+        coffee.description = "Espresso beans"
+        db_session.delete(db_session.get(Transaction, searchable["ids"][3]))
+        db_session.commit()
+
+        assert _search(client, headers, q="coffee")["data"] == []
+        assert len(_search(client, headers, q="espresso")["data"]) == 1
+        assert _search(client, headers, q="train")["data"] == []
+
+    def test_invalid_query_and_cursor(self, client: TestClient, authenticated_user):
+        headers = authenticated_user["headers"]
+
+        punctuation = client.get("/api/v1/transactions/search", params={"q": "!!"}, headers=headers)
+        bad_cursor = client.get("/api/v1/transactions/search", params={"q": "lunch", "cursor": "nope"}, headers=headers)
+
+        assert punctuation.status_code == 400
+        assert bad_cursor.status_code == 400
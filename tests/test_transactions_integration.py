@@ -204,6 +204,55 @@ class TestTransactionEndpoints:
         assert data["page"] == 1
         assert data["per_page"] == 20
 
+    def test_get_transactions_filtered_and_sorted_by_amount(self, client: TestClient, authenticated_user, created_category):
+        """Test listing filters narrow both the page and the total, and amount sorting"""
+        headers = authenticated_user["headers"]
+        for amount, day, method in ((3000, "2025-09-10", "cash"), (9000, "2025-09-20", "credit_card"),
+                                    (1000, "2025-09-25", "cash"), (7000, "2025-10-05", "cash")):
+            response = client.post("/api/v1/transactions/", json={
+                "amount": amount,
+                "category_id": created_category["id"],
+                "transaction_date": day,
+                "type": "income",
+                "payment_method": method,
+            }, headers=headers)
+            assert response.status_code == 201
+
+        response = client.get("/api/v1/transactions/", params={
+            "start_date": "2025-09-01",
+            "end_date": "2025-09-30",
+            "category_id": [created_category["id"]],
+            "type": "income",
+            "payment_method": ["cash", "credit_card"],
+            "min_amount": 2000,
+            "sort_by": "amount",
+            "sort_order": "asc",
+        }, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [transaction["amount"] for transaction in data["data"]] == [3000, 9000]
+        assert data["total"] == 2
+
+        response = client.get("/api/v1/transactions/", params={"payment_method": "cash", "sort_by": "amount"}, headers=headers)
+        assert [transaction["amount"] for transaction in response.json()["data"]] == [7000, 3000, 1000]
+
+    def test_get_transactions_invalid_listing_parameters(self, client: TestClient, authenticated_user):
+        """Test unknown sort keys and inverted ranges are rejected"""
+        headers = authenticated_user["headers"]
+
+        response = client.get("/api/v1/transactions/", params={"sort_by": "description"}, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["message"] == TransactionMessages.INVALID_SORT_FIELD.value
+
+        response = client.get("/api/v1/transactions/", params={"min_amount": 500, "max_amount": 100}, headers=headers)
+        assert response.status_code == 422
+
+        response = client.get(
+            "/api/v1/transactions/", params={"start_date": "2025-10-01", "end_date": "2025-09-01"}, headers=headers
+        )
+        assert response.status_code == 422
+
     def test_update_transaction_success(self, client: TestClient, authenticated_user, created_category):
         """Test successful transaction update"""
         # Create initial transaction
@@ -1,6 +1,12 @@
+from datetime import date
+
 from fastapi.testclient import TestClient
 
+from app.config.settings import settings
 from app.constants.messages import UserMessages
+from app.jobs.worker import Worker
+from app.models import Budget, Category, Job, PaymentMethod, Transaction, TransactionType, User
+from tests.conftest import TestingSessionLocal
 
 
 class TestUserEndpoints:
@@ -69,6 +75,16 @@ class TestUserEndpoints:
         assert user_data["first_name"] == update_data["first_name"]
         # last_name should remain unchanged
 
+    def test_update_user_rollover_settings_reject_null(self, client: TestClient, authenticated_user):
+        """Test that rollover settings may be omitted but not set to null"""
+        for field in ("budget_rollover_enabled", "budget_rollover_carry_over"):
+            response = client.put("/api/v1/users/", json={field: None}, headers=authenticated_user["headers"])
+            assert response.status_code == 422
+
+        response = client.put("/api/v1/users/", json={"first_name": "Still"}, headers=authenticated_user["headers"])
+        assert response.status_code == 200
+        assert response.json()["data"]["budget_rollover_enabled"] is False
+
     def test_update_user_profile_unauthorized(self, client: TestClient):
         """Test updating user profile without authentication"""
         update_data = {
@@ -237,3 +253,58 @@ class TestUserEndpoints:
         # The endpoint should either ignore email field or return validation error
         # Based on your UserUpdate schema, email updates might not be supported
         assert response.status_code in [200, 422]  # Either ignored or validation error
+
+    def test_delete_user_removes_owned_data(self, client: TestClient, db_session, authenticated_user, created_budget, sample_transaction_data):
+        """Test that account deletion removes categories, budgets and transactions set-based"""
+        transaction_data = sample_transaction_data.copy()
+        transaction_data["category_id"] = created_budget["category_id"]
+        transaction_data["type"] = "income"
+        transaction_data["transaction_date"] = created_budget["start_date"]
+        response = client.post("/api/v1/transactions/", json=transaction_data, headers=authenticated_user["headers"])
+        assert response.status_code == 201
+
+        response = client.delete("/api/v1/users/", headers=authenticated_user["headers"])
+        assert response.status_code == 204
+
+        user_id = authenticated_user["user_id"]
+        db_session.expire_all()
+        assert db_session.get(User, user_id) is None
+        for model in (Category, Budget, Transaction):
+            assert db_session.query(model).filter(model.user_id == user_id).count() == 0
+
+    def test_delete_large_user_runs_in_background(self, client: TestClient, db_connection, db_session, authenticated_user, created_category, sample_user_data, monkeypatch):
+        """Test that large accounts are hidden immediately and deleted by the job worker"""
+        monkeypatch.setattr(settings, "user_delete_inline_limit", 0)
+        monkeypatch.setattr(settings, "user_delete_batch_size", 2)
+        user_id = authenticated_user["user_id"]
+        db_session.add_all([
+            Transaction(
+                user_id=user_id,
+                category_id=created_category["id"],
+                amount=100 + i,
+                transaction_date=date.today(),
+                type=TransactionType.INCOME,
+                payment_method=PaymentMethod.CASH,
+            )
+            for i in range(5)
+        ])
+        db_session.commit()
+
+        response = client.delete("/api/v1/users/", headers=authenticated_user["headers"])
+        assert response.status_code == 204
+
+        # Gone for the API right away, data still present until the job runs
+        login_data = {"email": sample_user_data["email"], "password": sample_user_data["password"]}
+        assert client.post("/api/v1/auth/login", json=login_data).status_code == 404
+        assert client.get("/api/v1/users/", headers=authenticated_user["headers"]).status_code == 404
+        assert db_session.query(Transaction).filter(Transaction.user_id == user_id).count() == 5
+        assert db_session.query(Job).filter(Job.name == "users.delete").count() == 1
+
+        worker = Worker(lambda: TestingSessionLocal(bind=db_connection), poll_interval=0)
+        while worker.run_once():
+            pass
+
+        db_session.expire_all()
+        assert db_session.get(User, user_id) is None
+        assert db_session.query(Transaction).filter(Transaction.user_id == user_id).count() == 0
+        assert db_session.query(Category).filter(Category.user_id == user_id).count() == 0